@@ -0,0 +1,78 @@
+"""
+연결 풀을 사용하는 PostgreSQL 백엔드
+
+DATABASES 설정 예시:
+    'default': {
+        'ENGINE': 'programmers_exam_reservation.db_backends.postgresql_pool',
+        ...
+        'POOL': {
+            'MIN_SIZE': 2,
+            'MAX_SIZE': 20,
+            'TIMEOUT': 5,      # 연결 대기 제한 시간(초)
+            'MAX_IDLE': 300,   # 유휴 연결 유지 시간(초)
+        },
+    }
+
+Django 가 요청 종료 시 연결을 닫으면 실제로 닫지 않고 풀에 반납한다.
+"""
+from django.db.backends.postgresql import base as postgresql_base
+
+from programmers_exam_reservation.db_backends.postgresql_pool.pool import ConnectionPool, get_pool
+
+DEFAULT_POOL_OPTIONS = {
+    'MIN_SIZE': 1,
+    'MAX_SIZE': 10,
+    'TIMEOUT': 5.0,
+    'MAX_IDLE': 300.0,
+}
+
+
+def _is_usable(connection):
+    # 빌려주기 전 연결 상태 확인
+    if connection.closed:
+        return False
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        # autocommit 이 꺼진 연결은 확인 조회로 시작된 트랜잭션을 종료해 트랜잭션 밖의 상태로 빌려줌
+        if not connection.autocommit:
+            connection.rollback()
+    except postgresql_base.Database.Error:
+        return False
+    return True
+
+
+def _reset(connection):
+    # 진행 중이거나 실패한 트랜잭션이 남아 있으면 롤백한 뒤 반납
+    if connection.closed:
+        raise postgresql_base.Database.InterfaceError('connection already closed')
+    if connection.info.transaction_status != postgresql_base.Database.extensions.TRANSACTION_STATUS_IDLE:
+        connection.rollback()
+
+
+class DatabaseWrapper(postgresql_base.DatabaseWrapper):
+    def _get_pool(self, conn_params):
+        options = {**DEFAULT_POOL_OPTIONS, **self.settings_dict.get('POOL', {})}
+
+        def factory():
+            return ConnectionPool(
+                alias=self.alias,
+                connect=lambda: super(DatabaseWrapper, self).get_new_connection(conn_params),
+                is_usable=_is_usable,
+                reset=_reset,
+                min_size=options['MIN_SIZE'],
+                max_size=options['MAX_SIZE'],
+                timeout=options['TIMEOUT'],
+                max_idle=options['MAX_IDLE'],
+            )
+
+        return get_pool(self.alias, factory)
+
+    def get_new_connection(self, conn_params):
+        self._pool = self._get_pool(conn_params)
+        return self._pool.getconn()
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self._pool.putconn(self.connection)
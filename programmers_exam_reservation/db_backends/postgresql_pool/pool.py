@@ -0,0 +1,189 @@
+"""
+워커 프로세스별 데이터베이스 연결 풀
+
+요청마다 연결을 새로 맺지 않고 풀에서 빌려 쓰고 반납한다.
+- 최소/최대 연결 수 (MIN_SIZE / MAX_SIZE)
+- 연결 대기 제한 시간 (TIMEOUT)
+- 빌려줄 때 연결 상태 확인
+- 일정 시간(MAX_IDLE) 이상 사용하지 않은 연결 정리 (MIN_SIZE 까지)
+"""
+import os
+import threading
+import time
+from collections import deque
+
+from programmers_exam_reservation.utils.metrics import Gauge, Histogram
+
+POOL_IN_USE = Gauge('db_pool_connections_in_use', '사용 중인 연결 수', labelnames=('alias',))
+POOL_IDLE = Gauge('db_pool_connections_idle', '대기 중인 유휴 연결 수', labelnames=('alias',))
+POOL_WAITING = Gauge('db_pool_waiting', '연결을 기다리는 요청 수', labelnames=('alias',))
+POOL_CHECKOUT_LATENCY = Histogram(
+    'db_pool_checkout_seconds',
+    '연결을 빌리는 데 걸린 시간(초)',
+    labelnames=('alias',),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, alias, connect, is_usable, reset, min_size=1, max_size=10, timeout=5.0, max_idle=300.0):
+        """
+        Args:
+            alias: 데이터베이스 alias (메트릭 label)
+            connect: 새 연결을 만드는 함수
+            is_usable: 연결 사용 가능 여부를 확인하는 함수
+            reset: 반납된 연결을 초기 상태로 되돌리는 함수 (실패 시 예외)
+        """
+        self.alias = alias
+        self._connect = connect
+        self._is_usable = is_usable
+        self._reset = reset
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+
+        self._idle = deque()  # (connection, returned_at)
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._cond = threading.Condition()
+
+    def stats(self):
+        with self._cond:
+            return {
+                'size': self._size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'waiting': self._waiting,
+            }
+
+    def getconn(self):
+        """
+        연결 빌리기
+
+        Raises:
+            PoolTimeout: TIMEOUT 안에 연결을 얻지 못한 경우
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+
+        while True:
+            connection = self._checkout(deadline)
+            if connection is None:
+                try:
+                    connection = self._connect()
+                except Exception:
+                    self._discard(None)
+                    raise
+            elif not self._is_usable(connection):
+                self._discard(connection)
+                continue
+
+            with self._cond:
+                self._in_use += 1
+                self._update_gauges()
+            POOL_CHECKOUT_LATENCY.labels(alias=self.alias).observe(time.monotonic() - started)
+            return connection
+
+    def putconn(self, connection):
+        """연결 반납. 초기화에 실패한 연결은 닫는다."""
+        try:
+            self._reset(connection)
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+            self._discard(connection)
+            return
+
+        with self._cond:
+            self._in_use -= 1
+            self._idle.append((connection, time.monotonic()))
+            self._reap_idle()
+            self._update_gauges()
+            self._cond.notify()
+
+    def close_all(self):
+        with self._cond:
+            while self._idle:
+                connection, _ = self._idle.popleft()
+                self._size -= 1
+                _close_quietly(connection)
+            self._update_gauges()
+
+    def _checkout(self, deadline):
+        """유휴 연결, 새로 만들 수 있으면 None"""
+        with self._cond:
+            self._waiting += 1
+            self._update_gauges()
+            try:
+                while True:
+                    self._reap_idle()
+                    if self._idle:
+                        # 최근 반납된 연결부터 사용해 오래된 연결이 정리되도록 함
+                        connection, _ = self._idle.pop()
+                        return connection
+                    if self._size < self.max_size:
+                        self._size += 1
+                        return None
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeout(f'{self.timeout}초 안에 데이터베이스 연결을 얻지 못했습니다. ({self.alias})')
+                    self._cond.wait(remaining)
+            finally:
+                self._waiting -= 1
+                self._update_gauges()
+
+    def _discard(self, connection):
+        if connection is not None:
+            _close_quietly(connection)
+        with self._cond:
+            self._size -= 1
+            self._update_gauges()
+            self._cond.notify()
+
+    def _reap_idle(self):
+        # 가장 오래된 유휴 연결부터 MIN_SIZE 까지 정리 (락을 잡은 상태에서 호출)
+        now = time.monotonic()
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.max_idle:
+            connection, _ = self._idle.popleft()
+            self._size -= 1
+            _close_quietly(connection)
+
+    def _update_gauges(self):
+        POOL_IN_USE.labels(alias=self.alias).set(self._in_use)
+        POOL_IDLE.labels(alias=self.alias).set(len(self._idle))
+        POOL_WAITING.labels(alias=self.alias).set(self._waiting)
+
+
+def _close_quietly(connection):
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+
+_pools = {}
+_pools_pid = None
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, factory):
+    """
+    alias 별 풀 (워커 프로세스마다 따로 생성)
+
+    fork 이후에는 부모 프로세스의 연결을 공유하지 않도록 새 풀을 만든다.
+    """
+    global _pools, _pools_pid
+    pid = os.getpid()
+    with _pools_lock:
+        if _pools_pid != pid:
+            _pools = {}
+            _pools_pid = pid
+        if alias not in _pools:
+            _pools[alias] = factory()
+        return _pools[alias]
@@ -49,11 +49,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'programmers_exam_reservation.utils.middlewares.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'programmers_exam_reservation.utils.middlewares.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -89,15 +91,77 @@ DATABASES = {
 }
 # DATABASES = {
 #     'default': {
-#         'ENGINE': 'django.db.backends.postgresql',
+#         # 워커 프로세스별 연결 풀을 사용하는 PostgreSQL 백엔드
+#         # (연결 풀 사용 시 CONN_MAX_AGE 는 기본값 0 으로 두어 요청 종료 시 풀에 반납)
+#         'ENGINE': 'programmers_exam_reservation.db_backends.postgresql_pool',
 #         'NAME': '',
 #         'USER': '',
 #         'PASSWORD': '',
 #         'HOST': '',
 #         'PORT': '5432',
+#         'POOL': {
+#             'MIN_SIZE': 2,
+#             'MAX_SIZE': 20,
+#             'TIMEOUT': 5,
+#             'MAX_IDLE': 300,
+#         },
 #     }
 # }
 
+# 읽기 전용 복제본
+# 안전한 메서드(GET 등) 요청의 읽기 쿼리는 DATABASE_REPLICAS 의 복제본으로 라운드 로빈 분산
+# 로컬에서는 DATABASE_REPLICA_NAME 에 primary 를 복사한 SQLite 파일 경로를 지정해 확인할 수 있음
+DATABASE_REPLICAS = []
+if os.environ.get('DATABASE_REPLICA_NAME'):
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ['DATABASE_REPLICA_NAME'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append('replica')
+
+DATABASE_ROUTERS = ['programmers_exam_reservation.utils.db_routers.ReplicaRouter']
+
+# 쓰기 직후 같은 사용자의 읽기를 primary 로 고정하는 시간(초)
+READ_YOUR_WRITES_SECONDS = 5
+
+# 연결 오류가 발생한 복제본을 제외하는 시간(초)
+REPLICA_EJECT_SECONDS = 30
+
+# 예약 가능 시간대 조회를 워커 프로세스 간에도 캐시 락으로 합칠지 여부
+# (워커 프로세스 내 동시 조회는 항상 합침)
+AVAILABLE_SLOTS_CACHE_SINGLE_FLIGHT = os.environ.get('AVAILABLE_SLOTS_CACHE_SINGLE_FLIGHT') == '1'
+
+# PostgreSQL 사용 시 예약 테이블을 시험 날짜 기준 월 단위 파티션 테이블로 관리
+# (reservations 0004 마이그레이션과 manage_reservation_partitions 명령어에서 사용)
+RESERVATION_PARTITIONING = os.environ.get('RESERVATION_PARTITIONING') == '1'
+
+# 데이터베이스 트리거로 시간대별 확정 인원 제한 (PostgreSQL, SQLite)
+# (reservations 0010 마이그레이션과 manage_capacity_triggers 명령어에서 설치, 켜져 있고 트리거가 설치되어 있으면 확정 예약 저장 전 확인 조회 생략)
+RESERVATION_CAPACITY_TRIGGERS = os.environ.get('RESERVATION_CAPACITY_TRIGGERS') == '1'
+
+# PostgreSQL 사용 시 예약 시간 범위(tsrange) 생성 컬럼과 GiST 인덱스로 시간대가 겹치는 예약 조회
+# (reservations 0011 마이그레이션과 manage_time_range_index 명령어에서 설치)
+RESERVATION_TIME_RANGE_INDEX = os.environ.get('RESERVATION_TIME_RANGE_INDEX') == '1'
+
+# 예약 변경 기록(outbox), 변경분 동기화를 읽을 때 추가로 제외할 최근 기록 시간(초)
+# 진행 중인 트랜잭션의 변경은 PostgreSQL 에서 가장 오래된 쓰기 트랜잭션의 시작 일시 기준으로 제외하며 (outbox.visible_before),
+# 이 값은 애플리케이션 서버 간 시계 차이를 고려한 여유 시간 (PostgreSQL 외의 데이터베이스는 이 시간만큼만 제외)
+RESERVATION_CHANGE_VISIBILITY_SECONDS = 1
+
+# Idempotency-Key 요청의 응답 보관 시간(초), 처리 중인 같은 키 요청을 기다리는 최대 시간(초)
+IDEMPOTENCY_KEY_TTL = 60 * 60 * 24
+IDEMPOTENCY_WAIT_SECONDS = 10
+
+# 예약 생성 입장 제어 (시험 날짜별 동시 처리 수 제한과 대기열, reservations/admission.py)
+# 대기열 상태는 캐시에 저장하므로 모든 워커가 공유하는 캐시(Redis 등)를 설정한 경우에만 켬
+# (기본 캐시인 LocMemCache 는 워커 프로세스마다 따로 저장되어 프로세스별로 제한되므로 기본값은 꺼짐)
+RESERVATION_ADMISSION = {
+    'ENABLED': os.environ.get('RESERVATION_ADMISSION') == '1',
+    'MAX_IN_FLIGHT': int(os.environ.get('RESERVATION_ADMISSION_MAX_IN_FLIGHT', 20)),
+    'MAX_WAIT_SECONDS': int(os.environ.get('RESERVATION_ADMISSION_MAX_WAIT_SECONDS', 30)),
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -145,6 +209,28 @@ REST_FRAMEWORK = {
     ),
     "PAGE_SIZE": 10,
     "DEFAULT_PAGINATION_CLASS": "programmers_exam_reservation.utils.paginations.CustomPagination",
+    "EXCEPTION_HANDLER": "programmers_exam_reservation.utils.exceptions.metrics_exception_handler",
+    "DEFAULT_THROTTLE_CLASSES": (
+        "programmers_exam_reservation.utils.throttling.TokenBucketThrottle",
+    ),
+}
+
+# 사용자, 역할별 요청 제한 (programmers_exam_reservation/utils/throttling.py)
+# CAPACITY: 한 번에 사용할 수 있는 최대 요청 수, RATE: 초당 채워지는 요청 수
+# PREFETCH: 캐시에서 한 번에 가져와 워커 프로세스에 보관할 요청 수
+TOKEN_BUCKET_THROTTLE = {
+    'RATES': {
+        'read': {
+            'COMPANY': {'CAPACITY': 300, 'RATE': 50},
+            'ADMIN': {'CAPACITY': 600, 'RATE': 100},
+        },
+        'write': {
+            'COMPANY': {'CAPACITY': 60, 'RATE': 10},
+            'ADMIN': {'CAPACITY': 120, 'RATE': 20},
+        },
+    },
+    'PREFETCH': 5,
+    'LOCAL_BUDGET_SECONDS': 1,
 }
 
 SIMPLE_JWT = {
@@ -177,3 +263,24 @@ LOGGING = {
         },
     },
 }
+
+# 메트릭
+# 멀티 프로세스(gunicorn prefork) 환경에서는 워커가 공유하는 디렉토리를 지정
+# 지정하지 않으면 프로세스 메모리에만 기록
+# METRICS_DIR 을 지정하면 종료된 워커의 gauge 가 합산에 남지 않도록 gunicorn 설정 파일(gunicorn.conf.py)에
+# 다음 hook 을 등록한다.
+#
+#     def child_exit(server, worker):
+#         os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'programmers_exam_reservation.settings')
+#         from programmers_exam_reservation.utils.metrics import mark_process_dead
+#         mark_process_dead(worker.pid)
+METRICS_DIR = os.environ.get('METRICS_DIR')
+
+# /metrics 접근 허용 주소(IP 또는 CIDR, 쉼표로 구분). 기본값은 로컬에서만 허용
+METRICS_ALLOWED_IPS = [
+    address.strip()
+    for address in os.environ.get('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+    if address.strip()
+]
+# 지정하면 허용 주소가 아니어도 'Authorization: Bearer <token>' 헤더로 접근 가능
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
@@ -17,8 +17,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from programmers_exam_reservation.utils.metrics import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/users/', include('users.urls')),
     path('api/reservations/', include('reservations.urls')),
+    path('metrics', metrics_view, name='metrics'),
 ]
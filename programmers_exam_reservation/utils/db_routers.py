@@ -0,0 +1,152 @@
+"""
+읽기 전용 복제본(replica) 데이터베이스 라우팅
+
+안전한 메서드(GET, HEAD, OPTIONS) 요청의 읽기 쿼리만 settings.DATABASE_REPLICAS 의 복제본으로 보내고,
+쓰기 요청과 쓰기 직후 일정 시간(READ_YOUR_WRITES_SECONDS) 동안의 같은 사용자 요청은 default(primary)를 사용한다.
+"""
+import contextvars
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, DatabaseError, OperationalError
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.utils.functional import SimpleLazyObject
+from rest_framework.permissions import SAFE_METHODS
+
+_current_request = contextvars.ContextVar('db_routing_request', default=None)
+_force_primary = contextvars.ContextVar('db_routing_force_primary', default=False)
+
+PIN_CACHE_KEY = 'db_routing:pin:{user_id}'
+
+
+@contextmanager
+def use_primary():
+    """블록 안의 읽기 쿼리를 primary 로 보냄 (데코레이터로도 사용 가능)"""
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+@contextmanager
+def routing_request(request):
+    token = _current_request.set(request)
+    try:
+        yield
+    finally:
+        _current_request.reset(token)
+
+
+def pin_to_primary(user):
+    """쓰기 직후 복제 지연 동안 사용자의 읽기를 primary 로 고정"""
+    cache.set(PIN_CACHE_KEY.format(user_id=user.pk), True, getattr(settings, 'READ_YOUR_WRITES_SECONDS', 5))
+
+
+def _is_pinned(request):
+    # 요청마다 한 번만 캐시를 조회
+    if hasattr(request, '_db_pinned'):
+        return request._db_pinned
+
+    # DRF 인증 전(지연 객체)에는 사용자를 알 수 없으므로 판단을 미룸
+    user = request.__dict__.get('user')
+    if user is None or isinstance(user, SimpleLazyObject) or not user.is_authenticated:
+        return False
+
+    request._db_pinned = bool(cache.get(PIN_CACHE_KEY.format(user_id=user.pk)))
+    return request._db_pinned
+
+
+class ReplicaPool:
+    """복제본 라운드 로빈 선택과 장애 복제본 일시 제외"""
+
+    def __init__(self):
+        self._counter = itertools.count()
+        self._ejected_until = {}
+        self._lock = threading.Lock()
+
+    @property
+    def aliases(self):
+        return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+    def eject(self, alias):
+        with self._lock:
+            self._ejected_until[alias] = time.monotonic() + getattr(settings, 'REPLICA_EJECT_SECONDS', 30)
+
+    def is_healthy(self, alias):
+        ejected_until = self._ejected_until.get(alias)
+        if ejected_until is not None:
+            if time.monotonic() < ejected_until:
+                return False
+            with self._lock:
+                self._ejected_until.pop(alias, None)
+
+        # 이미 연결된 경우는 추가 비용 없이 통과, 새로 연결해야 하는 경우에만 연결 확인
+        connection = connections[alias]
+        if connection.connection is None:
+            try:
+                connection.ensure_connection()
+            except DatabaseError:
+                self.eject(alias)
+                return False
+        return True
+
+    def choose(self):
+        """사용 가능한 복제본 alias, 없으면 None"""
+        aliases = self.aliases
+        if not aliases:
+            return None
+        start = next(self._counter)
+        for offset in range(len(aliases)):
+            alias = aliases[(start + offset) % len(aliases)]
+            if self.is_healthy(alias):
+                return alias
+        return None
+
+
+replica_pool = ReplicaPool()
+
+
+def _eject_on_error(alias):
+    def wrapper(execute, sql, params, many, context):
+        try:
+            return execute(sql, params, many, context)
+        except OperationalError:
+            replica_pool.eject(alias)
+            raise
+    return wrapper
+
+
+@receiver(connection_created)
+def _watch_replica_connection(sender, connection, **kwargs):
+    # 복제본 쿼리 중 연결 오류가 발생하면 해당 복제본을 잠시 제외
+    if connection.alias in replica_pool.aliases and not getattr(connection, '_eject_on_error_installed', False):
+        connection.execute_wrappers.append(_eject_on_error(connection.alias))
+        connection._eject_on_error_installed = True
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _force_primary.get():
+            return DEFAULT_DB_ALIAS
+
+        request = _current_request.get()
+        if request is None or request.method not in SAFE_METHODS or _is_pinned(request):
+            return DEFAULT_DB_ALIAS
+
+        return replica_pool.choose() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary 와 같은 데이터이므로 관계 허용
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
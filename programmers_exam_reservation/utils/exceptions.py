@@ -0,0 +1,21 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.views import exception_handler
+
+from programmers_exam_reservation.utils.metrics import record_exception
+
+
+def metrics_exception_handler(exc, context):
+    """뷰 밖으로 전파된 예외를 집계한 뒤 DRF 기본 핸들러로 처리"""
+    record_exception(context.get('view'), exc)
+    return exception_handler(exc, context)
+
+
+class IdempotencyKeyReusedException(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "같은 Idempotency-Key 로 다른 요청을 보낼 수 없습니다."
+
+
+class IdempotencyKeyInProgressException(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "같은 Idempotency-Key 의 요청이 처리 중입니다. 잠시 후 다시 시도해주세요."
@@ -0,0 +1,99 @@
+"""
+Idempotency-Key 헤더를 이용한 쓰기 요청 중복 처리 방지
+
+같은 사용자가 같은 Idempotency-Key 로 다시 보낸 요청은 뷰를 실행하지 않고 처음 요청의 응답을 그대로 반환한다.
+- 처음 요청이 처리 중이면 완료될 때까지 기다린 뒤 그 응답을 반환 (IDEMPOTENCY_WAIT_SECONDS)
+- 같은 키로 다른 요청(메서드, 경로, 본문)을 보내면 422
+- 5xx 응답이나 예외는 저장하지 않으므로 같은 키로 다시 시도할 수 있음
+
+응답은 IDEMPOTENCY_KEY_TTL 동안 캐시에 저장한다.
+"""
+import hashlib
+import json
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from programmers_exam_reservation.utils.exceptions import IdempotencyKeyReusedException, \
+    IdempotencyKeyInProgressException
+
+HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+CACHE_KEY = 'idempotency:{user_id}:{key}'
+
+PENDING = 'PENDING'
+DONE = 'DONE'
+
+
+def _fingerprint(request):
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(f'{request.method} {request.path}\n{body}'.encode()).hexdigest()
+
+
+def _replay(entry):
+    response = Response(data=entry['data'], status=entry['status'], headers=entry['headers'])
+    response[REPLAYED_HEADER] = 'true'
+    return response
+
+
+def idempotent(func):
+    """
+    뷰 메서드에 Idempotency-Key 지원 추가
+
+    헤더가 없는 요청은 그대로 처리한다.
+    """
+    @wraps(func)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key or not request.user.is_authenticated:
+            return func(self, request, *args, **kwargs)
+
+        cache_key = CACHE_KEY.format(user_id=request.user.pk, key=key)
+        fingerprint = _fingerprint(request)
+        wait_seconds = getattr(settings, 'IDEMPOTENCY_WAIT_SECONDS', 10)
+        deadline = time.monotonic() + wait_seconds
+
+        # 처음 요청이면 처리 중 표시를 남기고, 이미 있으면 처리가 끝날 때까지 대기
+        while not cache.add(cache_key, {'state': PENDING, 'fingerprint': fingerprint}, timeout=wait_seconds * 3):
+            entry = cache.get(cache_key)
+            if entry is not None:
+                if entry['fingerprint'] != fingerprint:
+                    raise IdempotencyKeyReusedException()
+                if entry['state'] == DONE:
+                    return _replay(entry)
+            # entry 가 없으면 처음 요청이 실패해 처리 중 표시가 지워진 경우이므로 다시 처리 시도
+            # (캐시 장애로 add 와 get 이 계속 실패하는 경우에도 제한 시간 안에서 간격을 두고 시도)
+            if time.monotonic() >= deadline:
+                raise IdempotencyKeyInProgressException()
+            time.sleep(0.05)
+
+        try:
+            response = func(self, request, *args, **kwargs)
+        except Exception:
+            cache.delete(cache_key)
+            raise
+
+        if response.status_code >= 500:
+            cache.delete(cache_key)
+            return response
+
+        cache.set(
+            cache_key,
+            {
+                'state': DONE,
+                'fingerprint': fingerprint,
+                'status': response.status_code,
+                'data': response.data,
+                'headers': {
+                    header: value for header, value in response.items()
+                    if header in ('Location', 'Retry-After')
+                },
+            },
+            timeout=getattr(settings, 'IDEMPOTENCY_KEY_TTL', 60 * 60 * 24),
+        )
+        return response
+
+    return wrapper
@@ -0,0 +1,473 @@
+"""
+프로세스 내 메트릭 레지스트리 (Prometheus text format)
+
+settings.METRICS_DIR 가 지정되면 워커 프로세스마다 mmap 파일 하나에 값을 기록하고,
+/metrics 조회 시 디렉토리의 모든 파일을 합산한다. (gunicorn prefork 환경 대응)
+각 프로세스는 자신의 파일에만 쓰기 때문에 프로세스 간 락이 필요 없고,
+프로세스 내에서는 값마다 락을 두어 서로 다른 값의 갱신이 경합하지 않는다.
+
+/metrics 는 settings.METRICS_ALLOWED_IPS 에 포함된 주소나
+settings.METRICS_TOKEN 과 일치하는 Bearer 토큰을 보낸 요청만 허용한다.
+"""
+import glob
+import hmac
+import ipaddress
+import json
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+CONTENT_TYPE_LATEST = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+_INITIAL_MMAP_SIZE = 1024 * 64
+
+
+class _MmapedDict:
+    """
+    key(str) -> float(double) 값을 저장하는 append-only mmap 파일
+
+    파일 구조: [used(uint32) + padding(4)] [key_len(uint32) key(8바이트 정렬) value(double)] ...
+    """
+
+    def __init__(self, filename):
+        self._f = open(filename, 'a+b')
+        capacity = os.fstat(self._f.fileno()).st_size
+        if capacity == 0:
+            self._f.truncate(_INITIAL_MMAP_SIZE)
+            capacity = _INITIAL_MMAP_SIZE
+        self._capacity = capacity
+        self._m = mmap.mmap(self._f.fileno(), self._capacity)
+        self._positions = {}
+        # 새 key 추가(파일 확장 포함)만 직렬화. 기존 key 의 값 쓰기는 위치가 겹치지 않아 락이 필요 없다.
+        self._lock = threading.Lock()
+        self._used = struct.unpack_from('i', self._m, 0)[0]
+        if self._used == 0:
+            self._used = 8
+            struct.pack_into('i', self._m, 0, self._used)
+        else:
+            for key, _, pos in self._read_all():
+                self._positions[key] = pos
+
+    @classmethod
+    def read_all_values_from_file(cls, filename):
+        with open(filename, 'rb') as f:
+            data = f.read()
+        used = struct.unpack_from('i', data, 0)[0] if data else 0
+        return list(cls._iter_entries(data, used))
+
+    @staticmethod
+    def _iter_entries(data, used):
+        pos = 8
+        while pos < used:
+            encoded_len = struct.unpack_from('i', data, pos)[0]
+            pos += 4
+            encoded_key = data[pos:pos + encoded_len]
+            padded_len = encoded_len + (8 - (encoded_len + 4) % 8)
+            pos += padded_len
+            value = struct.unpack_from('d', data, pos)[0]
+            yield encoded_key.decode('utf-8'), value, pos
+            pos += 8
+
+    def _read_all(self):
+        return self._iter_entries(self._m, self._used)
+
+    def _init_value(self, key):
+        encoded = key.encode('utf-8')
+        padded = encoded + (b' ' * (8 - (len(encoded) + 4) % 8))
+        value = struct.pack(f'i{len(padded)}sd', len(encoded), padded, 0.0)
+        while self._used + len(value) > self._capacity:
+            self._capacity *= 2
+            self._f.truncate(self._capacity)
+            self._m = mmap.mmap(self._f.fileno(), self._capacity)
+        self._m[self._used:self._used + len(value)] = value
+        self._used += len(value)
+        struct.pack_into('i', self._m, 0, self._used)
+        self._positions[key] = self._used - 8
+
+    def _position(self, key):
+        position = self._positions.get(key)
+        if position is None:
+            with self._lock:
+                if key not in self._positions:
+                    self._init_value(key)
+                position = self._positions[key]
+        return position
+
+    def read_value(self, key):
+        return struct.unpack_from('d', self._m, self._position(key))[0]
+
+    def write_value(self, key, value):
+        struct.pack_into('d', self._m, self._position(key), value)
+
+    def close(self):
+        if self._f:
+            self._m.close()
+            self._f.close()
+            self._f = None
+
+
+class _LocalValue:
+    """단일 프로세스용 값 저장소"""
+
+    def __init__(self, metric_name, sample_name, labels):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount):
+        with self._lock:
+            self._value += amount
+
+    def set(self, value):
+        with self._lock:
+            self._value = value
+
+    def get(self):
+        with self._lock:
+            return self._value
+
+
+class _MmapValue:
+    """워커 프로세스별 mmap 파일에 기록되는 값 저장소"""
+    _files = {}
+    _pid = None
+    # 프로세스별 파일 목록 초기화에만 사용. 값 갱신은 값마다 가진 self._lock 으로 보호한다.
+    _files_lock = threading.Lock()
+
+    def __init__(self, metric_name, sample_name, labels):
+        self._metric_name = metric_name
+        self._key = json.dumps([metric_name, sample_name, labels], sort_keys=True)
+        self._owner_pid = None
+        self._ensure_process()
+
+    def _ensure_process(self):
+        # fork 이후에는 부모 프로세스의 파일에 쓰지 않도록 자신의 파일로 다시 연결
+        pid = os.getpid()
+        if self._owner_pid == pid:
+            return
+        with _MmapValue._files_lock:
+            if _MmapValue._pid != pid:
+                _MmapValue._pid = pid
+                _MmapValue._files = {}
+            kind = _METRIC_KINDS.get(self._metric_name, 'counter')
+            if kind not in self._files:
+                filename = os.path.join(settings.METRICS_DIR, f'{kind}_{pid}.db')
+                self._files[kind] = _MmapedDict(filename)
+            self._file = self._files[kind]
+        # fork 시점에 다른 스레드가 잡고 있던 락을 물려받지 않도록 새로 만든다.
+        self._lock = threading.Lock()
+        self._value = self._file.read_value(self._key)
+        self._owner_pid = pid
+
+    def inc(self, amount):
+        self._ensure_process()
+        with self._lock:
+            self._value += amount
+            self._file.write_value(self._key, self._value)
+
+    def set(self, value):
+        self._ensure_process()
+        with self._lock:
+            self._value = value
+            self._file.write_value(self._key, self._value)
+
+    def get(self):
+        self._ensure_process()
+        with self._lock:
+            return self._value
+
+
+def _value_class():
+    if getattr(settings, 'METRICS_DIR', None):
+        return _MmapValue
+    return _LocalValue
+
+
+# metric name -> kind ('counter' | 'gauge' | 'histogram')
+_METRIC_KINDS = {}
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=(), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+        _METRIC_KINDS[name] = self.kind
+        (registry or REGISTRY).register(self)
+
+    def labels(self, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child(dict(zip(self.labelnames, key)))
+                    self._children[key] = child
+        return child
+
+    def _new_child(self, labels):
+        raise NotImplementedError
+
+    def samples(self):
+        """(sample_name, labels, value) 목록"""
+        for child in list(self._children.values()):
+            yield from child.samples()
+
+
+class _CounterChild:
+    def __init__(self, name, labels):
+        self._name = name
+        self._labels = labels
+        self._value = _value_class()(name, f'{name}_total', labels)
+
+    def inc(self, amount=1):
+        self._value.inc(amount)
+
+    def samples(self):
+        yield f'{self._name}_total', self._labels, self._value.get()
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def _new_child(self, labels):
+        return _CounterChild(self.name, labels)
+
+
+class _GaugeChild:
+    def __init__(self, name, labels):
+        self._name = name
+        self._labels = labels
+        self._value = _value_class()(name, name, labels)
+
+    def inc(self, amount=1):
+        self._value.inc(amount)
+
+    def dec(self, amount=1):
+        self._value.inc(-amount)
+
+    def set(self, value):
+        self._value.set(value)
+
+    def samples(self):
+        yield self._name, self._labels, self._value.get()
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def _new_child(self, labels):
+        return _GaugeChild(self.name, labels)
+
+
+class _HistogramChild:
+    def __init__(self, name, labels, buckets):
+        self._name = name
+        self._labels = labels
+        self._upper_bounds = buckets
+        value_class = _value_class()
+        # 버킷 값은 누적하지 않고 저장하며, 노출 시점에 누적한다. (observe 당 쓰기 3회)
+        self._buckets = [
+            value_class(name, f'{name}_bucket', dict(labels, le=_float_repr(bound)))
+            for bound in buckets
+        ]
+        self._sum = value_class(name, f'{name}_sum', labels)
+        self._count = value_class(name, f'{name}_count', labels)
+
+    def observe(self, amount):
+        for index, bound in enumerate(self._upper_bounds):
+            if amount <= bound:
+                self._buckets[index].inc(1)
+                break
+        self._sum.inc(amount)
+        self._count.inc(1)
+
+    def samples(self):
+        for bound, bucket in zip(self._upper_bounds, self._buckets):
+            yield f'{self._name}_bucket', dict(self._labels, le=_float_repr(bound)), bucket.get()
+        yield f'{self._name}_sum', self._labels, self._sum.get()
+        yield f'{self._name}_count', self._labels, self._count.get()
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, registry=None):
+        self.buckets = tuple(sorted(buckets))
+        if self.buckets[-1] != float('inf'):
+            self.buckets += (float('inf'),)
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self, labels):
+        return _HistogramChild(self.name, labels, self.buckets)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = OrderedDict()
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f'이미 등록된 메트릭입니다: {metric.name}')
+        self._metrics[metric.name] = metric
+
+    def collect(self):
+        """
+        metric name 별 (metric, [(sample_name, labels, value), ...]) 목록
+
+        멀티 프로세스 모드에서는 모든 워커의 mmap 파일 값을 합산한다.
+        """
+        if getattr(settings, 'METRICS_DIR', None):
+            return self._collect_multiprocess()
+        return [(metric, list(metric.samples())) for metric in self._metrics.values()]
+
+    def _collect_multiprocess(self):
+        totals = OrderedDict()
+        for filename in sorted(glob.glob(os.path.join(settings.METRICS_DIR, '*.db'))):
+            for key, value, _ in _MmapedDict.read_all_values_from_file(filename):
+                metric_name, sample_name, labels = json.loads(key)
+                sample_key = (metric_name, sample_name, tuple(sorted(labels.items())))
+                totals[sample_key] = totals.get(sample_key, 0.0) + value
+
+        samples_by_metric = OrderedDict((name, []) for name in self._metrics)
+        for (metric_name, sample_name, labels), value in totals.items():
+            if metric_name in samples_by_metric:
+                samples_by_metric[metric_name].append((sample_name, dict(labels), value))
+
+        return [(self._metrics[name], samples) for name, samples in samples_by_metric.items()]
+
+    def generate_latest(self):
+        """Prometheus text exposition format 문자열 생성"""
+        lines = []
+        for metric, samples in self.collect():
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            if metric.kind == 'histogram':
+                samples = _accumulate_buckets(samples)
+            for sample_name, labels, value in samples:
+                lines.append(f'{sample_name}{_format_labels(labels)} {_float_repr(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+def _accumulate_buckets(samples):
+    """버킷별 값을 le 기준으로 누적"""
+    accumulated = []
+    running = {}
+    for sample_name, labels, value in sorted(samples, key=_histogram_sort_key):
+        if sample_name.endswith('_bucket'):
+            series = tuple(sorted((k, v) for k, v in labels.items() if k != 'le'))
+            running[series] = running.get(series, 0.0) + value
+            value = running[series]
+        accumulated.append((sample_name, labels, value))
+    return accumulated
+
+
+def _histogram_sort_key(sample):
+    sample_name, labels, _ = sample
+    series = tuple(sorted((k, v) for k, v in labels.items() if k != 'le'))
+    suffix_order = {'_bucket': 0, '_sum': 1, '_count': 2}
+    suffix = next(s for s in suffix_order if sample_name.endswith(s))
+    le = float(labels['le']) if 'le' in labels else 0.0
+    return series, suffix_order[suffix], le
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    pairs = ','.join(
+        '{}="{}"'.format(k, str(v).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"'))
+        for k, v in sorted(labels.items())
+    )
+    return '{' + pairs + '}'
+
+
+def _float_repr(value):
+    if value == float('inf'):
+        return '+Inf'
+    if value == float('-inf'):
+        return '-Inf'
+    if float(value).is_integer():
+        return f'{value:.1f}'
+    return repr(float(value))
+
+
+def mark_process_dead(pid):
+    """
+    종료된 워커의 gauge 파일 제거
+
+    종료된 워커의 gauge(처리 중인 요청 수 등)가 합산에 남지 않도록
+    gunicorn 설정 파일의 child_exit hook 에서 호출한다. (settings.METRICS_DIR 주석 참고)
+    counter, histogram 값은 누적값이므로 유지한다.
+
+    Args:
+        pid: 종료된 워커 프로세스 id
+    """
+    metrics_dir = getattr(settings, 'METRICS_DIR', None)
+    if not metrics_dir:
+        return
+    for filename in glob.glob(os.path.join(metrics_dir, f'gauge_{pid}.db')):
+        os.remove(filename)
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    '뷰, 메서드별 요청 처리 시간(초)',
+    labelnames=('view', 'method'),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight',
+    '뷰별 처리 중인 요청 수',
+    labelnames=('view', 'method'),
+)
+EXCEPTIONS = Counter(
+    'http_exceptions',
+    '예외 클래스별 발생 횟수',
+    labelnames=('view', 'exception'),
+)
+
+
+def record_exception(view, exc):
+    """뷰에서 처리한 예외를 예외 클래스별로 집계"""
+    EXCEPTIONS.labels(view=view.__class__.__name__, exception=exc.__class__.__name__).inc()
+
+
+def _is_allowed(request):
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    if token:
+        authorization = request.META.get('HTTP_AUTHORIZATION', '')
+        scheme, _, credentials = authorization.partition(' ')
+        if scheme.lower() == 'bearer' and hmac.compare_digest(credentials.strip().encode(), token.encode()):
+            return True
+
+    try:
+        address = ipaddress.ip_address(request.META.get('REMOTE_ADDR', ''))
+    except ValueError:
+        return False
+    return any(
+        address in ipaddress.ip_network(network, strict=False)
+        for network in getattr(settings, 'METRICS_ALLOWED_IPS', ())
+    )
+
+
+def metrics_view(request):
+    """
+    Prometheus 수집용 엔드포인트
+
+    허용 목록의 주소이거나 Bearer 토큰이 일치하는 요청이 아니면 403 을 반환한다.
+    """
+    if not _is_allowed(request):
+        return HttpResponseForbidden()
+    return HttpResponse(REGISTRY.generate_latest(), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,49 @@
+import time
+
+from rest_framework.permissions import SAFE_METHODS
+
+from programmers_exam_reservation.utils.db_routers import routing_request, pin_to_primary
+from programmers_exam_reservation.utils.metrics import REQUEST_LATENCY, REQUESTS_IN_FLIGHT
+
+
+class MetricsMiddleware:
+    """뷰, 메서드별 요청 처리 시간과 처리 중인 요청 수를 기록"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        try:
+            return self.get_response(request)
+        finally:
+            labels = getattr(request, '_metrics_labels', None)
+            if labels is not None:
+                REQUESTS_IN_FLIGHT.labels(**labels).dec()
+                REQUEST_LATENCY.labels(**labels).observe(time.perf_counter() - start)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, 'view_class', view_func)
+        request._metrics_labels = {'view': view.__name__, 'method': request.method}
+        REQUESTS_IN_FLIGHT.labels(**request._metrics_labels).inc()
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청 정보를 데이터베이스 라우터에 전달하고, 쓰기 요청이 성공하면 사용자를 잠시 primary 에 고정
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with routing_request(request):
+            response = self.get_response(request)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated:
+                pin_to_primary(user)
+
+        return response
@@ -0,0 +1,102 @@
+"""
+같은 키에 대한 동시 계산을 하나로 합치는 single-flight
+
+진행 중인 계산이 있으면 새로 계산하지 않고 그 결과를 기다려 함께 사용한다.
+계산이 끝나면 결과를 보관하지 않으므로 이후 요청은 다시 계산한다.
+"""
+import threading
+import time
+import uuid
+
+from django.core.cache import cache
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.exception = None
+        self.duplicates = 0
+
+
+class SingleFlight:
+    """워커 프로세스 내 스레드 간 single-flight"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        """
+        key 에 대해 진행 중인 계산이 없으면 func 를 실행하고, 있으면 그 결과를 기다려 반환
+
+        Returns:
+            func 의 반환값 (함께 기다린 호출은 같은 객체를 받음)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.duplicates += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except Exception as e:
+            call.exception = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def duplicates(self, key):
+        """진행 중인 계산을 기다리는 호출 수"""
+        with self._lock:
+            call = self._calls.get(key)
+            return call.duplicates if call is not None else 0
+
+
+def cache_single_flight(key, func, lock_timeout=5, poll_interval=0.01):
+    """
+    캐시 락을 이용한 워커 프로세스 간 single-flight
+
+    락을 얻은 워커만 계산하고 결과를 해당 계산 전용 키에 잠시 저장한다.
+    다른 워커는 락에 기록된 계산 id 의 결과를 기다리며, lock_timeout 안에 결과가 없으면 직접 계산한다.
+    """
+    lock_key = f'singleflight:lock:{key}'
+    flight_id = uuid.uuid4().hex
+
+    if cache.add(lock_key, flight_id, timeout=lock_timeout):
+        try:
+            result = func()
+            cache.set(f'singleflight:result:{key}:{flight_id}', result, timeout=lock_timeout)
+            return result
+        finally:
+            cache.delete(lock_key)
+
+    leader_id = cache.get(lock_key)
+    deadline = time.monotonic() + lock_timeout
+    while leader_id is not None and time.monotonic() < deadline:
+        result = cache.get(f'singleflight:result:{key}:{leader_id}')
+        if result is not None:
+            return result
+        time.sleep(poll_interval)
+        if cache.get(lock_key) is None:
+            # 락이 풀린 직후 결과가 저장되어 있을 수 있으므로 한 번 더 확인
+            result = cache.get(f'singleflight:result:{key}:{leader_id}')
+            if result is not None:
+                return result
+            break
+
+    return func()
@@ -0,0 +1,144 @@
+"""
+사용자, 역할별 token bucket 요청 제한
+
+settings.TOKEN_BUCKET_THROTTLE 의 RATES 에 읽기(read: GET, HEAD, OPTIONS)와 쓰기(write) 예산을 역할별로 지정한다.
+- CAPACITY: 한 번에 사용할 수 있는 최대 요청 수 (bucket 크기)
+- RATE: 초당 채워지는 요청 수
+
+bucket 은 캐시에 '채워지는 주기(CAPACITY / RATE)' 단위 키로 저장하며, 키에는 해당 주기에 사용한 요청 수만 기록한다.
+주기 시작부터 t 초가 지났을 때 사용할 수 있는 요청 수는 CAPACITY + RATE * t 이므로
+요청마다 cache.incr 한 번으로 허용 여부를 판단할 수 있다.
+새 주기의 키는 이전 주기에 다 채우지 못한 사용량을 이어받아 cache.add 한 번으로 만든다.
+(bucket 크기 제한은 주기의 첫 요청 시점에 적용하므로, 한 주기 안에서 요청이 끊겼다가 다시 오는 경우
+최대 CAPACITY 만큼 더 허용될 수 있다.)
+
+거부되거나 일부만 허용된 요청의 사용량은 되돌리지 않는다. (요청당 캐시 왕복 1회)
+그만큼 실제보다 많이 사용한 것으로 계산되지만, 이어받는 사용량을 CAPACITY 로 제한하므로
+다음 주기가 시작되면 1 / RATE 초 안에 다시 요청할 수 있다.
+
+PREFETCH 만큼 요청 수를 한 번에 가져와 워커 프로세스에 보관하고(LOCAL_BUDGET_SECONDS 동안),
+보관한 요청 수가 남아 있으면 캐시를 조회하지 않는다.
+"""
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import BaseThrottle
+
+DEFAULT_OPTIONS = {
+    'RATES': {},
+    'PREFETCH': 1,
+    'LOCAL_BUDGET_SECONDS': 1,
+}
+
+CACHE_KEY = 'throttle:{scope}:{role}:{user_id}:{period}'
+
+_local_budgets = {}
+_local_budgets_lock = threading.Lock()
+
+
+def get_options():
+    return {**DEFAULT_OPTIONS, **getattr(settings, 'TOKEN_BUCKET_THROTTLE', {})}
+
+
+def _take_local_budget(bucket):
+    with _local_budgets_lock:
+        budget = _local_budgets.get(bucket)
+        if budget is None:
+            return False
+        if budget[0] <= 0 or time.monotonic() >= budget[1]:
+            del _local_budgets[bucket]
+            return False
+        budget[0] -= 1
+        return True
+
+
+def _store_local_budget(bucket, tokens, seconds):
+    if tokens <= 0:
+        return
+    with _local_budgets_lock:
+        _local_budgets[bucket] = [tokens, time.monotonic() + seconds]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    def __init__(self):
+        self.options = get_options()
+        self.wait_seconds = None
+
+    def get_scope(self, request):
+        return 'read' if request.method in SAFE_METHODS else 'write'
+
+    def allow_request(self, request, view):
+        user = request.user
+        if not user or not user.is_authenticated:
+            return True
+
+        scope = self.get_scope(request)
+        role = getattr(user, 'role', None)
+        rate = self.options['RATES'].get(scope, {}).get(role)
+        if rate is None:
+            return True
+
+        bucket = (scope, role, user.pk)
+        if _take_local_budget(bucket):
+            return True
+
+        capacity = rate['CAPACITY']
+        refill_rate = rate['RATE']
+        prefetch = max(1, min(self.options['PREFETCH'], capacity))
+
+        # 한 주기는 빈 bucket 이 가득 찰 때까지 걸리는 시간
+        period_seconds = capacity / refill_rate
+        now = time.time()
+        period = int(now // period_seconds)
+        allowed = capacity + refill_rate * (now - period * period_seconds)
+
+        key = CACHE_KEY.format(scope=scope, role=role, user_id=user.pk, period=period)
+        previous_key = CACHE_KEY.format(scope=scope, role=role, user_id=user.pk, period=period - 1)
+        timeout = math.ceil(period_seconds * 2) + 1
+
+        def initial_usage():
+            # 이전 주기에 채워진 양(CAPACITY)보다 많이 사용한 만큼 이어받아 bucket 이 비어 있던 상태를 유지하고,
+            # 주기 중간에 처음 요청한 경우 가득 찬 bucket 에 넘치게 채워진 양은 사용한 것으로 처리
+            # (거부된 요청의 사용량이 계속 이어지지 않도록 이어받는 양은 CAPACITY 이하)
+            carried = min(max(0, int(cache.get(previous_key, 0) - capacity)), capacity)
+            return max(carried, int(refill_rate * (now - period * period_seconds)))
+
+        used = self._incr(key, prefetch, initial_usage, timeout)
+
+        granted = min(prefetch, int(allowed) - (used - prefetch))
+        if granted <= 0:
+            # 되돌리지 않은 이번 요청의 사용량까지 포함해 다시 허용될 때까지의 시간 (다음 주기 시작 직후보다 길지 않음)
+            self.wait_seconds = min(
+                (used - allowed + 1) / refill_rate,
+                (period + 1) * period_seconds - now + 1 / refill_rate,
+            )
+            return False
+
+        _store_local_budget(bucket, granted - 1, self.options['LOCAL_BUDGET_SECONDS'])
+        return True
+
+    def wait(self):
+        if self.wait_seconds is None:
+            return None
+        return max(1, math.ceil(self.wait_seconds))
+
+    def _incr(self, key, delta, initial, timeout):
+        try:
+            return cache.incr(key, delta)
+        except ValueError:
+            pass
+
+        # 주기의 첫 요청: 이어받은 사용량에 이번 요청을 더해 키 생성, 다른 요청이 먼저 만들었으면 incr
+        value = initial() + delta
+        if cache.add(key, value, timeout=timeout):
+            return value
+        try:
+            return cache.incr(key, delta)
+        except ValueError:
+            # 키가 만료된 직후 등 드문 경우 현재 요청만 기록
+            cache.set(key, value, timeout=timeout)
+            return value
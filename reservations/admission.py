@@ -0,0 +1,318 @@
+"""
+예약 생성 요청 입장 제어 (대기열)
+
+시험 날짜별로 동시에 처리하는 예약 생성 수를 MAX_IN_FLIGHT 로 제한한다.
+- 처리 슬롯이 남아 있고 대기 중인 요청이 없으면 바로 처리
+- 그렇지 않으면 번호표(ticket)를 발급해 대기열에 등록하고 202 와 대기열 토큰을 반환
+- 클라이언트는 대기열 조회(GET)로 순번을 확인하고, 처리 요청(POST)을 보내면 차례가 된 경우 예약이 생성됨
+  (같은 토큰으로 다시 처리 요청하면 새로 생성하지 않고 생성된 예약을 반환)
+- 예상 대기 시간 또는 실제 대기 시간이 MAX_WAIT_SECONDS 를 넘으면 요청을 거절(503)
+
+대기열 상태는 모든 워커가 공유하도록 캐시에 저장한다.
+- issued: 발급한 마지막 번호표
+- floor: 대기열을 떠난(처리 시작, 만료) 앞쪽 번호표의 마지막 번호
+- ticket:{n}: 대기 중인 요청 정보 (대기 제한 시간이 지나면 만료)
+- result:{n}: 처리를 시작한 요청의 생성된 예약 번호 (처리 중에는 PROCESSING)
+- slot:{i}: 처리 중인 요청이 점유한 슬롯 (SLOT_TIMEOUT 이 지나면 만료되어 워커 장애 시에도 회수)
+"""
+import math
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+
+from programmers_exam_reservation.utils.metrics import Counter
+from reservations.exceptions import ReservationQueueTokenException
+
+DEFAULT_OPTIONS = {
+    'ENABLED': False,
+    'MAX_IN_FLIGHT': 20,  # 시험 날짜별 동시 처리 수
+    'MAX_WAIT_SECONDS': 30,  # 대기 제한 시간(초)
+    'SLOT_TIMEOUT': 30,  # 슬롯 점유 제한 시간(초)
+    'LOCK_TIMEOUT': 1.0,  # 대기열 lock 을 기다리는 최대 시간(초), 넘으면 요청 거절
+    'POLL_INTERVAL_SECONDS': 2,  # 대기열 조회 최대 간격(초)
+    'SERVICE_SECONDS': 0.2,  # 처리 시간 측정 전 사용할 예약 생성 처리 시간 추정값(초)
+    'RESULT_TIMEOUT': 60 * 60,  # 처리된 대기 요청의 예약 번호 보관 시간(초)
+}
+
+TOKEN_SALT = 'reservations.admission'
+SERVICE_SECONDS_KEY = 'admission:service_seconds'
+
+ADMISSIONS = Counter(
+    'reservation_admissions',
+    '예약 생성 입장 제어 결과별 횟수',
+    labelnames=('outcome',),
+)
+
+ADMITTED = 'ADMITTED'
+QUEUED = 'QUEUED'
+SHED = 'SHED'
+DONE = 'DONE'
+
+PROCESSING = 0
+
+
+def get_options():
+    return {**DEFAULT_OPTIONS, **getattr(settings, 'RESERVATION_ADMISSION', {})}
+
+
+@dataclass
+class Admission:
+    """
+    입장 제어 결과
+
+    - ADMITTED: slot 을 점유한 상태로 처리 가능 (처리 후 release 호출)
+    - QUEUED: 대기 중 (token, position)
+    - SHED: 거절
+    - DONE: 이미 처리된 대기 요청 (reservation_id)
+    """
+    status: str
+    exam_date: object = None
+    slot: int = None
+    ticket: int = None
+    reservation_id: int = None
+    token: str = None
+    position: int = None
+    retry_after: int = None
+    data: dict = field(default_factory=dict)
+    started_at: float = None
+
+
+class AdmissionController:
+    def __init__(self):
+        self.options = get_options()
+
+    def enter(self, user, exam_date, data):
+        """
+        예약 생성 요청 입장
+
+        Args:
+            user: 요청 사용자
+            exam_date: 시험 날짜
+            data: 검증된 예약 생성 요청 데이터 (대기 후 처리할 때 사용)
+
+        Returns:
+            Admission
+        """
+        if not self.options['ENABLED']:
+            return Admission(status=ADMITTED, exam_date=exam_date, started_at=time.monotonic())
+
+        self._ensure_counters(exam_date)
+        with self._queue_lock(exam_date) as locked:
+            if not locked:
+                return self._shed_busy(exam_date)
+
+            floor = self._advance_floor(exam_date)
+            waiting = cache.get(self._key(exam_date, 'issued'), 0) - floor
+
+            # 대기 중인 요청이 없으면 바로 처리
+            if waiting <= 0:
+                slot = self._acquire_slot(exam_date)
+                if slot is not None:
+                    ADMISSIONS.labels(outcome='admitted').inc()
+                    return Admission(status=ADMITTED, exam_date=exam_date, slot=slot, started_at=time.monotonic())
+
+            # 앞선 대기 요청이 모두 처리될 때까지의 예상 대기 시간이 제한을 넘으면 거절
+            estimated_wait = self._estimate_wait(max(waiting, 0) + 1)
+            if estimated_wait > self.options['MAX_WAIT_SECONDS']:
+                ADMISSIONS.labels(outcome='shed').inc()
+                return Admission(status=SHED, exam_date=exam_date, retry_after=max(1, math.ceil(estimated_wait)))
+
+            # 번호표 발급과 대기 정보 저장 사이에 floor 가 이동하지 않도록 lock 안에서 처리
+            ticket = cache.incr(self._key(exam_date, 'issued'))
+            cache.set(
+                self._key(exam_date, f'ticket:{ticket}'),
+                {
+                    'user_id': user.pk,
+                    'data': data,
+                    'deadline': time.time() + self.options['MAX_WAIT_SECONDS'],
+                },
+                timeout=self.options['MAX_WAIT_SECONDS'],
+            )
+
+        token = signing.dumps({'date': exam_date.isoformat(), 'ticket': ticket}, salt=TOKEN_SALT)
+        position = ticket - floor
+
+        ADMISSIONS.labels(outcome='queued').inc()
+        return Admission(
+            status=QUEUED,
+            exam_date=exam_date,
+            token=token,
+            position=position,
+            retry_after=self._retry_after(position),
+        )
+
+    def poll(self, user, token, claim=False):
+        """
+        대기열 순번 확인, 처리 요청(claim)이면 차례가 된 경우 슬롯 점유
+
+        Args:
+            user: 요청 사용자
+            token: 대기열 토큰
+            claim: 차례가 되면 슬롯을 점유해 처리할지 여부 (False 이면 순번만 확인)
+
+        Returns:
+            Admission (ADMITTED 인 경우 data 에 대기 등록 시의 요청 데이터, 처리를 마친 요청이면 DONE)
+
+        Raises:
+            ReservationQueueTokenException: 토큰이 유효하지 않거나 다른 사용자의 토큰인 경우
+        """
+        try:
+            payload = signing.loads(token, salt=TOKEN_SALT)
+        except signing.BadSignature:
+            raise ReservationQueueTokenException()
+
+        exam_date = date.fromisoformat(payload['date'])
+        ticket = payload['ticket']
+        ticket_key = self._key(exam_date, f'ticket:{ticket}')
+        result_key = self._key(exam_date, f'result:{ticket}')
+
+        record = cache.get(ticket_key)
+        if record is not None and record['user_id'] != user.pk:
+            raise ReservationQueueTokenException()
+
+        if record is None:
+            result = cache.get(result_key)
+            if result is not None and result['user_id'] != user.pk:
+                raise ReservationQueueTokenException()
+            # 같은 토큰의 다른 요청이 처리 중
+            if result is not None and result['reservation_id'] == PROCESSING:
+                return Admission(status=QUEUED, exam_date=exam_date, token=token, position=0, retry_after=1)
+            if result is not None:
+                return Admission(status=DONE, exam_date=exam_date, reservation_id=result['reservation_id'])
+
+        # 대기 제한 시간이 지나 만료된 요청
+        if record is None or time.time() > record['deadline']:
+            cache.delete(ticket_key)
+            ADMISSIONS.labels(outcome='expired').inc()
+            return Admission(status=SHED, exam_date=exam_date, retry_after=1)
+
+        self._ensure_counters(exam_date)
+        with self._queue_lock(exam_date) as locked:
+            if not locked:
+                return self._shed_busy(exam_date)
+            position = ticket - self._advance_floor(exam_date)
+
+        # 앞선 번호표 중 이미 처리된 요청이 있을 수 있으므로 순번은 실제보다 크거나 같음
+        # 같은 토큰의 동시 처리 요청 중 result 를 먼저 등록한 요청만 처리
+        if claim and position <= self._free_slots(exam_date) and cache.add(
+            result_key,
+            {'user_id': user.pk, 'reservation_id': PROCESSING},
+            timeout=self.options['RESULT_TIMEOUT'],
+        ):
+            slot = self._acquire_slot(exam_date)
+            if slot is not None:
+                cache.delete(ticket_key)
+                ADMISSIONS.labels(outcome='admitted').inc()
+                return Admission(
+                    status=ADMITTED,
+                    exam_date=exam_date,
+                    slot=slot,
+                    ticket=ticket,
+                    data=record['data'],
+                    started_at=time.monotonic(),
+                )
+            cache.delete(result_key)
+
+        return Admission(
+            status=QUEUED,
+            exam_date=exam_date,
+            token=token,
+            position=position,
+            retry_after=self._retry_after(position),
+        )
+
+    def complete(self, admission, user, reservation_id):
+        """대기 요청으로 생성한 예약 번호 저장 (같은 토큰으로 다시 처리 요청하면 이 예약을 반환)"""
+        if admission.ticket is None:
+            return
+        cache.set(
+            self._key(admission.exam_date, f'result:{admission.ticket}'),
+            {'user_id': user.pk, 'reservation_id': reservation_id},
+            timeout=self.options['RESULT_TIMEOUT'],
+        )
+
+    def release(self, admission):
+        """처리를 마친 요청의 슬롯 반환, 처리 시간을 예상 대기 시간 계산에 반영"""
+        if admission.status != ADMITTED or admission.slot is None:
+            return
+
+        cache.delete(self._key(admission.exam_date, f'slot:{admission.slot}'))
+
+        # 예약 생성에 실패한 대기 요청은 처리 중 표시를 지워 만료된 요청으로 응답
+        if admission.ticket is not None:
+            result_key = self._key(admission.exam_date, f'result:{admission.ticket}')
+            result = cache.get(result_key)
+            if result is not None and result['reservation_id'] == PROCESSING:
+                cache.delete(result_key)
+
+        elapsed = time.monotonic() - admission.started_at
+        previous = cache.get(SERVICE_SECONDS_KEY, self.options['SERVICE_SECONDS'])
+        cache.set(SERVICE_SECONDS_KEY, previous * 0.8 + elapsed * 0.2, timeout=None)
+
+    def _key(self, exam_date, name):
+        return f'admission:{exam_date.isoformat()}:{name}'
+
+    def _ensure_counters(self, exam_date):
+        cache.add(self._key(exam_date, 'issued'), 0, timeout=None)
+        cache.add(self._key(exam_date, 'floor'), 0, timeout=None)
+
+    @contextmanager
+    def _queue_lock(self, exam_date):
+        """
+        번호표 발급과 floor 이동을 한 워커씩 처리하기 위한 캐시 lock
+
+        lock 을 얻으면 True 를 반환한다. LOCK_TIMEOUT 안에 얻지 못하면(lock 을 잡은 워커 장애 등)
+        lock 없이 진행하지 않고 False 를 반환하며, 호출하는 쪽에서 요청을 거절한다.
+        """
+        lock_key = self._key(exam_date, 'lock')
+        deadline = time.monotonic() + self.options['LOCK_TIMEOUT']
+        while not cache.add(lock_key, 1, timeout=5):
+            if time.monotonic() >= deadline:
+                yield False
+                return
+            time.sleep(0.001)
+        try:
+            yield True
+        finally:
+            cache.delete(lock_key)
+
+    def _shed_busy(self, exam_date):
+        ADMISSIONS.labels(outcome='shed').inc()
+        return Admission(status=SHED, exam_date=exam_date, retry_after=1)
+
+    def _advance_floor(self, exam_date):
+        """
+        대기열을 떠난 앞쪽 번호표만큼 floor 를 이동 (_queue_lock 안에서 호출)
+
+        번호표 정보가 없으면 처리를 시작했거나 만료된 것이다.
+        """
+        floor_key = self._key(exam_date, 'floor')
+        floor = cache.get(floor_key, 0)
+        issued = cache.get(self._key(exam_date, 'issued'), 0)
+        while floor < issued and cache.get(self._key(exam_date, f'ticket:{floor + 1}')) is None:
+            floor = cache.incr(floor_key)
+        return floor
+
+    def _slot_keys(self, exam_date):
+        return [self._key(exam_date, f'slot:{slot}') for slot in range(self.options['MAX_IN_FLIGHT'])]
+
+    def _free_slots(self, exam_date):
+        return self.options['MAX_IN_FLIGHT'] - len(cache.get_many(self._slot_keys(exam_date)))
+
+    def _acquire_slot(self, exam_date):
+        for slot, key in enumerate(self._slot_keys(exam_date)):
+            if cache.add(key, 1, timeout=self.options['SLOT_TIMEOUT']):
+                return slot
+        return None
+
+    def _estimate_wait(self, position):
+        service_seconds = cache.get(SERVICE_SECONDS_KEY, self.options['SERVICE_SECONDS'])
+        return math.ceil(position / self.options['MAX_IN_FLIGHT']) * service_seconds
+
+    def _retry_after(self, position):
+        return min(self.options['POLL_INTERVAL_SECONDS'], max(1, math.ceil(self._estimate_wait(position))))
@@ -0,0 +1,65 @@
+"""
+어드민 분석용 예약 현황 캐시
+
+날짜 × 시간대 이용 현황은 조회 범위별로 캐시하며, 예약이 변경되면 버전을 올려 이전 범위의 캐시를 모두 무효화한다.
+(범위별 키를 따로 찾아 지울 필요 없이 이전 버전 키는 TTL 이 지나면 사라짐)
+"""
+from django.core.cache import cache
+from django.db import transaction
+
+HEATMAP_VERSION_KEY = 'analytics:heatmap:version'
+HEATMAP_CACHE_KEY = 'analytics:heatmap:{version}:{start}:{end}'
+HEATMAP_CACHE_TTL = 60 * 10
+
+# 한 번에 조회할 수 있는 최대 기간(일), 기본 조회 기간(일)
+HEATMAP_MAX_DAYS = 366
+HEATMAP_DEFAULT_DAYS = 90
+
+
+def heatmap_cache_key(start_date, end_date):
+    version = cache.get(HEATMAP_VERSION_KEY, 0)
+    return HEATMAP_CACHE_KEY.format(version=version, start=start_date.isoformat(), end=end_date.isoformat())
+
+
+def _bump_heatmap_version():
+    cache.add(HEATMAP_VERSION_KEY, 0, timeout=None)
+    cache.incr(HEATMAP_VERSION_KEY)
+
+
+def invalidate_heatmap():
+    """
+    예약 변경 시 이용 현황 캐시 무효화
+
+    트랜잭션이 커밋된 뒤 무효화해야 커밋 전 데이터로 다시 캐시되지 않는다.
+    """
+    transaction.on_commit(_bump_heatmap_version)
+
+
+def encode_heatmap(heatmap, compact=False):
+    """
+    이용 현황 응답 데이터
+
+    - 기본: 날짜별 {'date', 'confirmed', 'pending'} 목록 (시간대 순서는 hours)
+    - compact: 날짜 인덱스(start 부터 하루씩)와 날짜 × 시간대 순서로 펼친 정수 배열
+    """
+    data = {
+        'start': heatmap['start'].isoformat(),
+        'end': heatmap['end'].isoformat(),
+        'hours': heatmap['hours'],
+    }
+
+    if compact:
+        data['days'] = len(heatmap['dates'])
+        data['confirmed'] = [value for row in heatmap['confirmed'] for value in row]
+        data['pending'] = [value for row in heatmap['pending'] for value in row]
+        return data
+
+    data['dates'] = [
+        {
+            'date': exam_date.isoformat(),
+            'confirmed': confirmed,
+            'pending': pending,
+        }
+        for exam_date, confirmed, pending in zip(heatmap['dates'], heatmap['confirmed'], heatmap['pending'])
+    ]
+    return data
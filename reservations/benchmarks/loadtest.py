@@ -0,0 +1,289 @@
+"""
+예약 API 부하 테스트
+
+N개의 기업 사용자와 M개의 예약을 생성한 뒤 설정한 트래픽 비율(예약 가능 시간 조회, 예약 생성,
+어드민 확정, 목록 페이지 조회)에 맞춰 WSGI/ASGI 핸들러로 요청을 동시에 보낸다.
+엔드포인트별 처리량, p50/p95/p99 응답 시간, 요청당 쿼리 수를 측정한다.
+응답 시간 백분위는 성공(2xx) 응답만으로 계산하고, 실패 응답은 오류율로 따로 집계한다.
+오류율이 max_error_rate 를 넘는 엔드포인트는 리포트의 failed_endpoints 에 기록한다.
+"""
+import asyncio
+import contextvars
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test.client import RequestFactory
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from reservations.benchmarks.utils import compare_metrics
+from reservations.constants import OPERATION_START_TIME, OPERATION_END_TIME, RESERVATION_MIN_DAYS_BEFORE
+from reservations.models import Reservation
+from reservations.seeding import ReservationSeeder, SEED_PASSWORD
+from users.models import User
+
+# 엔드포인트별 기본 트래픽 비율
+DEFAULT_TRAFFIC_MIX = {
+    'available_times': 60,
+    'create': 15,
+    'confirm': 5,
+    'list': 20,
+}
+
+# 현재 요청의 쿼리 수 집계용 (ASGI 핸들러의 sync_to_async 스레드로도 전파된다)
+_query_counter = contextvars.ContextVar('loadtest_query_counter', default=None)
+
+
+def _count_queries(execute, sql, params, many, context):
+    counter = _query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+    return execute(sql, params, many, context)
+
+
+def _install_query_counter(sender, connection, **kwargs):
+    if _count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_queries)
+
+
+def percentile(sorted_values, pct):
+    """정렬된 값 목록의 백분위 수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LoadTest:
+    def __init__(self, companies=100, reservations=10000, requests=2000, workers=32, days=30,
+                 traffic_mix=None, interface='wsgi', seed=0, max_error_rate=0.01):
+        self.companies = companies
+        self.reservations = reservations
+        self.requests = requests
+        self.workers = workers
+        self.days = days
+        self.traffic_mix = traffic_mix or DEFAULT_TRAFFIC_MIX
+        self.interface = interface
+        self.seed = seed
+        self.max_error_rate = max_error_rate
+        self.rng = random.Random(seed)
+        self.factory = RequestFactory()
+
+        self.company_tokens = []
+        self.admin_token = None
+        self.pending_ids = []
+        self.exam_dates = []
+
+    def setup(self):
+        """데이터 생성 및 인증 토큰 발급"""
+        start_date = timezone.now().date() + timedelta(days=RESERVATION_MIN_DAYS_BEFORE + 1)
+        self.exam_dates = [start_date + timedelta(days=i) for i in range(self.days)]
+
+        seeder = ReservationSeeder(seed=self.seed)
+        company_ids = seeder.seed_companies(self.companies, prefix='loadtest')
+        seeder.seed_reservations(self.reservations, company_ids, days=self.days, start_date=start_date)
+        admin = User.objects.create(email='loadtest_admin@test.com', password=make_password(SEED_PASSWORD),
+                                    name='loadtest_admin', role='ADMIN')
+
+        company_users = list(User.objects.filter(id__in=company_ids))
+
+        self.company_tokens = [str(AccessToken.for_user(user)) for user in company_users]
+        self.admin_token = str(AccessToken.for_user(admin))
+        self.pending_ids = list(Reservation.objects.filter(status='PENDING').values_list('id', flat=True))
+
+    def build_requests(self):
+        """트래픽 비율에 맞춰 (endpoint, method, path, body, token) 목록 생성"""
+        # 확정할 대기 예약이 없으면 확정 요청은 보내지 않음
+        endpoints = [name for name in self.traffic_mix if name != 'confirm' or self.pending_ids]
+        weights = [self.traffic_mix[name] for name in endpoints]
+        planned = []
+
+        for endpoint in self.rng.choices(endpoints, weights=weights, k=self.requests):
+            if endpoint == 'available_times':
+                date = self.rng.choice(self.exam_dates).isoformat()
+                planned.append((endpoint, 'GET', f'/api/reservations/available-times/?date={date}', None,
+                                self.rng.choice(self.company_tokens)))
+            elif endpoint == 'create':
+                start_hour = self.rng.randrange(OPERATION_START_TIME.hour, OPERATION_END_TIME.hour)
+                body = {
+                    'exam_date': self.rng.choice(self.exam_dates).isoformat(),
+                    'start_time': dt_time(start_hour, 0).isoformat(),
+                    'end_time': dt_time(start_hour + 1, 0).isoformat(),
+                    'attendees': self.rng.randint(1, 50),
+                }
+                planned.append((endpoint, 'POST', '/api/reservations/', body, self.rng.choice(self.company_tokens)))
+            elif endpoint == 'confirm':
+                reservation_id = self.rng.choice(self.pending_ids)
+                planned.append((endpoint, 'PATCH', f'/api/reservations/{reservation_id}/', {'status': 'CONFIRMED'},
+                                self.admin_token))
+            elif endpoint == 'list':
+                page = self.rng.randint(1, 3)
+                planned.append((endpoint, 'GET', f'/api/reservations/?page={page}', None,
+                                self.rng.choice(self.company_tokens + [self.admin_token])))
+
+        return planned
+
+    def run(self):
+        """요청을 실행하고 결과 리포트를 반환"""
+        connection_created.connect(_install_query_counter)
+        for connection in connections.all():
+            _install_query_counter(None, connection)
+
+        planned = self.build_requests()
+        started = time.perf_counter()
+        try:
+            if self.interface == 'asgi':
+                samples = asyncio.run(self._run_asgi(planned))
+            else:
+                samples = self._run_wsgi(planned)
+        finally:
+            connection_created.disconnect(_install_query_counter)
+        elapsed = time.perf_counter() - started
+
+        return self.report(samples, elapsed)
+
+    def _run_wsgi(self, planned):
+        handler = WSGIHandler()
+
+        def send(item):
+            endpoint, method, path, body, token = item
+            request = self.factory.generic(
+                method, path,
+                data=json.dumps(body) if body is not None else '',
+                content_type='application/json',
+                HTTP_AUTHORIZATION=f'Bearer {token}',
+            )
+            status_holder = []
+
+            def start_response(status, headers, exc_info=None):
+                status_holder.append(int(status.split(' ', 1)[0]))
+
+            counter = [0]
+            _query_counter.set(counter)
+            request_started = time.perf_counter()
+            response = handler(request.environ, start_response)
+            b''.join(response)
+            response.close()
+            return endpoint, status_holder[0], time.perf_counter() - request_started, counter[0]
+
+        def send_in_context(item):
+            # 스레드마다 독립된 context 에서 쿼리 수 집계
+            return contextvars.copy_context().run(send, item)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            samples = list(executor.map(send_in_context, planned))
+
+        for connection in connections.all():
+            connection.close()
+        return samples
+
+    async def _run_asgi(self, planned):
+        handler = ASGIHandler()
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def send(item):
+            endpoint, method, path, body, token = item
+            path, _, query_string = path.partition('?')
+            payload = json.dumps(body).encode() if body is not None else b''
+            scope = {
+                'type': 'http',
+                'asgi': {'version': '3.0'},
+                'http_version': '1.1',
+                'method': method,
+                'scheme': 'http',
+                'path': path,
+                'raw_path': path.encode(),
+                'query_string': query_string.encode(),
+                'root_path': '',
+                'headers': [
+                    (b'host', b'testserver'),
+                    (b'authorization', f'Bearer {token}'.encode()),
+                    (b'content-type', b'application/json'),
+                    (b'content-length', str(len(payload)).encode()),
+                ],
+                'client': ('127.0.0.1', 0),
+                'server': ('testserver', 80),
+            }
+            status_holder = []
+
+            async def receive():
+                return {'type': 'http.request', 'body': payload, 'more_body': False}
+
+            async def send_message(message):
+                if message['type'] == 'http.response.start':
+                    status_holder.append(message['status'])
+
+            async with semaphore:
+                counter = [0]
+                _query_counter.set(counter)
+                request_started = time.perf_counter()
+                await handler(scope, receive, send_message)
+                return endpoint, status_holder[0], time.perf_counter() - request_started, counter[0]
+
+        return await asyncio.gather(*(asyncio.create_task(send(item)) for item in planned))
+
+    def report(self, samples, elapsed):
+        """엔드포인트별 처리량, 성공 응답의 응답 시간 백분위, 오류율, 쿼리 수 집계"""
+        by_endpoint = {}
+        for endpoint, status_code, latency, queries in samples:
+            by_endpoint.setdefault(endpoint, []).append((status_code, latency, queries))
+
+        endpoints = {}
+        failed_endpoints = []
+        for endpoint, rows in sorted(by_endpoint.items()):
+            # 실패 응답은 처리 과정이 달라 응답 시간이 섞이지 않도록 성공 응답만으로 계산
+            latencies = sorted(latency for status_code, latency, _ in rows if 200 <= status_code < 300)
+            errors = len(rows) - len(latencies)
+            status_counts = {}
+            for status_code, _, _ in rows:
+                status_counts[str(status_code)] = status_counts.get(str(status_code), 0) + 1
+            endpoints[endpoint] = {
+                'requests': len(rows),
+                'throughput_rps': round(len(rows) / elapsed, 2),
+                'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+                'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+                'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+                'error_rate': round(errors / len(rows), 4),
+                'queries_per_request': round(sum(queries for _, _, queries in rows) / len(rows), 2),
+                'status_counts': status_counts,
+            }
+            if errors / len(rows) > self.max_error_rate:
+                failed_endpoints.append(endpoint)
+
+        errors = sum(1 for _, status_code, _, _ in samples if not 200 <= status_code < 300)
+
+        return {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'config': {
+                'interface': self.interface,
+                'companies': self.companies,
+                'reservations': self.reservations,
+                'requests': self.requests,
+                'workers': self.workers,
+                'days': self.days,
+                'traffic_mix': self.traffic_mix,
+                'max_error_rate': self.max_error_rate,
+            },
+            'elapsed_seconds': round(elapsed, 3),
+            'throughput_rps': round(len(samples) / elapsed, 2) if elapsed else 0.0,
+            'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+            'failed_endpoints': failed_endpoints,
+            'endpoints': endpoints,
+        }
+
+
+def compare_reports(baseline, current):
+    """기준 리포트 대비 엔드포인트별 변화율(%)"""
+    return compare_metrics(
+        baseline.get('endpoints', {}),
+        current['endpoints'],
+        ('throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms', 'error_rate', 'queries_per_request'),
+    )
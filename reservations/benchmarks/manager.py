@@ -0,0 +1,192 @@
+"""
+ReservationManager 수용 인원 계산 경로 마이크로 벤치마크
+
+날짜별 확정 예약 수, 예약 시간 단위(슬롯 단위), 겹침 비율을 조합한 데이터셋마다
+_get_available_slots, _check_available_attendees, create_reservation, update_reservation 를
+반복 실행해 초당 실행 횟수, tracemalloc 메모리 할당량, 쿼리 수를 측정한다.
+
+overlap_query_db 와 overlap_query_python 은 대상 시간대와 겹치는 확정 예약 조회를
+DB 조건(PostgreSQL 은 time_window GiST 인덱스, 그 외는 시간 비교 조건)과
+날짜 전체 조회 후 Python 비교로 각각 실행해 예약이 많은 날짜에서의 차이를 비교한다.
+"""
+import itertools
+import statistics
+import time
+import tracemalloc
+from datetime import time as dt_time, timedelta
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from reservations import time_ranges
+from reservations.constants import OPERATION_END_TIME, RESERVATION_MIN_DAYS_BEFORE
+from reservations.managers import ReservationManager
+from reservations.models import Reservation
+from users.models import User
+
+# 벤치마크 대상 시간대
+TARGET_START_TIME = dt_time(10, 0)
+TARGET_END_TIME = dt_time(12, 0)
+
+DEFAULT_RESERVATIONS_PER_DATE = (100, 1000, 10000)
+DEFAULT_SLOT_HOURS = (1, 3)
+DEFAULT_OVERLAP_DENSITIES = (0.1, 0.9)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class ManagerBenchmark:
+    def __init__(self, reservations_per_date=DEFAULT_RESERVATIONS_PER_DATE, slot_hours=DEFAULT_SLOT_HOURS,
+                 overlap_densities=DEFAULT_OVERLAP_DENSITIES, iterations=50):
+        self.reservations_per_date = reservations_per_date
+        self.slot_hours = slot_hours
+        self.overlap_densities = overlap_densities
+        self.iterations = iterations
+        self.manager = ReservationManager()
+        self.exam_date = timezone.now().date() + timedelta(days=RESERVATION_MIN_DAYS_BEFORE + 1)
+
+    def setup_users(self):
+        self.company_user, _ = User.objects.get_or_create(
+            email='benchmark_company@test.com',
+            defaults={'name': 'benchmark_company', 'role': 'COMPANY'},
+        )
+        self.admin_user, _ = User.objects.get_or_create(
+            email='benchmark_admin@test.com',
+            defaults={'name': 'benchmark_admin', 'role': 'ADMIN'},
+        )
+
+    def build_dataset(self, count, slot_hours, overlap_density):
+        """
+        벤치마크 날짜에 확정 예약 생성
+
+        overlap_density 비율만큼은 대상 시간대(10:00 ~ 12:00)와 겹치도록,
+        나머지는 겹치지 않는 오후 시간대에 slot_hours 길이로 배치한다.
+        """
+        Reservation.objects.all().delete()
+
+        overlapping = int(count * overlap_density)
+        afternoon_start = TARGET_END_TIME.hour + 1
+        afternoon_hours = max(OPERATION_END_TIME.hour - slot_hours - afternoon_start + 1, 1)
+        rows = []
+        for index in range(count):
+            if index < overlapping:
+                start_hour = TARGET_START_TIME.hour + index % 2
+                end_hour = min(start_hour + slot_hours, OPERATION_END_TIME.hour)
+            else:
+                start_hour = afternoon_start + index % afternoon_hours
+                end_hour = min(start_hour + slot_hours, OPERATION_END_TIME.hour)
+            rows.append(Reservation(
+                company_customer=self.company_user,
+                exam_date=self.exam_date,
+                start_time=dt_time(start_hour, 0),
+                end_time=dt_time(end_hour, 0),
+                attendees=1,
+                status='CONFIRMED',
+            ))
+        Reservation.objects.bulk_create(rows, batch_size=5000)
+
+        self.pending_reservation = Reservation.objects.create(
+            company_customer=self.company_user,
+            exam_date=self.exam_date,
+            start_time=TARGET_START_TIME,
+            end_time=TARGET_END_TIME,
+            attendees=1,
+            status='PENDING',
+        )
+
+    def operations(self):
+        """측정할 (이름, 함수) 목록. 쓰기 작업은 데이터셋이 바뀌지 않도록 롤백한다."""
+        manager = self.manager
+
+        def rolled_back(func):
+            def run():
+                try:
+                    with transaction.atomic():
+                        func()
+                        raise _Rollback()
+                except _Rollback:
+                    pass
+            return run
+
+        def update():
+            reservation = Reservation.objects.get(id=self.pending_reservation.id)
+            manager.update_reservation(reservation, self.admin_user, attendees=2)
+
+        confirmed = Reservation.objects.filter(status='CONFIRMED', exam_date=self.exam_date)
+
+        def overlap_db():
+            return list(confirmed.filter(
+                time_ranges.overlap_filter(connection, self.exam_date, TARGET_START_TIME, TARGET_END_TIME)
+            ).values('start_time', 'end_time', 'attendees'))
+
+        def overlap_python():
+            return [
+                row for row in confirmed.values('start_time', 'end_time', 'attendees')
+                if row['start_time'] < TARGET_END_TIME and row['end_time'] > TARGET_START_TIME
+            ]
+
+        return [
+            ('_get_available_slots', lambda: manager._get_available_slots(self.exam_date)),
+            ('_check_available_attendees',
+             lambda: manager._check_available_attendees(self.exam_date, TARGET_START_TIME, TARGET_END_TIME)),
+            ('create_reservation', rolled_back(
+                lambda: manager.create_reservation(self.company_user, self.exam_date, TARGET_START_TIME,
+                                                   TARGET_END_TIME, 1))),
+            ('update_reservation', rolled_back(update)),
+            ('overlap_query_db', overlap_db),
+            ('overlap_query_python', overlap_python),
+        ]
+
+    def measure(self, func):
+        # 워밍업
+        func()
+
+        durations = []
+        for _ in range(self.iterations):
+            started = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - started)
+
+        with CaptureQueriesContext(connection) as queries:
+            func()
+
+        # tracemalloc 은 실행 속도에 영향을 주므로 시간 측정과 분리해서 실행
+        tracemalloc.start()
+        snapshot_before = tracemalloc.take_snapshot()
+        func()
+        snapshot_after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        allocated = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename')
+                        if stat.size_diff > 0)
+
+        mean = statistics.mean(durations)
+        return {
+            'iterations': self.iterations,
+            'ops_per_sec': round(1 / mean, 2) if mean else 0.0,
+            'mean_ms': round(mean * 1000, 4),
+            'p50_ms': round(statistics.median(durations) * 1000, 4),
+            'allocated_bytes': allocated,
+            'peak_bytes': peak,
+            'queries': len(queries.captured_queries),
+        }
+
+    def run(self):
+        """
+        모든 데이터셋 조합에 대해 측정
+
+        Returns:
+            {"<operation>[reservations=..,slot_hours=..,overlap=..]": {metric: value}}
+        """
+        self.setup_users()
+        results = {}
+        for count, slot_hours, overlap_density in itertools.product(
+                self.reservations_per_date, self.slot_hours, self.overlap_densities):
+            self.build_dataset(count, slot_hours, overlap_density)
+            for name, func in self.operations():
+                key = f'{name}[reservations={count},slot_hours={slot_hours},overlap={overlap_density}]'
+                results[key] = self.measure(func)
+        return results
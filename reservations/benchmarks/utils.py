@@ -0,0 +1,43 @@
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+
+@contextmanager
+def test_database():
+    """운영 데이터베이스를 건드리지 않도록 테스트 데이터베이스를 생성하고 종료 시 삭제"""
+    setup_test_environment(debug=False)
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def compare_metrics(baseline, current, metrics):
+    """
+    기준 결과 대비 항목별 변화율(%)
+
+    Args:
+        baseline: {name: {metric: value}}
+        current: {name: {metric: value}}
+        metrics: 비교할 metric 이름 목록
+
+    Returns:
+        {name: {metric: {'baseline': .., 'current': .., 'change_pct': ..}}}
+    """
+    diff = {}
+    for name, values in current.items():
+        base_values = baseline.get(name)
+        if base_values is None:
+            continue
+        diff[name] = {}
+        for metric in metrics:
+            base_value = base_values.get(metric, 0)
+            value = values.get(metric, 0)
+            change = round((value - base_value) / base_value * 100, 2) if base_value else None
+            diff[name][metric] = {'baseline': base_value, 'current': value, 'change_pct': change}
+    return diff
@@ -0,0 +1,207 @@
+"""
+데이터베이스 트리거로 시간대별 확정 인원 제한
+
+settings.RESERVATION_CAPACITY_TRIGGERS 가 켜져 있으면 reservations 테이블에 트리거를 설치해
+확정(CONFIRMED) 예약을 추가, 수정할 때 겹치는 1시간 슬롯마다 확정 인원과 만료되지 않은 확보(reservation_holds) 인원의
+합계가 MAX_ATTENDEES_PER_TIMESLOT 을 넘지 않는지 데이터베이스에서 확인한다.
+(ReservationManager._check_available_attendees 와 같은 기준)
+다른 애플리케이션 인스턴스나 직접 실행한 SQL 로 변경하는 경우에도 적용된다.
+- PostgreSQL: PL/pgSQL 트리거 함수. 시험 날짜별 advisory lock 으로 동시에 확정하는 트랜잭션을 순서대로 확인
+- SQLite: BEFORE INSERT/UPDATE 트리거 (쓰기 트랜잭션이 하나뿐이므로 lock 불필요)
+
+제한을 넘으면 CAPACITY_ERROR 메시지의 IntegrityError 가 발생하며, ReservationManager 가 ReservationAttendeesException 으로 변환한다.
+트리거에는 설치 시점의 운영 시간, 최대 인원이 들어가므로 값이 바뀌면 manage_capacity_triggers 로 다시 설치한다.
+
+마이그레이션 이후에 설정을 켠 경우 등 트리거가 없을 수 있으므로, ReservationManager 는 is_active 로
+트리거가 실제로 설치되어 있는 경우에만 저장 전 확인 조회를 생략한다.
+"""
+from django.conf import settings
+from django.db import IntegrityError
+
+from reservations.constants import OPERATION_START_TIME, OPERATION_END_TIME, MAX_ATTENDEES_PER_TIMESLOT
+
+# 마이그레이션에서도 사용하므로 모델을 import 하지 않고 테이블 이름을 직접 지정
+TABLE = 'reservations'
+HOLD_TABLE = 'reservation_holds'
+FUNCTION = f'{TABLE}_check_capacity'
+CAPACITY_ERROR = 'reservation_capacity_exceeded'
+
+HOURS = list(range(OPERATION_START_TIME.hour, OPERATION_END_TIME.hour))
+
+
+def is_enabled(connection):
+    return connection.vendor in ('postgresql', 'sqlite') and getattr(settings, 'RESERVATION_CAPACITY_TRIGGERS', False)
+
+
+def is_installed(connection):
+    """
+    트리거가 실제로 설치되어 있는지 여부
+
+    데이터베이스 연결마다 한 번만 조회하며, install / uninstall 하면 다시 조회한다.
+    """
+    connection.ensure_connection()
+    cached = getattr(connection, '_capacity_triggers_installed', None)
+    if cached is not None and cached[0] is connection.connection:
+        return cached[1]
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('SELECT 1 FROM pg_trigger WHERE tgname = %s AND tgrelid = to_regclass(%s)', [FUNCTION, TABLE])
+        elif connection.vendor == 'sqlite':
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = %s", [f'{FUNCTION}_insert'])
+        else:
+            return False
+        installed = cursor.fetchone() is not None
+
+    connection._capacity_triggers_installed = (connection.connection, installed)
+    return installed
+
+
+def _forget_installed(connection):
+    # django.db.connection(ConnectionProxy)으로 호출해도 실제 연결 객체의 속성이 지워지도록 delattr 사용
+    try:
+        del connection._capacity_triggers_installed
+    except AttributeError:
+        pass
+
+
+def is_active(connection):
+    """설정이 켜져 있고 트리거가 설치되어 있어 데이터베이스에서 확정 인원을 제한하는지 여부"""
+    return is_enabled(connection) and is_installed(connection)
+
+
+def is_capacity_error(error):
+    return isinstance(error, IntegrityError) and CAPACITY_ERROR in str(error)
+
+
+def _postgresql_install():
+    return [
+        f"""
+        CREATE OR REPLACE FUNCTION {FUNCTION}() RETURNS trigger AS $$
+        DECLARE
+            slot_start time;
+            confirmed bigint;
+            held bigint;
+        BEGIN
+            IF NEW.status <> 'CONFIRMED' THEN
+                RETURN NEW;
+            END IF;
+
+            -- 같은 날짜를 동시에 확정하는 트랜잭션이 서로의 예약을 보지 못하고 통과하지 않도록 순서대로 확인
+            PERFORM pg_advisory_xact_lock(hashtext('{FUNCTION}:' || NEW.exam_date::text));
+
+            FOR slot_hour IN {HOURS[0]}..{HOURS[-1]} LOOP
+                slot_start := make_time(slot_hour, 0, 0);
+                IF NEW.start_time < slot_start + interval '1 hour' AND NEW.end_time > slot_start THEN
+                    SELECT COALESCE(SUM(attendees), 0) INTO confirmed
+                    FROM {TABLE}
+                    WHERE exam_date = NEW.exam_date
+                      AND status = 'CONFIRMED'
+                      AND id <> NEW.id
+                      AND start_time < slot_start + interval '1 hour'
+                      AND end_time > slot_start;
+
+                    -- 만료되지 않은 확보 인원 (expires_at 은 세션 시간대 기준 timestamp)
+                    SELECT COALESCE(SUM(attendees), 0) INTO held
+                    FROM {HOLD_TABLE}
+                    WHERE exam_date = NEW.exam_date
+                      AND expires_at > LOCALTIMESTAMP
+                      AND start_time < slot_start + interval '1 hour'
+                      AND end_time > slot_start;
+
+                    IF confirmed + held + NEW.attendees > {MAX_ATTENDEES_PER_TIMESLOT} THEN
+                        RAISE EXCEPTION '{CAPACITY_ERROR}' USING ERRCODE = 'check_violation';
+                    END IF;
+                END IF;
+            END LOOP;
+
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        f'DROP TRIGGER IF EXISTS {FUNCTION} ON {TABLE}',
+        f"""
+        CREATE TRIGGER {FUNCTION}
+        BEFORE INSERT OR UPDATE OF exam_date, start_time, end_time, attendees, status ON {TABLE}
+        FOR EACH ROW EXECUTE FUNCTION {FUNCTION}()
+        """,
+    ]
+
+
+def _postgresql_uninstall():
+    return [
+        f'DROP TRIGGER IF EXISTS {FUNCTION} ON {TABLE}',
+        f'DROP FUNCTION IF EXISTS {FUNCTION}()',
+    ]
+
+
+def _sqlite_check():
+    # 트리거 안에서는 WITH 를 사용할 수 없으므로 슬롯 목록을 직접 나열
+    slots = ' UNION ALL '.join(
+        f"SELECT '{hour:02d}:00:00' AS slot_start, '{hour + 1:02d}:00:00' AS slot_end" for hour in HOURS
+    )
+    return f"""
+        SELECT RAISE(ABORT, '{CAPACITY_ERROR}')
+        WHERE EXISTS (
+            SELECT 1 FROM ({slots}) AS slots
+            WHERE NEW.start_time < slots.slot_end AND NEW.end_time > slots.slot_start
+              AND NEW.attendees + (
+                  SELECT COALESCE(SUM(attendees), 0) FROM {TABLE}
+                  WHERE exam_date = NEW.exam_date
+                    AND status = 'CONFIRMED'
+                    AND id <> NEW.id
+                    AND start_time < slots.slot_end
+                    AND end_time > slots.slot_start
+              ) + (
+                  SELECT COALESCE(SUM(attendees), 0) FROM {HOLD_TABLE}
+                  WHERE exam_date = NEW.exam_date
+                    AND expires_at > strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')
+                    AND start_time < slots.slot_end
+                    AND end_time > slots.slot_start
+              ) > {MAX_ATTENDEES_PER_TIMESLOT}
+        );
+    """
+
+
+def _sqlite_install():
+    return [
+        *_sqlite_uninstall(),
+        f"""
+        CREATE TRIGGER {FUNCTION}_insert BEFORE INSERT ON {TABLE}
+        WHEN NEW.status = 'CONFIRMED'
+        BEGIN {_sqlite_check()} END
+        """,
+        f"""
+        CREATE TRIGGER {FUNCTION}_update BEFORE UPDATE OF exam_date, start_time, end_time, attendees, status ON {TABLE}
+        WHEN NEW.status = 'CONFIRMED'
+        BEGIN {_sqlite_check()} END
+        """,
+    ]
+
+
+def _sqlite_uninstall():
+    return [
+        f'DROP TRIGGER IF EXISTS {FUNCTION}_insert',
+        f'DROP TRIGGER IF EXISTS {FUNCTION}_update',
+    ]
+
+
+def install(connection):
+    """확정 인원 제한 트리거 설치 (이미 있으면 다시 생성)"""
+    statements = {'postgresql': _postgresql_install, 'sqlite': _sqlite_install}.get(connection.vendor)
+    if statements is None:
+        return
+    with connection.cursor() as cursor:
+        for statement in statements():
+            cursor.execute(statement)
+    _forget_installed(connection)
+
+
+def uninstall(connection):
+    statements = {'postgresql': _postgresql_uninstall, 'sqlite': _sqlite_uninstall}.get(connection.vendor)
+    if statements is None:
+        return
+    with connection.cursor() as cursor:
+        for statement in statements():
+            cursor.execute(statement)
+    _forget_installed(connection)
@@ -3,3 +3,10 @@ STATUS_CHOICES = [
     ('CONFIRMED', '확정'),
     # 새 상태 추가
 ]
+
+CHANGE_OPERATION_CHOICES = [
+    ('CREATE', '생성'),
+    ('UPDATE', '수정'),
+    ('DELETE', '삭제'),
+    ('ARCHIVE', '보관'),
+]
@@ -0,0 +1,86 @@
+"""
+예약 가능 인원 확인과 예약 추가를 한 번의 SQL 로 처리
+
+INSERT ... SELECT ... WHERE NOT EXISTS (<인원을 넘는 슬롯>) 로, 요청한 시간대와 겹치는 1시간 슬롯마다
+확정 예약 인원 + 만료되지 않은 확보 인원 + 요청 인원이 MAX_ATTENDEES_PER_TIMESLOT 이하인 경우에만 예약을 추가한다.
+(ReservationManager._check_available_attendees 와 같은 기준)
+
+조회 후 비교, 추가로 나누어 처리할 때보다 왕복 횟수가 줄고 확정 예약 전체를 가져오지 않으며, 조회와 추가 사이의 빈틈이 없다.
+추가되지 않은 경우(예약 가능 인원 초과)에만 오류 메시지에 사용할 예약 가능 인원을 따로 조회한다.
+PostgreSQL, SQLite 외의 데이터베이스는 기존 방식(조회 후 추가)을 사용한다.
+"""
+from reservations.constants import OPERATION_START_TIME, OPERATION_END_TIME, MAX_ATTENDEES_PER_TIMESLOT
+from reservations.models import Reservation, ReservationHold
+
+HOURS = list(range(OPERATION_START_TIME.hour, OPERATION_END_TIME.hour))
+
+
+def is_supported(connection):
+    return connection.vendor in ('postgresql', 'sqlite')
+
+
+def _time_literal(connection, hour):
+    # PostgreSQL 은 UNION 한 문자열 상수를 text 로 처리하므로 time 으로 변환
+    if connection.vendor == 'postgresql':
+        return f"TIME '{hour:02d}:00:00'"
+    return f"'{hour:02d}:00:00'"
+
+
+def _slots_sql(connection):
+    return ' UNION ALL '.join(
+        f'SELECT {_time_literal(connection, hour)} AS slot_start, {_time_literal(connection, hour + 1)} AS slot_end'
+        for hour in HOURS
+    )
+
+
+def insert_if_available(connection, company_customer_id, exam_date, start_time, end_time, attendees, now):
+    """
+    예약 가능 인원 안에서만 대기(PENDING) 예약 추가
+
+    Args:
+        connection: 사용할 데이터베이스 연결
+        now: 생성, 수정 일시 (확보 인원 만료 기준 시각)
+
+    Returns:
+        추가한 예약 ID (예약 가능 인원을 넘어 추가하지 않은 경우 None)
+    """
+    ops = connection.ops
+    exam_date = ops.adapt_datefield_value(exam_date)
+    start_time = ops.adapt_timefield_value(start_time)
+    end_time = ops.adapt_timefield_value(end_time)
+    now = ops.adapt_datetimefield_value(now)
+
+    returning = connection.features.can_return_columns_from_insert
+    sql = f"""
+        INSERT INTO {Reservation._meta.db_table}
+            (company_customer_id, exam_date, start_time, end_time, attendees, status, created_at, updated_at)
+        SELECT %s, %s, %s, %s, %s, 'PENDING', %s, %s
+        WHERE %s <= {MAX_ATTENDEES_PER_TIMESLOT} AND NOT EXISTS (
+            SELECT 1 FROM ({_slots_sql(connection)}) AS slots
+            WHERE %s < slots.slot_end AND %s > slots.slot_start
+              AND %s
+                  + (SELECT COALESCE(SUM(r.attendees), 0) FROM {Reservation._meta.db_table} AS r
+                     WHERE r.exam_date = %s AND r.status = 'CONFIRMED'
+                       AND r.start_time < slots.slot_end AND r.end_time > slots.slot_start)
+                  + (SELECT COALESCE(SUM(h.attendees), 0) FROM {ReservationHold._meta.db_table} AS h
+                     WHERE h.exam_date = %s AND h.expires_at > %s
+                       AND h.start_time < slots.slot_end AND h.end_time > slots.slot_start)
+                  > {MAX_ATTENDEES_PER_TIMESLOT}
+        )
+        {'RETURNING id' if returning else ''}
+    """
+    params = [
+        company_customer_id, exam_date, start_time, end_time, attendees, now, now,
+        attendees,
+        start_time, end_time,
+        attendees,
+        exam_date,
+        exam_date, now,
+    ]
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        if returning:
+            row = cursor.fetchone()
+            return row[0] if row else None
+        return cursor.lastrowid if cursor.rowcount == 1 else None
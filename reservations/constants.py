@@ -8,4 +8,42 @@ OPERATION_START_TIME = time(9, 0)
 OPERATION_END_TIME = time(18, 0)
 
 # 동 시간대 최대 인원
-MAX_ATTENDEES_PER_TIMESLOT = 50000
\ No newline at end of file
+MAX_ATTENDEES_PER_TIMESLOT = 50000
+
+# 시험 날짜 기준 예약 보관 기간 (지난 예약은 보관 테이블로 이동)
+RESERVATION_ARCHIVE_RETENTION_DAYS = 365
+
+# 예약 가능 인원 확보 유지 시간(분)
+RESERVATION_HOLD_TTL_MINUTES = 5
+
+# 확보 생성 시 함께 정리하는 만료된 확보 정보 최대 수
+RESERVATION_HOLD_SWEEP_BATCH_SIZE = 100
+
+# 예약 변경 기록(outbox) 조회 수, 보관 기간(일)
+RESERVATION_CHANGE_PAGE_SIZE = 500
+RESERVATION_CHANGE_MAX_PAGE_SIZE = 5000
+RESERVATION_CHANGE_RETENTION_DAYS = 7
+
+# 예약 변경분 동기화 조회 수, 삭제 기록 보관 기간(일)
+RESERVATION_SYNC_PAGE_SIZE = 500
+RESERVATION_SYNC_MAX_PAGE_SIZE = 5000
+RESERVATION_TOMBSTONE_RETENTION_DAYS = 30
+
+# 예약 일괄 삭제 최대 수
+RESERVATION_BULK_DELETE_MAX_SIZE = 1000
+
+# 예약 목록 정렬 기준별 정렬 필드
+# 각 정렬은 같은 순서(또는 역순)의 인덱스로 조회하며, 인덱스가 없는 정렬은 추가하지 않는다.
+# (어드민 전체 조회는 정렬 필드 인덱스, 기업 사용자/기업 조건 조회는 company_customer 로 시작하는 인덱스 사용)
+RESERVATION_LIST_SORTS = {
+    '-exam_date': ('-exam_date', 'start_time', 'id'),
+    'exam_date': ('exam_date', 'start_time', 'id'),
+    'attendees': ('attendees', 'id'),
+    '-attendees': ('-attendees', '-id'),
+    'updated_at': ('updated_at', 'id'),
+    '-updated_at': ('-updated_at', '-id'),
+}
+RESERVATION_LIST_DEFAULT_SORT = '-exam_date'
+
+# 예약 일괄 조회 최대 수
+RESERVATION_BATCH_FETCH_MAX_SIZE = 100
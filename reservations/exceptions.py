@@ -30,3 +30,33 @@ class ConfirmedReservationModificationException(APIException):
 class InvalidDateException(APIException):
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = "날짜가 유효하지 않습니다."
+
+
+class ReservationQueueTokenException(APIException):
+    status_code = status.HTTP_404_NOT_FOUND
+    default_detail = "대기열 정보를 찾을 수 없습니다."
+
+
+class ReservationHoldNotFoundException(APIException):
+    status_code = status.HTTP_404_NOT_FOUND
+    default_detail = "확보한 예약 인원 정보를 찾을 수 없거나 만료되었습니다."
+
+
+class ReservationHoldMismatchException(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = "확보한 예약 인원 정보와 예약 내용이 일치하지 않습니다."
+
+
+class InvalidQueryParameterException(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = "조회 조건을 확인해주세요."
+
+
+class ReservationSyncCursorExpiredException(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = "동기화 cursor 가 만료되었습니다. cursor 없이 전체 예약을 다시 동기화해주세요."
+
+
+class ReservationArchiveConflictException(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "보관 테이블에 같은 ID 의 예약이 이미 있습니다."
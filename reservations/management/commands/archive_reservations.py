@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from reservations.constants import RESERVATION_ARCHIVE_RETENTION_DAYS
+from reservations.exceptions import ReservationArchiveConflictException
+from reservations.managers import ReservationManager
+
+
+class Command(BaseCommand):
+    help = '시험 날짜가 보관 기간을 지난 예약을 보관 테이블로 이동합니다. 중단되면 다시 실행해 이어서 이동할 수 있습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retention-days', type=int, default=RESERVATION_ARCHIVE_RETENTION_DAYS,
+                            help='오늘 기준 보관 기간 (일)')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--max-batches', type=int, help='이번 실행에서 처리할 최대 batch 수')
+
+    def handle(self, *args, **options):
+        manager = ReservationManager()
+        cutoff_date = timezone.now().date() - timedelta(days=options['retention_days'])
+
+        total = 0
+        batches = 0
+        while options['max_batches'] is None or batches < options['max_batches']:
+            try:
+                archived = manager.archive_reservations(cutoff_date, batch_size=options['batch_size'])
+            except ReservationArchiveConflictException as e:
+                raise CommandError(f'{e.detail} {total}건 이동 후 중단했습니다.')
+            if archived == 0:
+                break
+            total += archived
+            batches += 1
+            if options['verbosity'] > 1:
+                self.stdout.write(f'{total}건 이동')
+
+        self.stdout.write(self.style.SUCCESS(f'{cutoff_date} 이전 예약 {total}건을 보관 테이블로 이동했습니다.'))
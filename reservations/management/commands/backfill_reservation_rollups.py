@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reservations import rollups
+
+
+class Command(BaseCommand):
+    help = '원본 예약(운영 + 보관 테이블)으로 시험 날짜별 예약 집계를 다시 계산해 저장합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help='시작 날짜 (YYYY-MM-DD, 기본값 가장 이른 예약 날짜)')
+        parser.add_argument('--end', help='종료 날짜 (YYYY-MM-DD, 기본값 가장 늦은 예약 날짜)')
+        parser.add_argument('--chunk-days', type=int, default=31, help='한 트랜잭션에서 처리할 기간 (일)')
+
+    def handle(self, *args, **options):
+        try:
+            start_date = datetime.strptime(options['start'], '%Y-%m-%d').date() if options['start'] else None
+            end_date = datetime.strptime(options['end'], '%Y-%m-%d').date() if options['end'] else None
+        except ValueError:
+            raise CommandError('날짜는 YYYY-MM-DD 형식으로 입력해주세요.')
+
+        start_date, end_date = rollups.date_bounds(start_date, end_date)
+        if start_date is None:
+            self.stdout.write('집계할 예약이 없습니다.')
+            return
+
+        total = 0
+        for chunk_start, chunk_end in rollups.date_chunks(start_date, end_date, options['chunk_days']):
+            total += rollups.backfill(chunk_start, chunk_end)
+            if options['verbosity'] > 1:
+                self.stdout.write(f'{chunk_start} ~ {chunk_end} 처리')
+
+        self.stdout.write(self.style.SUCCESS(f'{start_date} ~ {end_date} 기간 {total}일의 예약 집계를 저장했습니다.'))
@@ -0,0 +1,59 @@
+import json
+import platform
+from datetime import datetime
+
+import django
+from django.core.management.base import BaseCommand
+
+from reservations.benchmarks.manager import ManagerBenchmark, DEFAULT_RESERVATIONS_PER_DATE, DEFAULT_SLOT_HOURS, \
+    DEFAULT_OVERLAP_DENSITIES
+from reservations.benchmarks.utils import test_database, compare_metrics
+
+
+class Command(BaseCommand):
+    help = '테스트 데이터베이스에서 ReservationManager 수용 인원 계산 경로 벤치마크를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reservations-per-date', type=int, nargs='+', default=DEFAULT_RESERVATIONS_PER_DATE,
+                            help='날짜별 확정 예약 수')
+        parser.add_argument('--slot-hours', type=int, nargs='+', default=DEFAULT_SLOT_HOURS,
+                            help='예약 시간 단위 (시간)')
+        parser.add_argument('--overlap-densities', type=float, nargs='+', default=DEFAULT_OVERLAP_DENSITIES,
+                            help='대상 시간대와 겹치는 예약 비율 (0 ~ 1)')
+        parser.add_argument('--iterations', type=int, default=50)
+        parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+        parser.add_argument('--compare', help='비교할 기준 결과 JSON 파일 경로')
+
+    def handle(self, *args, **options):
+        with test_database():
+            benchmark = ManagerBenchmark(
+                reservations_per_date=options['reservations_per_date'],
+                slot_hours=options['slot_hours'],
+                overlap_densities=options['overlap_densities'],
+                iterations=options['iterations'],
+            )
+            results = benchmark.run()
+
+        report = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'environment': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+            },
+            'results': results,
+        }
+
+        if options['compare']:
+            with open(options['compare']) as f:
+                baseline = json.load(f)
+            report['comparison'] = compare_metrics(
+                baseline.get('results', {}),
+                results,
+                ('ops_per_sec', 'mean_ms', 'allocated_bytes', 'queries'),
+            )
+
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output)
+        self.stdout.write(output)
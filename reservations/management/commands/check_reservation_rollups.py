@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reservations import rollups
+
+
+class Command(BaseCommand):
+    help = '시험 날짜별 예약 집계가 원본 예약(운영 + 보관 테이블)과 일치하는지 확인합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help='시작 날짜 (YYYY-MM-DD, 기본값 가장 이른 예약 날짜)')
+        parser.add_argument('--end', help='종료 날짜 (YYYY-MM-DD, 기본값 가장 늦은 예약 날짜)')
+        parser.add_argument('--chunk-days', type=int, default=31, help='한 번에 비교할 기간 (일)')
+        parser.add_argument('--fix', action='store_true', help='일치하지 않는 기간의 집계를 다시 계산해 저장')
+
+    def handle(self, *args, **options):
+        try:
+            start_date = datetime.strptime(options['start'], '%Y-%m-%d').date() if options['start'] else None
+            end_date = datetime.strptime(options['end'], '%Y-%m-%d').date() if options['end'] else None
+        except ValueError:
+            raise CommandError('날짜는 YYYY-MM-DD 형식으로 입력해주세요.')
+
+        start_date, end_date = rollups.date_bounds(start_date, end_date)
+        if start_date is None:
+            self.stdout.write('확인할 예약이 없습니다.')
+            return
+
+        mismatched_dates = []
+        for chunk_start, chunk_end in rollups.date_chunks(start_date, end_date, options['chunk_days']):
+            for exam_date, stored, expected in rollups.find_mismatches(chunk_start, chunk_end):
+                mismatched_dates.append(exam_date)
+                self.stdout.write(f'{exam_date}: 저장된 값 {stored} / 계산한 값 {expected}')
+
+        if not mismatched_dates:
+            self.stdout.write(self.style.SUCCESS(f'{start_date} ~ {end_date} 기간의 예약 집계가 일치합니다.'))
+            return
+
+        if options['fix']:
+            for exam_date in mismatched_dates:
+                rollups.backfill(exam_date, exam_date)
+            self.stdout.write(self.style.SUCCESS(f'{len(mismatched_dates)}일의 예약 집계를 다시 계산했습니다.'))
+            return
+
+        raise CommandError(f'{len(mismatched_dates)}일의 예약 집계가 일치하지 않습니다. (--fix 로 다시 계산)')
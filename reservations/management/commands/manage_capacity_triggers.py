@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from reservations import capacity
+
+
+class Command(BaseCommand):
+    help = '시간대별 확정 인원을 제한하는 데이터베이스 트리거를 설치하거나 제거합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--uninstall', action='store_true', help='트리거 제거')
+
+    def handle(self, *args, **options):
+        if options['uninstall']:
+            with transaction.atomic():
+                capacity.uninstall(connection)
+            self.stdout.write(self.style.SUCCESS('확정 인원 제한 트리거를 제거했습니다.'))
+            return
+
+        if not capacity.is_enabled(connection):
+            self.stdout.write('확정 인원 제한 트리거는 PostgreSQL, SQLite 에서 RESERVATION_CAPACITY_TRIGGERS 설정이 켜진 경우에만 사용합니다.')
+            return
+
+        with transaction.atomic():
+            capacity.install(connection)
+        self.stdout.write(self.style.SUCCESS('확정 인원 제한 트리거를 설치했습니다.'))
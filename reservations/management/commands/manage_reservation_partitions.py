@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from reservations import partitions
+
+
+class Command(BaseCommand):
+    help = 'PostgreSQL 예약 테이블의 월별 파티션을 미리 생성하거나 지난 파티션을 분리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=3, help='이번 달 이후로 미리 생성할 파티션 개월 수')
+        parser.add_argument('--detach-before', help='이 달 이전의 파티션을 분리 (YYYY-MM)')
+        parser.add_argument('--drop', action='store_true', help='분리한 파티션 테이블을 삭제')
+        parser.add_argument('--convert', action='store_true', help='파티션 테이블이 아니면 파티션 테이블로 전환')
+
+    def handle(self, *args, **options):
+        if not partitions.is_enabled(connection):
+            self.stdout.write('파티셔닝은 PostgreSQL 에서 RESERVATION_PARTITIONING 설정이 켜진 경우에만 사용합니다.')
+            return
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            if not partitions.is_partitioned(cursor):
+                if not options['convert']:
+                    raise CommandError('예약 테이블이 파티션 테이블이 아닙니다. --convert 옵션으로 전환할 수 있습니다.')
+                partitions.convert_to_partitioned(cursor, months_ahead=options['months_ahead'])
+                self.stdout.write('예약 테이블을 파티션 테이블로 전환했습니다.')
+
+            this_month = partitions.month_start(timezone.now().date())
+            created = partitions.ensure_partitions(
+                cursor, this_month, partitions.add_months(this_month, options['months_ahead'])
+            )
+            self.stdout.write(f'파티션 확인: {", ".join(created)}')
+
+            if options['detach_before']:
+                try:
+                    before_month = datetime.strptime(options['detach_before'], '%Y-%m').date()
+                except ValueError:
+                    raise CommandError('월 형식이 올바르지 않습니다. YYYY-MM 형식으로 입력해주세요.')
+                detached = partitions.detach_partitions_before(cursor, before_month, drop=options['drop'])
+                self.stdout.write(f'분리한 파티션: {", ".join(detached) or "없음"}')
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from reservations import time_ranges
+
+
+class Command(BaseCommand):
+    help = '예약 시간 범위(tsrange) 생성 컬럼과 GiST 인덱스를 설치하거나 제거합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--uninstall', action='store_true', help='생성 컬럼과 인덱스 제거')
+
+    def handle(self, *args, **options):
+        if options['uninstall']:
+            with transaction.atomic():
+                time_ranges.uninstall(connection)
+            self.stdout.write(self.style.SUCCESS('예약 시간 범위 컬럼과 인덱스를 제거했습니다.'))
+            return
+
+        if not time_ranges.is_enabled(connection):
+            self.stdout.write('예약 시간 범위 인덱스는 PostgreSQL 에서 RESERVATION_TIME_RANGE_INDEX 설정이 켜진 경우에만 사용합니다.')
+            return
+
+        with transaction.atomic():
+            time_ranges.install(connection)
+        self.stdout.write(self.style.SUCCESS('예약 시간 범위 컬럼과 인덱스를 설치했습니다.'))
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from reservations.constants import RESERVATION_CHANGE_RETENTION_DAYS
+from reservations.outbox import prune_changes
+
+
+class Command(BaseCommand):
+    help = '보관 기간이 지난 예약 변경 기록(outbox)을 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retention-days', type=int, default=RESERVATION_CHANGE_RETENTION_DAYS,
+                            help='오늘 기준 보관 기간 (일)')
+        parser.add_argument('--batch-size', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(days=options['retention_days'])
+
+        total = 0
+        while True:
+            deleted = prune_changes(before, batch_size=options['batch_size'])
+            if deleted == 0:
+                break
+            total += deleted
+            if options['verbosity'] > 1:
+                self.stdout.write(f'{total}건 삭제')
+
+        self.stdout.write(self.style.SUCCESS(f'{before} 이전 변경 기록 {total}건을 삭제했습니다.'))
@@ -0,0 +1,79 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from reservations.benchmarks.loadtest import LoadTest, DEFAULT_TRAFFIC_MIX, compare_reports
+from reservations.benchmarks.utils import test_database
+
+
+class Command(BaseCommand):
+    help = '테스트 데이터베이스에 데이터를 생성하고 예약 API 부하 테스트를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--companies', type=int, default=100, help='생성할 기업 사용자 수')
+        parser.add_argument('--reservations', type=int, default=10000, help='생성할 예약 수')
+        parser.add_argument('--requests', type=int, default=2000, help='전송할 요청 수')
+        parser.add_argument('--workers', type=int, default=32, help='동시 요청 수')
+        parser.add_argument('--days', type=int, default=30, help='예약이 분포할 날짜 수')
+        parser.add_argument('--interface', choices=['wsgi', 'asgi'], default='wsgi')
+        parser.add_argument(
+            '--mix',
+            help='엔드포인트별 트래픽 비율 (예: available_times=60,create=15,confirm=5,list=20)',
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--max-error-rate', type=float, default=0.01,
+            help='엔드포인트별 허용 오류율 (넘으면 결과 출력 후 실패로 종료)',
+        )
+        parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+        parser.add_argument('--compare', help='비교할 기준 결과 JSON 파일 경로')
+
+    def handle(self, *args, **options):
+        traffic_mix = self.parse_mix(options['mix']) if options['mix'] else DEFAULT_TRAFFIC_MIX
+
+        # SQLite 는 쓰기를 한 번에 하나만 처리하므로 동시 요청 시 database is locked 오류가 섞임
+        if connection.vendor == 'sqlite' and options['workers'] > 1:
+            self.stderr.write(
+                'SQLite 에서 동시 요청으로 실행하면 잠금 오류가 발생할 수 있습니다. '
+                '--workers 1 로 실행하거나 PostgreSQL 을 사용해주세요.'
+            )
+
+        with test_database():
+            load_test = LoadTest(
+                companies=options['companies'],
+                reservations=options['reservations'],
+                requests=options['requests'],
+                workers=options['workers'],
+                days=options['days'],
+                traffic_mix=traffic_mix,
+                interface=options['interface'],
+                seed=options['seed'],
+                max_error_rate=options['max_error_rate'],
+            )
+            load_test.setup()
+            report = load_test.run()
+
+        if options['compare']:
+            with open(options['compare']) as f:
+                report['comparison'] = compare_reports(json.load(f), report)
+
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output)
+        self.stdout.write(output)
+
+        if report['failed_endpoints']:
+            raise CommandError(
+                f"오류율이 {options['max_error_rate']} 를 넘은 엔드포인트가 있습니다: {', '.join(report['failed_endpoints'])}"
+            )
+
+    def parse_mix(self, value):
+        mix = {}
+        for part in value.split(','):
+            name, _, weight = part.partition('=')
+            if name not in DEFAULT_TRAFFIC_MIX or not weight.isdigit():
+                raise CommandError(f'잘못된 트래픽 비율입니다: {part}')
+            mix[name] = int(weight)
+        return mix
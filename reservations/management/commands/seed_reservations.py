@@ -0,0 +1,45 @@
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reservations.seeding import ReservationSeeder
+
+
+class Command(BaseCommand):
+    help = '기업 사용자와 예약 테스트 데이터를 대량으로 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--companies', type=int, default=1000, help='생성할 기업 사용자 수')
+        parser.add_argument('--reservations', type=int, default=100000, help='생성할 예약 수')
+        parser.add_argument('--days', type=int, default=90, help='예약이 분포할 날짜 수')
+        parser.add_argument('--start-date', help='첫 시험 날짜 (YYYY-MM-DD)')
+        parser.add_argument('--batch-size', type=int, default=50000)
+        parser.add_argument('--confirmed-ratio', type=float, default=0.35, help='확정 예약 비율')
+        parser.add_argument('--prefix', default='seed', help='생성할 기업 사용자 이메일 접두사')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        start_date = None
+        if options['start_date']:
+            try:
+                start_date = datetime.strptime(options['start_date'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError('날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.')
+
+        seeder = ReservationSeeder(
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            confirmed_ratio=options['confirmed_ratio'],
+            stdout=self.stdout if options['verbosity'] > 1 else None,
+        )
+
+        started = time.perf_counter()
+        company_ids = seeder.seed_companies(options['companies'], prefix=options['prefix'])
+        created = seeder.seed_reservations(options['reservations'], company_ids, days=options['days'],
+                                           start_date=start_date)
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f'기업 사용자 {len(company_ids)}명, 예약 {created}건 생성 완료 ({elapsed:.2f}초)'
+        ))
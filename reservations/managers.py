@@ -1,38 +1,95 @@
-from datetime import time, datetime
+from datetime import time, datetime, timedelta
+from itertools import chain
 
-from django.db import transaction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction, connection, router, IntegrityError
+from django.db.models import Sum, Q
 from django.utils import timezone
 
+from programmers_exam_reservation.utils.db_routers import use_primary
+from programmers_exam_reservation.utils.singleflight import SingleFlight, cache_single_flight
+from reservations import capacity, conditional_insert, time_ranges
+from reservations.analytics import invalidate_heatmap, heatmap_cache_key, HEATMAP_CACHE_TTL, HEATMAP_MAX_DAYS, \
+    HEATMAP_DEFAULT_DAYS
+from reservations.choices import STATUS_CHOICES
 from reservations.constants import OPERATION_START_TIME, OPERATION_END_TIME, \
-    MAX_ATTENDEES_PER_TIMESLOT
+    MAX_ATTENDEES_PER_TIMESLOT, RESERVATION_HOLD_TTL_MINUTES, RESERVATION_HOLD_SWEEP_BATCH_SIZE, \
+    RESERVATION_CHANGE_PAGE_SIZE, RESERVATION_CHANGE_MAX_PAGE_SIZE, RESERVATION_SYNC_PAGE_SIZE, \
+    RESERVATION_SYNC_MAX_PAGE_SIZE, RESERVATION_BULK_DELETE_MAX_SIZE, RESERVATION_LIST_SORTS, \
+    RESERVATION_LIST_DEFAULT_SORT, RESERVATION_BATCH_FETCH_MAX_SIZE
 from reservations.exceptions import ReservationAttendeesException, \
     ReservationAccessDeniedException, ReservationNotFoundException, ConfirmedReservationModificationException, \
-    InvalidDateException
-from reservations.models import Reservation
+    InvalidDateException, ReservationHoldNotFoundException, ReservationHoldMismatchException, \
+    InvalidQueryParameterException, ReservationSyncCursorExpiredException, ReservationArchiveConflictException
+from reservations.models import Reservation, ReservationArchive, ReservationHold
+from reservations.outbox import record_change, record_archived, record_removed, read_changes
+from reservations.rollups import apply_reservation_change, apply_reservation_changes, reservation_state, \
+    read_rollups, STATE_FIELDS, HOURS
+from reservations.sync import read_sync_changes, record_tombstones, encode_cursor, decode_cursor, is_expired
+from users.models import User
+from users.search import search_filter
+
+# 예약 가능 시간대 조회 요청을 날짜별로 합치기 위한 single-flight
+available_slots_flight = SingleFlight()
 
 
 class ReservationManager:
-    def retrieve_reservations_by_user(self, user):
+    def retrieve_reservations_by_user(self, user, params=None, fields=None):
         """
         사용자의 권한에 따라 예약 조회
 
         Args:
             user: 요청 사용자 객체
+            params: 조회 조건 (query parameter)
+                - exam_date_from, exam_date_to: 시험 날짜 범위 (YYYY-MM-DD)
+                - status: 예약 상태 (STATUS_CHOICES)
+                - attendees_min, attendees_max: 응시 인원 범위
+                - company: 기업 사용자 ID (어드민만 사용 가능)
+                - search: 기업 이름 또는 이메일에 포함된 문자열 (어드민만 사용 가능)
+                - sort: 정렬 기준 (RESERVATION_LIST_SORTS, 기본값 -exam_date)
+            fields: 응답에 사용할 필드 목록 (기본값 모든 필드)
 
         Returns:
             QuerySet[Reservation]: 예약 객체들의 QuerySet
 
         Raises:
+            InvalidQueryParameterException: 조회 조건이 올바르지 않거나 인덱스가 없는 정렬 기준인 경우
         """
+        params = params or {}
+
+        sort = params.get('sort') or RESERVATION_LIST_DEFAULT_SORT
+        if sort not in RESERVATION_LIST_SORTS:
+            raise InvalidQueryParameterException(
+                f'sort 는 {", ".join(RESERVATION_LIST_SORTS)} 중 하나로 입력해주세요.'
+            )
+
         if user.role == 'ADMIN':
-            return Reservation.objects.all().select_related('company_customer').order_by('-exam_date', 'start_time')
+            reservations_qs = Reservation.objects.all()
         elif user.role == 'COMPANY':
-            return Reservation.objects.filter(company_customer=user).select_related('company_customer').order_by('-exam_date', 'start_time')
+            reservations_qs = Reservation.objects.filter(company_customer=user)
+        else:
+            return Reservation.objects.none()
+
+        if params.get('company'):
+            if user.role != 'ADMIN':
+                raise InvalidQueryParameterException('company 조건은 어드민만 사용할 수 있습니다.')
+            reservations_qs = reservations_qs.filter(company_customer_id=self._parse_int_param(params, 'company'))
+
+        if params.get('search'):
+            if user.role != 'ADMIN':
+                raise InvalidQueryParameterException('search 조건은 어드민만 사용할 수 있습니다.')
+            # 검색 인덱스로 기업을 찾은 뒤 (company_customer, ...) 인덱스로 예약 조회
+            companies = User.objects.filter(search_filter(params['search'], connection), role='COMPANY')
+            reservations_qs = reservations_qs.filter(company_customer_id__in=companies.values('id'))
+
+        reservations_qs = reservations_qs.filter(**self._parse_list_filters(params))
 
-        return Reservation.objects.none()
+        return self._select_fields(reservations_qs, fields).order_by(*RESERVATION_LIST_SORTS[sort])
 
+    @use_primary()
     @transaction.atomic
-    def create_reservation(self, user, exam_date, start_time, end_time, attendees):
+    def create_reservation(self, user, exam_date, start_time, end_time, attendees, hold_id=None):
         """
         예약 생성
 
@@ -42,37 +99,106 @@ class ReservationManager:
             start_time: 시작 시간
             end_time: 종료 시간
             attendees: 응시 인원
+            hold_id: 미리 확보한 예약 인원 ID (지정하면 예약 가능 인원을 다시 계산하지 않고 확보 인원을 예약으로 전환)
 
         Returns:
             reservation: 생성된 예약 객체
 
         Raises:
             ReservationAttendeesException: 예약 시도 인원이 예약 가능 인원을 초과하는 경우
+            ReservationHoldNotFoundException: 확보 정보가 없거나 만료된 경우
+            ReservationHoldMismatchException: 확보 정보와 예약 날짜, 시간이 다르거나 확보 인원보다 많은 경우
         """
-        # 시험 날짜, 시작 시간, 종료 시간에 예약 가능한 최대 응시 인원
+        hold = None
+        reservation = None
+        if hold_id is not None:
+            hold = self._take_hold(user, hold_id, exam_date, start_time, end_time, attendees)
+        elif conditional_insert.is_supported(connection):
+            # 예약 가능 인원 확인과 추가를 한 번의 SQL 로 처리
+            reservation = self._insert_if_available(user, exam_date, start_time, end_time, attendees)
+        else:
+            # 시험 날짜, 시작 시간, 종료 시간에 예약 가능한 최대 응시 인원
+            available_attendees = self._check_available_attendees(exam_date, start_time, end_time)
+
+            if attendees > available_attendees:
+                raise ReservationAttendeesException(f'동 시간대 최대 {MAX_ATTENDEES_PER_TIMESLOT}명 까지 예약할 수 있습니다. (현재 예약 가능 인원: {available_attendees}명)')
+
+        if reservation is None:
+            reservation = Reservation.objects.create(
+                company_customer=user,
+                exam_date=exam_date,
+                start_time=start_time,
+                end_time=end_time,
+                attendees=attendees,
+                status='PENDING'
+            )
+
+        if hold is not None:
+            hold.delete()
+
+        new_state = reservation_state(reservation)
+        apply_reservation_change(new_state=new_state)
+        record_change('CREATE', reservation.id, after=new_state)
+        invalidate_heatmap()
+
+        return reservation
+
+    @use_primary()
+    @transaction.atomic
+    def create_hold(self, user, exam_date, start_time, end_time, attendees):
+        """
+        예약 신청 전 일정 시간(RESERVATION_HOLD_TTL_MINUTES) 동안 응시 인원 확보
+
+        Args:
+            user: 요청한 기업 사용자
+            exam_date: 시험 날짜
+            start_time: 시작 시간
+            end_time: 종료 시간
+            attendees: 확보할 응시 인원
+
+        Returns:
+            hold: 생성된 ReservationHold 객체
+
+        Raises:
+            ReservationAttendeesException: 확보하려는 인원이 예약 가능 인원을 초과하는 경우
+        """
+        self._sweep_expired_holds()
+
         available_attendees = self._check_available_attendees(exam_date, start_time, end_time)
 
         if attendees > available_attendees:
             raise ReservationAttendeesException(f'동 시간대 최대 {MAX_ATTENDEES_PER_TIMESLOT}명 까지 예약할 수 있습니다. (현재 예약 가능 인원: {available_attendees}명)')
 
-        reservation = Reservation.objects.create(
+        return ReservationHold.objects.create(
             company_customer=user,
             exam_date=exam_date,
             start_time=start_time,
             end_time=end_time,
             attendees=attendees,
-            status='PENDING'
+            expires_at=timezone.now() + timedelta(minutes=RESERVATION_HOLD_TTL_MINUTES),
         )
 
-        return reservation
+    @use_primary()
+    def release_hold(self, user, hold_id):
+        """
+        확보한 응시 인원 반환
+
+        Raises:
+            ReservationHoldNotFoundException: 사용자의 확보 정보가 없는 경우
+        """
+        deleted, _ = ReservationHold.objects.filter(id=hold_id, company_customer=user).delete()
+        if not deleted:
+            raise ReservationHoldNotFoundException()
 
-    def retrieve_reservation_by_id(self, user, reservation_id):
+    def retrieve_reservation_by_id(self, user, reservation_id, include_archived=False, fields=None):
         """
         ID로 예약 조회
 
         Args:
             user: 요청 사용자 객체
             reservation_id: 조회할 예약 ID
+            include_archived: 어드민 사용자의 경우 보관된 예약까지 조회할지 여부
+            fields: 응답에 사용할 필드 목록 (기본값 모든 필드, 지정한 경우 수정, 삭제에 사용하지 않음)
 
         Returns:
             QuerySet[Reservation]: 예약 객체의 QuerySet
@@ -83,15 +209,70 @@ class ReservationManager:
         """
         try:
             # ID로 예약 조회
-            reservation_qs = Reservation.objects.select_related('company_customer').get(id=reservation_id)
+            reservation_qs = self._select_fields(Reservation.objects.all(), fields).get(id=reservation_id)
 
-            if user.role == 'ADMIN' or (user.role == 'COMPANY' and reservation_qs.company_customer == user):
+            if user.role == 'ADMIN' or (user.role == 'COMPANY' and reservation_qs.company_customer_id == user.id):
                 return reservation_qs
             else:
                 raise ReservationAccessDeniedException()
         except Reservation.DoesNotExist:
+            # 운영 테이블에 없으면 어드민에 한해 보관 테이블 조회
+            if include_archived and user.role == 'ADMIN':
+                try:
+                    return self._select_fields(ReservationArchive.objects.all(), fields).get(id=reservation_id)
+                except ReservationArchive.DoesNotExist:
+                    pass
             raise ReservationNotFoundException()
 
+    def retrieve_reservations_by_ids(self, user, ids, fields=None):
+        """
+        ID 목록으로 예약 일괄 조회
+
+        소유 조건을 WHERE 절에 넣어 조회 가능한 예약을 한 번의 id__in 쿼리로 조회하고,
+        찾지 못한 ID 가 있는 경우에만 존재 여부를 한 번 더 조회해 not_found, forbidden 을 구분한다.
+        - 어드민: 모든 예약 조회 가능 (보관된 예약 포함)
+        - 기업 사용자: 자신의 예약만 조회 가능
+
+        Args:
+            user: 요청 사용자 객체
+            ids: 쉼표로 구분한 예약 ID 목록 (최대 RESERVATION_BATCH_FETCH_MAX_SIZE 개)
+            fields: 응답에 사용할 필드 목록 (기본값 모든 필드)
+
+        Returns:
+            (reservations, not_found, forbidden): 요청 순서대로 조회한 예약 목록, 없는 예약 ID 목록, 접근 권한이 없는 예약 ID 목록
+
+        Raises:
+            InvalidQueryParameterException: ID 목록이 없거나 올바르지 않은 경우, 최대 수를 넘는 경우
+        """
+        try:
+            ids = list(dict.fromkeys(int(i) for i in (ids or '').split(',') if i.strip()))
+        except ValueError:
+            raise InvalidQueryParameterException('ids 는 쉼표로 구분한 정수로 입력해주세요.')
+        if not ids:
+            raise InvalidQueryParameterException('ids 를 입력해주세요.')
+        if len(ids) > RESERVATION_BATCH_FETCH_MAX_SIZE:
+            raise InvalidQueryParameterException(f'ids 는 최대 {RESERVATION_BATCH_FETCH_MAX_SIZE}개까지 입력할 수 있습니다.')
+
+        reservations_qs = self._select_fields(Reservation.objects.all(), fields).filter(id__in=ids)
+        if user.role != 'ADMIN':
+            reservations_qs = reservations_qs.filter(company_customer=user)
+        found = {reservation.id: reservation for reservation in reservations_qs}
+
+        forbidden = set()
+        missing = [i for i in ids if i not in found]
+        if missing:
+            if user.role == 'ADMIN':
+                # 운영 테이블에 없으면 보관 테이블 조회
+                archived_qs = self._select_fields(ReservationArchive.objects.all(), fields).filter(id__in=missing)
+                found.update({reservation.id: reservation for reservation in archived_qs})
+            else:
+                forbidden = set(Reservation.objects.filter(id__in=missing).values_list('id', flat=True))
+
+        reservations = [found[i] for i in ids if i in found]
+        not_found = [i for i in ids if i not in found and i not in forbidden]
+        return reservations, not_found, [i for i in ids if i in forbidden]
+
+    @use_primary()
     @transaction.atomic
     def update_reservation(self, reservation, user, exam_date=None, start_time=None, end_time=None, attendees=None, status=None):
         """
@@ -112,11 +293,16 @@ class ReservationManager:
         Raises:
             ConfirmedReservationModificationException:
                 기업 사용자가 확정된 예약 수정을 시도하는 경우
+            ReservationNotFoundException:
+                조회한 뒤 다른 요청이 예약을 삭제한 경우
             ReservationAccessDeniedException:
                 어드민이 아닌 다른 사용자가 status를 수정 시도할 경우
             ReservationAttendeesException:
                 해당 시간 응시 인원이 5만명을 넘어갈 경우
         """
+        # 날짜별 집계 반영을 위한 변경 전 상태 (잠근 행의 현재 상태)
+        old_state = self._lock_reservation(reservation)
+
         # 어드민이 아닌 사용자가 확정된 예약을 수정하려 시도하는 경우
         if user.role != 'ADMIN' and reservation.status == 'CONFIRMED':
             raise ConfirmedReservationModificationException()
@@ -143,6 +329,9 @@ class ReservationManager:
             reservation.attendees = attendees
             modified = True
 
+        # 대기 예약을 확정하는 경우 (상태를 반영하기 전의 값으로 판단)
+        confirming = status == 'CONFIRMED' and reservation.status != 'CONFIRMED'
+
         # 상태 수정 (어드민 사용자만 가능)
         if status is not None:
             if user.role != 'ADMIN':
@@ -150,9 +339,13 @@ class ReservationManager:
             reservation.status = status
             modified = True
 
+        # 확정 인원 제한 트리거를 사용하는 경우 확정 예약은 저장할 때 데이터베이스에서 확인
+        checked_by_database = reservation.status == 'CONFIRMED' and capacity.is_active(connection)
+
         # 변경된 날짜, 시간, 인원에 대한 가능 여부 검증
-        if (exam_date is not None or start_time is not None or end_time is not None or attendees is not None or
-                (status is not None and status == 'CONFIRMED' and reservation.status != 'CONFIRMED')):
+        if not checked_by_database and (
+                exam_date is not None or start_time is not None or end_time is not None or attendees is not None or
+                confirming):
 
             # 실제 사용할 값 결정
             check_exam_date = exam_date if exam_date is not None else reservation.exam_date
@@ -167,7 +360,11 @@ class ReservationManager:
                 raise ReservationAttendeesException(f'동 시간대 최대 {MAX_ATTENDEES_PER_TIMESLOT}명 까지 예약할 수 있습니다. (현재 예약 가능 인원: {available_attendees}명)')
 
         if modified is True:
-            reservation.save()
+            self._save_reservation(reservation)
+            new_state = reservation_state(reservation)
+            apply_reservation_change(old_state, new_state)
+            record_change('UPDATE', reservation.id, before=old_state, after=new_state)
+            invalidate_heatmap()
 
         return reservation
 
@@ -185,12 +382,96 @@ class ReservationManager:
         Raises:
             ConfirmedReservationModificationException:
                 기업 사용자가 확정된 예약 삭제를 시도하는 경우
+            ReservationNotFoundException:
+                조회한 뒤 다른 요청이 예약을 삭제한 경우
         """
+        old_state = self._lock_reservation(reservation)
+
         # 기업 사용자가 확정된 예약을 삭제하려는 경우 예외 처리
         if user.role == 'COMPANY' and reservation.status == 'CONFIRMED':
             raise ConfirmedReservationModificationException("확정된 예약은 삭제할 수 없습니다.")
 
-        reservation.delete()
+        # 실제로 삭제한 경우에만 집계, 변경 기록에 반영 (잠금을 지원하지 않는 데이터베이스에서 동시에 삭제한 경우)
+        deleted, _ = Reservation.objects.filter(id=reservation.id).delete()
+        if deleted != 1:
+            raise ReservationNotFoundException()
+
+        apply_reservation_change(old_state=old_state)
+        record_change('DELETE', reservation.id, before=old_state)
+        record_tombstones({reservation.id: reservation.company_customer_id})
+        invalidate_heatmap()
+
+    @use_primary()
+    @transaction.atomic
+    def bulk_delete_reservations(self, user, ids=None, exam_date=None, status=None,
+                                 limit=RESERVATION_BULK_DELETE_MAX_SIZE):
+        """
+        예약 ID 목록 또는 조건(시험 날짜, 상태)에 해당하는 예약을 한 번에 삭제
+
+        delete_reservation 과 같은 규칙을 적용하며, 권한 조건을 WHERE 절에 넣어 삭제 가능한 예약만 한 번의 DELETE 로 삭제한다.
+        - 어드민: 모든 예약 삭제 가능
+        - 기업 사용자: 확정 전의 자신의 예약만 삭제 가능 (조건으로 삭제하는 경우 자신의 예약만 대상)
+
+        Args:
+            user: 요청한 사용자
+            ids: 삭제할 예약 ID 목록
+            exam_date: ids 가 없는 경우 삭제할 예약의 시험 날짜
+            status: ids 가 없는 경우 삭제할 예약의 상태 (기본값 모든 상태)
+            limit: 조건으로 삭제하는 경우 한 번에 삭제할 최대 예약 수
+
+        Returns:
+            (results, capacity_deltas, has_more):
+                예약별 결과 [{'id', 'outcome'}, ...] (deleted, not_found, forbidden, confirmed),
+                확정 예약 삭제로 늘어난 시간대별 예약 가능 인원 [{'exam_date', 'start_time', 'end_time', 'released_attendees'}, ...],
+                조건에 해당하는 예약이 더 남아 있는지 여부
+        """
+        if user.role == 'ADMIN':
+            deletable = Q()
+        else:
+            deletable = Q(company_customer=user) & ~Q(status='CONFIRMED')
+
+        if ids is not None:
+            ids = list(dict.fromkeys(ids))
+            target = Q(id__in=ids)
+        else:
+            target = Q(exam_date=exam_date)
+            if status:
+                target &= Q(status=status)
+            if user.role != 'ADMIN':
+                target &= Q(company_customer=user)
+
+        # 삭제할 예약을 잠그고 변경 전 상태를 읽음 (집계, 변경 기록에 사용)
+        removed = list(
+            Reservation.objects.select_for_update()
+            .filter(target & deletable)
+            .order_by('id')
+            .values('id', *STATE_FIELDS)[:limit + 1]
+        )
+        has_more = ids is None and len(removed) > limit
+        removed = removed[:limit]
+        removed_ids = [reservation['id'] for reservation in removed]
+
+        if removed_ids:
+            Reservation.objects.filter(deletable, id__in=removed_ids).delete()
+            apply_reservation_changes([(reservation, None) for reservation in removed])
+            record_removed('DELETE', removed)
+            record_tombstones({reservation['id']: reservation['company_customer_id'] for reservation in removed})
+            invalidate_heatmap()
+
+        outcomes = {reservation_id: 'deleted' for reservation_id in removed_ids}
+        if ids is not None:
+            # 삭제하지 못한 예약의 사유
+            skipped = Reservation.objects.filter(id__in=[i for i in ids if i not in outcomes])
+            for reservation in skipped.values('id', 'company_customer_id', 'status'):
+                if reservation['company_customer_id'] != user.id:
+                    outcomes[reservation['id']] = 'forbidden'
+                else:
+                    outcomes[reservation['id']] = 'confirmed'
+            results = [{'id': i, 'outcome': outcomes.get(i, 'not_found')} for i in ids]
+        else:
+            results = [{'id': i, 'outcome': 'deleted'} for i in removed_ids]
+
+        return results, self._released_capacity(removed), has_more
 
     @transaction.atomic
     def retrieve_available_times(self, date):
@@ -221,7 +502,361 @@ class ReservationManager:
         if date < today:
             raise InvalidDateException('과거 날짜에 대한 예약 정보는 조회할 수 없습니다.')
 
-        return self._get_available_slots(date)
+        return self._get_shared_available_slots(date)
+
+    def retrieve_utilization_heatmap(self, start_date=None, end_date=None):
+        """
+        날짜 × 시간대별 확정, 대기 응시 인원 조회
+
+        한 번의 집계 쿼리로 계산하며 조회 범위별로 캐시한다. (예약 변경 시 무효화)
+
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD, 기본값 오늘)
+            end_date: 종료 날짜 (YYYY-MM-DD, 기본값 시작 날짜부터 HEATMAP_DEFAULT_DAYS 일)
+
+        Returns:
+            {
+                'start': date, 'end': date,
+                'hours': [9, 10, ..., 17],
+                'dates': [date, ...],
+                'confirmed': [[시간대별 확정 인원], ...],  # dates 순서
+                'pending': [[시간대별 대기 인원], ...],
+            }
+
+        Raises:
+            InvalidDateException:
+                - 날짜 형식이 올바르지 않은 경우
+                - 종료 날짜가 시작 날짜보다 빠르거나 조회 기간이 HEATMAP_MAX_DAYS 일을 넘는 경우
+        """
+        start_date, end_date = self._parse_date_range(start_date, end_date)
+
+        cache_key = heatmap_cache_key(start_date, end_date)
+        heatmap = cache.get(cache_key)
+        if heatmap is None:
+            heatmap = self._get_utilization_heatmap(start_date, end_date)
+            cache.set(cache_key, heatmap, timeout=HEATMAP_CACHE_TTL)
+
+        return heatmap
+
+    def retrieve_daily_rollups(self, start_date=None, end_date=None):
+        """
+        시험 날짜별 예약 집계 조회 (예약 수와 관계없이 날짜 × 기업 사용자 × 시간대 집계 행만 조회)
+
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD, 기본값 오늘)
+            end_date: 종료 날짜 (YYYY-MM-DD, 기본값 시작 날짜부터 HEATMAP_DEFAULT_DAYS 일)
+
+        Returns:
+            [{'exam_date', 집계 값...}, ...]: 날짜 순 집계 목록 (예약이 없는 날짜는 제외)
+
+        Raises:
+            InvalidDateException: 날짜 형식이나 기간이 올바르지 않은 경우
+        """
+        start_date, end_date = self._parse_date_range(start_date, end_date)
+
+        rollups = read_rollups(start_date, end_date)
+        return [{'exam_date': exam_date, **rollups[exam_date]} for exam_date in sorted(rollups)]
+
+    def retrieve_changes(self, after=None, limit=None):
+        """
+        예약 변경 기록을 cursor(seq) 이후부터 조회
+
+        Args:
+            after: 마지막으로 읽은 seq (기본값 처음부터)
+            limit: 최대 조회 수 (기본값 RESERVATION_CHANGE_PAGE_SIZE, 최대 RESERVATION_CHANGE_MAX_PAGE_SIZE)
+
+        Returns:
+            (changes, next_after, has_more): 변경 기록 목록, 다음 조회에 사용할 cursor, 이어서 읽을 기록이 더 있는지 여부
+
+        Raises:
+            InvalidQueryParameterException: cursor, limit 가 정수가 아닌 경우
+        """
+        try:
+            after = int(after) if after else 0
+            limit = min(int(limit), RESERVATION_CHANGE_MAX_PAGE_SIZE) if limit else RESERVATION_CHANGE_PAGE_SIZE
+        except ValueError:
+            raise InvalidQueryParameterException('after, limit 는 정수로 입력해주세요.')
+
+        limit = max(limit, 1)
+        changes = read_changes(after, limit + 1)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        next_after = changes[-1].seq if changes else after
+        return changes, next_after, has_more
+
+    def retrieve_sync_changes(self, user, since=None, limit=None):
+        """
+        기업 사용자의 예약 중 cursor 이후에 수정, 삭제된 예약 조회
+
+        Args:
+            user: 요청한 기업 사용자
+            since: 이전 조회 응답의 next_cursor (기본값 처음부터, 모든 예약)
+            limit: 최대 조회 수 (기본값 RESERVATION_SYNC_PAGE_SIZE, 최대 RESERVATION_SYNC_MAX_PAGE_SIZE)
+
+        Returns:
+            (changes, next_cursor, has_more):
+                [(종류, Reservation 또는 ReservationTombstone), ...], 다음 조회에 사용할 cursor, 이어서 읽을 변경분이 더 있는지 여부
+
+        Raises:
+            InvalidQueryParameterException: cursor 형식이 올바르지 않거나 limit 가 정수가 아닌 경우
+            ReservationSyncCursorExpiredException: 삭제 기록 보관 기간보다 오래된 cursor 인 경우
+        """
+        try:
+            limit = min(int(limit), RESERVATION_SYNC_MAX_PAGE_SIZE) if limit else RESERVATION_SYNC_PAGE_SIZE
+            cursor = decode_cursor(since) if since else None
+        except ValueError:
+            raise InvalidQueryParameterException('since 는 이전 응답의 next_cursor, limit 는 정수로 입력해주세요.')
+
+        if cursor is not None and is_expired(cursor[0]):
+            raise ReservationSyncCursorExpiredException()
+
+        limit = max(limit, 1)
+        changes = read_sync_changes(user, cursor, limit)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        next_cursor = encode_cursor(*changes[-1][:3]) if changes else since
+        return [(kind, instance) for _, kind, _, instance in changes], next_cursor, has_more
+
+    def archive_reservations(self, cutoff_date, batch_size=1000):
+        """
+        시험 날짜가 cutoff_date 이전인 예약을 보관 테이블로 한 batch 이동
+
+        batch 단위로 트랜잭션이 끝나므로 중간에 중단되어도 다시 실행하면 남은 예약부터 이어서 이동한다.
+
+        Args:
+            cutoff_date: 이 날짜 이전의 예약을 이동
+            batch_size: 한 번에 이동할 예약 수
+
+        Returns:
+            이동한 예약 수 (0 이면 더 이상 이동할 예약이 없음)
+
+        Raises:
+            ReservationArchiveConflictException: 보관 테이블에 같은 ID 의 예약이 이미 있는 경우 (batch 전체를 이동하지 않음)
+        """
+        with transaction.atomic():
+            reservations = list(
+                Reservation.objects.select_for_update()
+                .filter(exam_date__lt=cutoff_date)
+                .order_by('exam_date', 'id')
+                .values('id', 'company_customer_id', 'exam_date', 'start_time', 'end_time', 'attendees', 'status')
+                [:batch_size]
+            )
+            if not reservations:
+                return 0
+
+            # 보관되지 않은 예약을 삭제하지 않도록 같은 ID 가 있으면 중단
+            # (확인 이후 동시에 추가된 경우에도 bulk_create 의 무결성 오류로 트랜잭션이 롤백됨)
+            ids = [reservation['id'] for reservation in reservations]
+            conflicts = list(ReservationArchive.objects.filter(id__in=ids).values_list('id', flat=True))
+            if conflicts:
+                raise ReservationArchiveConflictException(
+                    f'보관 테이블에 같은 ID 의 예약이 이미 있습니다. (ID: {", ".join(map(str, sorted(conflicts)))})'
+                )
+
+            ReservationArchive.objects.bulk_create([ReservationArchive(**reservation) for reservation in reservations])
+            Reservation.objects.filter(id__in=ids).delete()
+            record_archived(reservations)
+            record_tombstones({reservation['id']: reservation['company_customer_id'] for reservation in reservations})
+            invalidate_heatmap()
+
+        return len(reservations)
+
+    def _select_fields(self, queryset, fields=None):
+        """
+        응답 필드(ReservationResponseSerializer)에 필요한 컬럼만 조회
+
+        company_customer 를 요청하지 않으면 기업 사용자 테이블을 join 하지 않는다.
+        권한 확인에 사용하는 company_customer_id 는 항상 조회한다.
+        """
+        if fields is None:
+            return queryset.select_related('company_customer')
+
+        columns = ['id', 'company_customer']
+        for field in fields:
+            if field == 'company_customer':
+                queryset = queryset.select_related('company_customer')
+                columns.append('company_customer__name')
+            elif field != 'id':
+                columns.append(field)
+        return queryset.only(*columns)
+
+    def _parse_int_param(self, params, name):
+        try:
+            return int(params[name])
+        except ValueError:
+            raise InvalidQueryParameterException(f'{name} 는 정수로 입력해주세요.')
+
+    def _parse_list_filters(self, params):
+        """예약 목록 조회 조건을 filter 인자로 변환"""
+        filters = {}
+
+        for name, lookup in (('exam_date_from', 'exam_date__gte'), ('exam_date_to', 'exam_date__lte')):
+            if params.get(name):
+                try:
+                    filters[lookup] = datetime.strptime(params[name], '%Y-%m-%d').date()
+                except ValueError:
+                    raise InvalidQueryParameterException(f'{name} 는 YYYY-MM-DD 형식으로 입력해주세요.')
+
+        for name, lookup in (('attendees_min', 'attendees__gte'), ('attendees_max', 'attendees__lte')):
+            if params.get(name):
+                filters[lookup] = self._parse_int_param(params, name)
+
+        if params.get('status'):
+            if params['status'] not in dict(STATUS_CHOICES):
+                raise InvalidQueryParameterException(f'status 는 {", ".join(dict(STATUS_CHOICES))} 중 하나로 입력해주세요.')
+            filters['status'] = params['status']
+
+        return filters
+
+    def _parse_date_range(self, start_date, end_date):
+        """
+        조회 기간 (YYYY-MM-DD) 변환
+
+        Raises:
+            InvalidDateException:
+                - 날짜 형식이 올바르지 않은 경우
+                - 종료 날짜가 시작 날짜보다 빠르거나 조회 기간이 HEATMAP_MAX_DAYS 일을 넘는 경우
+        """
+        try:
+            start_date = datetime.strptime(start_date, '%Y-%m-%d').date() if start_date else timezone.now().date()
+            end_date = datetime.strptime(end_date, '%Y-%m-%d').date() if end_date \
+                else start_date + timedelta(days=HEATMAP_DEFAULT_DAYS - 1)
+        except ValueError:
+            raise InvalidDateException(detail="날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+
+        if end_date < start_date:
+            raise InvalidDateException('종료 날짜는 시작 날짜 이후여야 합니다.')
+        if (end_date - start_date).days + 1 > HEATMAP_MAX_DAYS:
+            raise InvalidDateException(f'최대 {HEATMAP_MAX_DAYS}일까지 조회할 수 있습니다.')
+
+        return start_date, end_date
+
+    def _take_hold(self, user, hold_id, exam_date, start_time, end_time, attendees):
+        """
+        예약으로 전환할 확보 정보 조회 (전환이 끝날 때까지 잠금)
+
+        Raises:
+            ReservationHoldNotFoundException: 사용자의 확보 정보가 없거나 만료된 경우
+            ReservationHoldMismatchException: 확보 정보와 예약 날짜, 시간이 다르거나 확보 인원보다 많은 경우
+        """
+        hold = ReservationHold.objects.select_for_update().filter(
+            id=hold_id,
+            company_customer=user,
+            expires_at__gt=timezone.now(),
+        ).first()
+
+        if hold is None:
+            raise ReservationHoldNotFoundException()
+
+        if (hold.exam_date, hold.start_time, hold.end_time) != (exam_date, start_time, end_time) or attendees > hold.attendees:
+            raise ReservationHoldMismatchException()
+
+        return hold
+
+    def _sweep_expired_holds(self, batch_size=RESERVATION_HOLD_SWEEP_BATCH_SIZE):
+        """
+        만료된 확보 정보를 batch_size 만큼 삭제
+
+        만료된 확보 정보는 예약 가능 인원 계산에서 이미 제외되므로, 확보 생성 시마다 만료 일시 인덱스로
+        일부씩 정리해 별도의 주기적인 전체 테이블 정리 작업이 필요하지 않도록 한다.
+        """
+        expired_ids = list(
+            ReservationHold.objects.filter(expires_at__lte=timezone.now())
+            .order_by('expires_at')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if expired_ids:
+            ReservationHold.objects.filter(id__in=expired_ids).delete()
+
+    def _insert_if_available(self, user, exam_date, start_time, end_time, attendees):
+        """
+        예약 가능 인원 안에서만 대기 예약 추가 (conditional_insert)
+
+        Returns:
+            reservation: 추가한 예약 객체
+
+        Raises:
+            ReservationAttendeesException: 예약 시도 인원이 예약 가능 인원을 초과하는 경우
+        """
+        now = timezone.now()
+        reservation_id = conditional_insert.insert_if_available(
+            connection, user.id, exam_date, start_time, end_time, attendees, now,
+        )
+        if reservation_id is None:
+            # 추가하지 않은 경우에만 오류 메시지에 사용할 예약 가능 인원 조회
+            available_attendees = self._check_available_attendees(exam_date, start_time, end_time)
+            raise ReservationAttendeesException(f'동 시간대 최대 {MAX_ATTENDEES_PER_TIMESLOT}명 까지 예약할 수 있습니다. (현재 예약 가능 인원: {available_attendees}명)')
+
+        reservation = Reservation(
+            id=reservation_id,
+            company_customer=user,
+            exam_date=exam_date,
+            start_time=start_time,
+            end_time=end_time,
+            attendees=attendees,
+            status='PENDING',
+            created_at=now,
+            updated_at=now,
+        )
+        reservation._state.adding = False
+        reservation._state.db = connection.alias
+        return reservation
+
+    def _lock_reservation(self, reservation):
+        """
+        예약 행을 잠그고 현재 상태를 reservation 에 반영
+
+        reservation 은 요청 초반에 조회한 객체이므로 그 사이 다른 요청이 수정, 삭제했을 수 있다.
+        집계, 변경 기록은 잠근 행의 상태를 기준으로 계산한다.
+
+        Returns:
+            잠근 예약의 현재 상태 (rollups.reservation_state 형식)
+
+        Raises:
+            ReservationNotFoundException: 예약이 이미 삭제된 경우
+        """
+        current = Reservation.objects.select_for_update().filter(id=reservation.id).values(*STATE_FIELDS).first()
+        if current is None:
+            raise ReservationNotFoundException()
+        for field, value in current.items():
+            setattr(reservation, field, value)
+        return reservation_state(reservation)
+
+    def _save_reservation(self, reservation):
+        """
+        예약 저장 (확정 인원 제한 트리거의 오류는 ReservationAttendeesException 으로 변환)
+
+        Raises:
+            ReservationAttendeesException: 저장하면 시간대별 확정 인원이 최대 인원을 넘는 경우
+        """
+        try:
+            with transaction.atomic():
+                reservation.save()
+        except IntegrityError as e:
+            if capacity.is_capacity_error(e):
+                raise ReservationAttendeesException(f'동 시간대 최대 {MAX_ATTENDEES_PER_TIMESLOT}명 까지 예약할 수 있습니다.')
+            raise
+
+    def _released_capacity(self, reservations):
+        """삭제한 확정 예약이 차지하던 시간대별 인원"""
+        released = {}
+        for reservation in reservations:
+            if reservation['status'] != 'CONFIRMED':
+                continue
+            for hour in HOURS:
+                if reservation['start_time'] < time(hour + 1, 0) and reservation['end_time'] > time(hour, 0):
+                    key = (reservation['exam_date'], hour)
+                    released[key] = released.get(key, 0) + reservation['attendees']
+
+        return [
+            {
+                'exam_date': exam_date,
+                'start_time': time(hour, 0),
+                'end_time': time(hour + 1, 0),
+                'released_attendees': attendees,
+            }
+            for (exam_date, hour), attendees in sorted(released.items())
+        ]
 
     def _check_available_attendees(self, exam_date, start_time, end_time):
         """
@@ -235,14 +870,8 @@ class ReservationManager:
         Returns:
             available_attendees: 예약 가능한 최대 인원 수
         """
-        # 모든 시간대 슬롯 정보 가져오기
-        all_slots = self._get_available_slots(exam_date)
-
-        # 요청한 시간대와 겹치는 슬롯만 필터링
-        slots = [
-            slot for slot in all_slots
-            if (start_time < slot['end_time'] and end_time > slot['start_time'])
-        ]
+        # 요청한 시간대와 겹치는 슬롯 정보만 가져오기 (겹치는 예약만 조회)
+        slots = self._get_available_slots(exam_date, start_time, end_time)
 
         if not slots:
             return MAX_ATTENDEES_PER_TIMESLOT  # 겹치는 슬롯이 없으면 최대 인원 반환
@@ -252,12 +881,78 @@ class ReservationManager:
 
         return available_attendees
 
-    def _get_available_slots(self, exam_date):
+    def _get_utilization_heatmap(self, start_date, end_date):
+        """
+        날짜 × 시간대별 확정, 대기 응시 인원 계산
+
+        같은 날짜, 시간, 상태의 예약을 DB 에서 합산한 뒤 (한 번의 쿼리)
+        _get_available_slots 와 같은 기준으로 예약 시간과 겹치는 1시간 단위 시간대에 인원을 더한다.
+        """
+        hours = list(range(OPERATION_START_TIME.hour, OPERATION_END_TIME.hour))
+        days = (end_date - start_date).days + 1
+        dates = [start_date + timedelta(days=offset) for offset in range(days)]
+        matrix = {
+            'CONFIRMED': [[0] * len(hours) for _ in dates],
+            'PENDING': [[0] * len(hours) for _ in dates],
+        }
+
+        totals = Reservation.objects.filter(
+            exam_date__gte=start_date,
+            exam_date__lte=end_date,
+        ).values('exam_date', 'start_time', 'end_time', 'status').annotate(total=Sum('attendees')).order_by()
+
+        for row in totals:
+            if row['status'] not in matrix:
+                continue
+            day = matrix[row['status']][(row['exam_date'] - start_date).days]
+            for index, hour in enumerate(hours):
+                if row['start_time'] < time(hour + 1, 0) and row['end_time'] > time(hour, 0):
+                    day[index] += row['total']
+
+        return {
+            'start': start_date,
+            'end': end_date,
+            'hours': hours,
+            'dates': dates,
+            'confirmed': matrix['CONFIRMED'],
+            'pending': matrix['PENDING'],
+        }
+
+    def _get_shared_available_slots(self, exam_date):
+        """
+        같은 날짜를 동시에 조회하는 요청들이 진행 중인 한 번의 계산 결과를 함께 사용
+
+        워커 프로세스 내에서는 항상 합치고, AVAILABLE_SLOTS_CACHE_SINGLE_FLIGHT 설정이 켜져 있으면
+        캐시 락으로 워커 프로세스 간에도 합친다.
+        primary 로 고정된 요청이 복제본에서 계산한 결과를 받지 않도록 읽기 데이터베이스별로 따로 합친다.
+
+        Args:
+            exam_date: 조회할 날짜
+
+        Returns:
+            time_slots: _get_available_slots 와 같은 형식의 시간대 정보 목록 (요청마다 복사본)
+        """
+        using = router.db_for_read(Reservation)
+
+        def compute():
+            if getattr(settings, 'AVAILABLE_SLOTS_CACHE_SINGLE_FLIGHT', False):
+                return cache_single_flight(
+                    f'available_slots:{using}:{exam_date.isoformat()}',
+                    lambda: self._get_available_slots(exam_date),
+                )
+            return self._get_available_slots(exam_date)
+
+        time_slots = available_slots_flight.do((using, exam_date), compute)
+        return [dict(slot) for slot in time_slots]
+
+    def _get_available_slots(self, exam_date, start_time=None, end_time=None):
         """
         특정 날짜에 시간대와 예약 가능 인원 정보를 반환
 
         Args:
             exam_date: 조회할 날짜
+            start_time: 시작 시간 (end_time 과 함께 주면 이 시간대와 겹치는 슬롯과 예약만 계산)
+            end_time: 종료 시간
 
         Returns:
             time_slots: 시간대와 가능 인원 정보 목록
@@ -267,11 +962,28 @@ class ReservationManager:
                 ...
             ]
         """
-        # 해당 날짜의 모든 확정 예약 조회
+        # 해당 날짜의 확정 예약 조회
         confirmed_reservations = Reservation.objects.filter(
             status='CONFIRMED',
             exam_date=exam_date
-        ).values('start_time', 'end_time', 'attendees')
+        )
+
+        # 만료되지 않은 확보 인원 조회 (시험 날짜, 만료 일시 인덱스 사용)
+        active_holds = ReservationHold.objects.filter(
+            exam_date=exam_date,
+            expires_at__gt=timezone.now()
+        )
+
+        window = start_time is not None and end_time is not None
+        if window:
+            # 시간대가 겹치는 예약만 DB 에서 조회 (PostgreSQL 은 time_window GiST 인덱스 사용)
+            confirmed_reservations = confirmed_reservations.filter(
+                time_ranges.overlap_filter(connection, exam_date, start_time, end_time)
+            )
+            active_holds = active_holds.filter(start_time__lt=end_time, end_time__gt=start_time)
+
+        confirmed_reservations = confirmed_reservations.values('start_time', 'end_time', 'attendees')
+        active_holds = active_holds.values('start_time', 'end_time', 'attendees')
 
         # 1시간 단위 슬롯
         time_slots = []
@@ -280,15 +992,17 @@ class ReservationManager:
         while current_hour < OPERATION_END_TIME.hour:
             slot_start = time(current_hour, 0)
             slot_end = time(current_hour + 1, 0)
+            current_hour += 1
+            if window and not (start_time < slot_end and end_time > slot_start):
+                continue
             time_slots.append({
                 'start_time': slot_start,
                 'end_time': slot_end,
                 'available': MAX_ATTENDEES_PER_TIMESLOT
             })
-            current_hour += 1
 
-        # 각 예약이 영향을 미치는 슬롯 계산
-        for reservation in confirmed_reservations:
+        # 각 예약, 확보 인원이 영향을 미치는 슬롯 계산
+        for reservation in chain(confirmed_reservations, active_holds):
             res_start = reservation['start_time']
             res_end = reservation['end_time']
             res_attendees = reservation['attendees']
@@ -0,0 +1,40 @@
+# Generated by Django 4.2 on 2026-10-19 08:48
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('reservations', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReservationArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='예약 ID')),
+                ('exam_date', models.DateField(verbose_name='시험 날짜')),
+                ('start_time', models.TimeField(verbose_name='시작 시간')),
+                ('end_time', models.TimeField(verbose_name='종료 시간')),
+                ('attendees', models.PositiveIntegerField(verbose_name='응시 인원')),
+                ('status', models.CharField(choices=[('PENDING', '대기중'), ('CONFIRMED', '확정')], max_length=50, verbose_name='상태')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='보관 일시')),
+            ],
+            options={
+                'db_table': 'reservations_archive',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['exam_date'], name='reservations_exam_date_idx'),
+        ),
+        migrations.AddField(
+            model_name='reservationarchive',
+            name='company_customer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='기업 사용자'),
+        ),
+    ]
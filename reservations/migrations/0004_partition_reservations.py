@@ -0,0 +1,22 @@
+from django.db import migrations
+
+from reservations import partitions
+
+
+def partition_reservations(apps, schema_editor):
+    # PostgreSQL 에서 RESERVATION_PARTITIONING 이 켜져 있는 경우에만 전환
+    if not partitions.is_enabled(schema_editor.connection):
+        return
+    with schema_editor.connection.cursor() as cursor:
+        partitions.convert_to_partitioned(cursor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0003_reservation_archive'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_reservations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2 on 2026-10-19 08:56
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('reservations', '0004_partition_reservations'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReservationHold',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('exam_date', models.DateField(verbose_name='시험 날짜')),
+                ('start_time', models.TimeField(verbose_name='시작 시간')),
+                ('end_time', models.TimeField(verbose_name='종료 시간')),
+                ('attendees', models.PositiveIntegerField(verbose_name='응시 인원')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='만료 일시')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성 일시')),
+                ('company_customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='기업 사용자')),
+            ],
+            options={
+                'db_table': 'reservation_holds',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='reservationhold',
+            index=models.Index(fields=['exam_date', 'expires_at'], name='reservation_holds_date_exp_idx'),
+        ),
+    ]
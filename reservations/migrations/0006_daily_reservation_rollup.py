@@ -0,0 +1,31 @@
+# Generated by Django 4.2 on 2026-10-19 09:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0005_reservation_hold'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyReservationRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('exam_date', models.DateField(unique=True, verbose_name='시험 날짜')),
+                ('confirmed_count', models.IntegerField(default=0, verbose_name='확정 예약 수')),
+                ('pending_count', models.IntegerField(default=0, verbose_name='대기 예약 수')),
+                ('confirmed_attendees', models.IntegerField(default=0, verbose_name='확정 응시 인원')),
+                ('pending_attendees', models.IntegerField(default=0, verbose_name='대기 응시 인원')),
+                ('hourly_confirmed_attendees', models.JSONField(default=list, verbose_name='시간대별 확정 응시 인원')),
+                ('peak_hour_attendees', models.IntegerField(default=0, verbose_name='최대 시간대 확정 응시 인원')),
+                ('company_counts', models.JSONField(default=dict, verbose_name='기업 사용자별 예약 수')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정 일시')),
+            ],
+            options={
+                'db_table': 'reservation_daily_rollups',
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2 on 2026-10-19 09:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0006_daily_reservation_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReservationChange',
+            fields=[
+                ('seq', models.BigAutoField(primary_key=True, serialize=False, verbose_name='순번')),
+                ('reservation_id', models.BigIntegerField(verbose_name='예약 ID')),
+                ('company_customer_id', models.BigIntegerField(verbose_name='기업 사용자 ID')),
+                ('operation', models.CharField(choices=[('CREATE', '생성'), ('UPDATE', '수정'), ('DELETE', '삭제'), ('ARCHIVE', '보관')], max_length=20, verbose_name='변경 종류')),
+                ('payload', models.JSONField(verbose_name='변경 내용')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='기록 일시')),
+            ],
+            options={
+                'db_table': 'reservation_changes',
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2 on 2026-10-19 09:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('reservations', '0007_reservation_change'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReservationTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reservation_id', models.BigIntegerField(verbose_name='예약 ID')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, verbose_name='삭제 일시')),
+            ],
+            options={
+                'db_table': 'reservation_tombstones',
+            },
+        ),
+        migrations.AddField(
+            model_name='reservation',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now, verbose_name='생성 일시'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='reservation',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='수정 일시'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['company_customer', 'updated_at', 'id'], name='reservations_company_sync_idx'),
+        ),
+        migrations.AddField(
+            model_name='reservationtombstone',
+            name='company_customer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='기업 사용자'),
+        ),
+        migrations.AddIndex(
+            model_name='reservationtombstone',
+            index=models.Index(fields=['company_customer', 'deleted_at', 'id'], name='reservation_tombstone_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservationtombstone',
+            index=models.Index(fields=['deleted_at'], name='reservation_tombstone_del_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2 on 2026-10-19 09:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0008_reservation_sync'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['-exam_date', 'start_time', 'id'], name='reservations_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['company_customer', '-exam_date', 'start_time', 'id'], name='reservations_company_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['attendees', 'id'], name='reservations_attendees_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['company_customer', 'attendees', 'id'], name='reservations_company_att_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['updated_at', 'id'], name='reservations_updated_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='reservation',
+            name='reservations_exam_date_idx',
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+from reservations import capacity
+
+
+def install_capacity_triggers(apps, schema_editor):
+    # RESERVATION_CAPACITY_TRIGGERS 가 켜져 있는 경우에만 설치
+    if not capacity.is_enabled(schema_editor.connection):
+        return
+    capacity.install(schema_editor.connection)
+
+
+def uninstall_capacity_triggers(apps, schema_editor):
+    capacity.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0009_reservation_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_capacity_triggers, uninstall_capacity_triggers),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+from reservations import time_ranges
+
+
+def install_time_range_index(apps, schema_editor):
+    # PostgreSQL 에서 RESERVATION_TIME_RANGE_INDEX 가 켜져 있는 경우에만 설치
+    if not time_ranges.is_enabled(schema_editor.connection):
+        return
+    time_ranges.install(schema_editor.connection)
+
+
+def uninstall_time_range_index(apps, schema_editor):
+    time_ranges.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0010_reservation_capacity_triggers'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_time_range_index, uninstall_time_range_index),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2 on 2026-10-19 09:31
+
+from django.db import migrations, models
+
+from reservations import rollups
+
+
+def fill_rollup_counters(apps, schema_editor):
+    # 기존 날짜별 집계 대신 원본 예약(운영 + 보관 테이블)으로 집계 행 계산
+    counter_model = apps.get_model('reservations', 'ReservationRollupCounter')
+    counters = rollups.compute_counters(sources=(
+        apps.get_model('reservations', 'Reservation'),
+        apps.get_model('reservations', 'ReservationArchive'),
+    ))
+    counter_model.objects.bulk_create(
+        [counter_model(**row) for row in rollups.counter_rows(counters)],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0011_reservation_time_range_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReservationRollupCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('exam_date', models.DateField(verbose_name='시험 날짜')),
+                ('company_customer_id', models.BigIntegerField(verbose_name='기업 사용자 ID')),
+                ('hour', models.SmallIntegerField(verbose_name='시간대')),
+                ('reservation_count', models.IntegerField(default=0, verbose_name='예약 수')),
+                ('confirmed_count', models.IntegerField(default=0, verbose_name='확정 예약 수')),
+                ('pending_count', models.IntegerField(default=0, verbose_name='대기 예약 수')),
+                ('confirmed_attendees', models.IntegerField(default=0, verbose_name='확정 응시 인원')),
+                ('pending_attendees', models.IntegerField(default=0, verbose_name='대기 응시 인원')),
+                ('hour_confirmed_attendees', models.IntegerField(default=0, verbose_name='시간대 확정 응시 인원')),
+            ],
+            options={
+                'db_table': 'reservation_rollup_counters',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='reservationrollupcounter',
+            constraint=models.UniqueConstraint(fields=('exam_date', 'company_customer_id', 'hour'), name='reservation_rollup_counter_key'),
+        ),
+        migrations.RunPython(fill_rollup_counters, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name='DailyReservationRollup',
+        ),
+    ]
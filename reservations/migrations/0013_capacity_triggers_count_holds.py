@@ -0,0 +1,21 @@
+from django.db import migrations
+
+from reservations import capacity
+
+
+def reinstall_capacity_triggers(apps, schema_editor):
+    # 만료되지 않은 확보 인원도 합산하도록 트리거를 다시 설치 (켜져 있는 경우에만)
+    if not capacity.is_enabled(schema_editor.connection):
+        return
+    capacity.install(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0012_reservation_rollup_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(reinstall_capacity_triggers, migrations.RunPython.noop),
+    ]
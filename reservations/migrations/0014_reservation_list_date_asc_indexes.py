@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-19 09:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0013_capacity_triggers_count_holds'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['exam_date', 'start_time', 'id'], name='reservations_date_asc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['company_customer', 'exam_date', 'start_time', 'id'], name='reservations_cmp_date_asc_idx'),
+        ),
+    ]
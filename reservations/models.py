@@ -1,6 +1,6 @@
 from django.db import models
 
-from reservations.choices import STATUS_CHOICES
+from reservations.choices import STATUS_CHOICES, CHANGE_OPERATION_CHOICES
 from users.models import User
 
 
@@ -28,9 +28,233 @@ class Reservation(models.Model):
         max_length=50,
         default='PENDING',
     )
+    created_at = models.DateTimeField(
+        verbose_name='생성 일시',
+        auto_now_add=True,
+    )
+    updated_at = models.DateTimeField(
+        verbose_name='수정 일시',
+        auto_now=True,
+    )
 
     class Meta:
         db_table = "reservations"
+        indexes = [
+            # 예약 목록 정렬(RESERVATION_LIST_SORTS)별 인덱스 (어드민 전체 조회, 기업 사용자/기업 조건 조회)
+            # exam_date 로 시작하는 인덱스는 시험 날짜 조건 조회에도 사용
+            models.Index(fields=['-exam_date', 'start_time', 'id'], name='reservations_date_idx'),
+            models.Index(fields=['company_customer', '-exam_date', 'start_time', 'id'],
+                         name='reservations_company_date_idx'),
+            # 시험 날짜 오름차순은 시간, id 도 오름차순이므로 별도 인덱스 사용 (-exam_date 인덱스의 역순과 다름)
+            models.Index(fields=['exam_date', 'start_time', 'id'], name='reservations_date_asc_idx'),
+            models.Index(fields=['company_customer', 'exam_date', 'start_time', 'id'],
+                         name='reservations_cmp_date_asc_idx'),
+            models.Index(fields=['attendees', 'id'], name='reservations_attendees_idx'),
+            models.Index(fields=['company_customer', 'attendees', 'id'], name='reservations_company_att_idx'),
+            models.Index(fields=['updated_at', 'id'], name='reservations_updated_idx'),
+            # 기업 사용자별 변경분 동기화 (updated_at, id 순 조회)
+            models.Index(fields=['company_customer', 'updated_at', 'id'], name='reservations_company_sync_idx'),
+        ]
 
     def __str__(self):
         return f'{self.company_customer}: {self.exam_date} / {self.start_time} - {self.end_time}'
+
+
+class ReservationArchive(models.Model):
+    """시험 날짜가 보관 기간을 지난 예약. id 는 원본 예약 id 를 그대로 사용"""
+    id = models.BigIntegerField(
+        verbose_name='예약 ID',
+        primary_key=True,
+    )
+    company_customer = models.ForeignKey(
+        User,
+        verbose_name='기업 사용자',
+        on_delete=models.CASCADE,
+    )
+    exam_date = models.DateField(
+        verbose_name='시험 날짜'
+    )
+    start_time = models.TimeField(
+        verbose_name='시작 시간'
+    )
+    end_time = models.TimeField(
+        verbose_name='종료 시간'
+    )
+    attendees = models.PositiveIntegerField(
+        verbose_name='응시 인원'
+    )
+    status = models.CharField(
+        verbose_name='상태',
+        choices=STATUS_CHOICES,
+        max_length=50,
+    )
+    archived_at = models.DateTimeField(
+        verbose_name='보관 일시',
+        auto_now_add=True,
+    )
+
+    class Meta:
+        db_table = "reservations_archive"
+
+    def __str__(self):
+        return f'{self.company_customer}: {self.exam_date} / {self.start_time} - {self.end_time} (보관)'
+
+
+class ReservationHold(models.Model):
+    """예약 신청 전 일정 시간 동안 확보한 응시 인원. 만료된 확보 정보는 예약 가능 인원 계산에서 제외"""
+    company_customer = models.ForeignKey(
+        User,
+        verbose_name='기업 사용자',
+        on_delete=models.CASCADE,
+    )
+    exam_date = models.DateField(
+        verbose_name='시험 날짜'
+    )
+    start_time = models.TimeField(
+        verbose_name='시작 시간'
+    )
+    end_time = models.TimeField(
+        verbose_name='종료 시간'
+    )
+    attendees = models.PositiveIntegerField(
+        verbose_name='응시 인원'
+    )
+    expires_at = models.DateTimeField(
+        verbose_name='만료 일시',
+        db_index=True,
+    )
+    created_at = models.DateTimeField(
+        verbose_name='생성 일시',
+        auto_now_add=True,
+    )
+
+    class Meta:
+        db_table = "reservation_holds"
+        indexes = [
+            models.Index(fields=['exam_date', 'expires_at'], name='reservation_holds_date_exp_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.company_customer}: {self.exam_date} / {self.start_time} - {self.end_time} (확보)'
+
+
+class ReservationRollupCounter(models.Model):
+    """
+    시험 날짜 × 기업 사용자 × 시간대별 예약 집계 (보관된 예약 포함)
+
+    ReservationManager 에서 예약이 변경될 때 해당 행의 값만 증감하고, 날짜별 집계는 조회할 때 합산한다. (reservations/rollups.py)
+    날짜 전체가 아닌 (날짜, 기업 사용자, 시간대) 행만 잠기므로 같은 날짜의 예약을 동시에 변경해도 서로 기다리지 않는다.
+    - 예약 수, 상태별 예약 수와 응시 인원: 예약 시작 시간의 시간대(hour) 행에 기록
+    - 시간대별 확정 응시 인원: 확정 예약과 겹치는 시간대마다 기록
+    """
+    exam_date = models.DateField(
+        verbose_name='시험 날짜',
+    )
+    company_customer_id = models.BigIntegerField(
+        verbose_name='기업 사용자 ID',
+    )
+    hour = models.SmallIntegerField(
+        verbose_name='시간대',
+    )
+    reservation_count = models.IntegerField(
+        verbose_name='예약 수',
+        default=0,
+    )
+    confirmed_count = models.IntegerField(
+        verbose_name='확정 예약 수',
+        default=0,
+    )
+    pending_count = models.IntegerField(
+        verbose_name='대기 예약 수',
+        default=0,
+    )
+    confirmed_attendees = models.IntegerField(
+        verbose_name='확정 응시 인원',
+        default=0,
+    )
+    pending_attendees = models.IntegerField(
+        verbose_name='대기 응시 인원',
+        default=0,
+    )
+    hour_confirmed_attendees = models.IntegerField(
+        verbose_name='시간대 확정 응시 인원',
+        default=0,
+    )
+
+    class Meta:
+        db_table = "reservation_rollup_counters"
+        constraints = [
+            models.UniqueConstraint(fields=['exam_date', 'company_customer_id', 'hour'],
+                                    name='reservation_rollup_counter_key'),
+        ]
+
+    def __str__(self):
+        return f'{self.exam_date} {self.hour}시 / 기업 사용자 {self.company_customer_id}'
+
+
+class ReservationChange(models.Model):
+    """
+    예약 변경 기록 (outbox)
+
+    ReservationManager 에서 예약을 변경한 트랜잭션 안에서 함께 기록하며, seq 순서로 읽어 변경분만 반영할 수 있다.
+    파티션 테이블의 기본 키는 (id, exam_date) 이므로 예약은 외래 키 대신 id 로 참조한다.
+    """
+    seq = models.BigAutoField(
+        verbose_name='순번',
+        primary_key=True,
+    )
+    reservation_id = models.BigIntegerField(
+        verbose_name='예약 ID',
+    )
+    company_customer_id = models.BigIntegerField(
+        verbose_name='기업 사용자 ID',
+    )
+    operation = models.CharField(
+        verbose_name='변경 종류',
+        choices=CHANGE_OPERATION_CHOICES,
+        max_length=20,
+    )
+    payload = models.JSONField(
+        verbose_name='변경 내용',
+    )
+    created_at = models.DateTimeField(
+        verbose_name='기록 일시',
+        auto_now_add=True,
+        db_index=True,
+    )
+
+    class Meta:
+        db_table = "reservation_changes"
+
+    def __str__(self):
+        return f'#{self.seq} {self.operation} 예약 {self.reservation_id}'
+
+
+class ReservationTombstone(models.Model):
+    """
+    삭제(보관 포함)된 예약 기록
+
+    변경분 동기화에서 삭제된 예약을 알려주기 위해 RESERVATION_TOMBSTONE_RETENTION_DAYS 동안 보관한다.
+    """
+    reservation_id = models.BigIntegerField(
+        verbose_name='예약 ID',
+    )
+    company_customer = models.ForeignKey(
+        User,
+        verbose_name='기업 사용자',
+        on_delete=models.CASCADE,
+    )
+    deleted_at = models.DateTimeField(
+        verbose_name='삭제 일시',
+        auto_now_add=True,
+    )
+
+    class Meta:
+        db_table = "reservation_tombstones"
+        indexes = [
+            models.Index(fields=['company_customer', 'deleted_at', 'id'], name='reservation_tombstone_sync_idx'),
+            models.Index(fields=['deleted_at'], name='reservation_tombstone_del_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.company_customer}: 예약 {self.reservation_id} 삭제'
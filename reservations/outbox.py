@@ -0,0 +1,133 @@
+"""
+예약 변경 기록(outbox)
+
+ReservationManager 가 예약을 생성, 수정, 삭제, 보관할 때 같은 트랜잭션 안에서 ReservationChange 를 추가한다.
+변경 기록은 seq 순서로 읽으며, 소비자는 마지막으로 읽은 seq 를 cursor 로 보관해 이후 변경분만 반영한다.
+
+payload
+- before: 변경 전 예약 (생성이면 없음)
+- after: 변경 후 예약 (삭제, 보관이면 없음)
+
+seq 는 기록 시점에 정해지므로 동시에 진행 중인 트랜잭션이 더 작은 seq 를 늦게 커밋할 수 있다.
+읽을 때 visible_before 이후에 기록된 변경은 제외해 이런 기록을 건너뛰지 않도록 한다.
+진행 중인 트랜잭션을 확인할 수 있도록 변경 기록은 항상 primary 에서 읽는다.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from programmers_exam_reservation.utils.db_routers import use_primary
+from reservations.models import ReservationChange
+
+PAYLOAD_FIELDS = ('exam_date', 'start_time', 'end_time', 'attendees', 'status')
+
+
+def _payload_state(state):
+    return {
+        field: value.isoformat() if hasattr(value, 'isoformat') else value
+        for field, value in state.items()
+        if field in PAYLOAD_FIELDS
+    }
+
+
+def _change(operation, reservation_id, before=None, after=None):
+    payload = {}
+    if before is not None:
+        payload['before'] = _payload_state(before)
+    if after is not None:
+        payload['after'] = _payload_state(after)
+
+    return ReservationChange(
+        reservation_id=reservation_id,
+        company_customer_id=(after or before)['company_customer_id'],
+        operation=operation,
+        payload=payload,
+    )
+
+
+def record_change(operation, reservation_id, before=None, after=None):
+    """
+    예약 변경 기록 추가 (예약을 변경한 트랜잭션 안에서 호출)
+
+    Args:
+        operation: CREATE, UPDATE, DELETE
+        reservation_id: 예약 ID
+        before: 변경 전 예약 상태 (rollups.reservation_state)
+        after: 변경 후 예약 상태
+    """
+    if operation == 'UPDATE' and before == after:
+        return
+    _change(operation, reservation_id, before, after).save()
+
+
+def record_removed(operation, reservations):
+    """
+    삭제(DELETE) 또는 보관(ARCHIVE)한 예약 목록의 변경 기록을 한 번에 추가
+
+    Args:
+        reservations: id 를 포함한 변경 전 예약 상태 목록
+    """
+    ReservationChange.objects.bulk_create([
+        _change(operation, reservation['id'], before=reservation) for reservation in reservations
+    ])
+
+
+def record_archived(reservations):
+    """보관 테이블로 이동한 예약 목록의 변경 기록을 한 번에 추가"""
+    record_removed('ARCHIVE', reservations)
+
+
+def visible_before():
+    """
+    이 일시까지 기록된 변경(기록, 수정, 삭제 일시)은 모두 커밋 또는 롤백되어 이후에 새로 나타나지 않음
+
+    - PostgreSQL: 쓰기를 시작한(트랜잭션 ID 가 할당된) 다른 트랜잭션 중 가장 오래된 트랜잭션의 시작 일시 기준.
+      진행 중인 트랜잭션의 변경은 그 트랜잭션이 시작된 이후의 일시로 기록되므로, 오래 걸리는 트랜잭션이 있으면
+      그 트랜잭션이 끝날 때까지 이후의 변경을 제외한다. (pg_stat_activity 는 같은 데이터베이스 사용자의 세션만 확인 가능)
+    - 그 외: 현재 일시 기준
+
+    애플리케이션 서버 간 시계 차이와 일시를 정한 뒤 쿼리를 실행하기까지의 시간을 고려해
+    RESERVATION_CHANGE_VISIBILITY_SECONDS 만큼 더 이전으로 한다.
+    """
+    bound = timezone.now()
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT EXTRACT(EPOCH FROM clock_timestamp() - MIN(xact_start)) FROM pg_stat_activity "
+                "WHERE datname = current_database() AND backend_xid IS NOT NULL AND pid <> pg_backend_pid()"
+            )
+            oldest_age = cursor.fetchone()[0]
+        if oldest_age is not None:
+            bound -= timedelta(seconds=max(float(oldest_age), 0))
+    return bound - timedelta(seconds=getattr(settings, 'RESERVATION_CHANGE_VISIBILITY_SECONDS', 1))
+
+
+@use_primary()
+def read_changes(after_seq=0, limit=500):
+    """
+    after_seq 이후의 변경 기록
+
+    Returns:
+        list[ReservationChange]: seq 순 최대 limit 개
+    """
+    return list(
+        ReservationChange.objects.filter(seq__gt=after_seq, created_at__lte=visible_before()).order_by('seq')[:limit]
+    )
+
+
+def prune_changes(before, batch_size=10000):
+    """
+    before 이전에 기록된 변경 기록 중 batch_size 만큼 삭제
+
+    Returns:
+        삭제한 기록 수 (0 이면 더 이상 삭제할 기록이 없음)
+    """
+    seqs = list(
+        ReservationChange.objects.filter(created_at__lt=before).order_by('seq').values_list('seq', flat=True)[:batch_size]
+    )
+    if not seqs:
+        return 0
+    ReservationChange.objects.filter(seq__gte=seqs[0], seq__lte=seqs[-1], created_at__lt=before).delete()
+    return len(seqs)
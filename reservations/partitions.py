@@ -0,0 +1,182 @@
+"""
+PostgreSQL 예약 테이블 월 단위 파티셔닝
+
+settings.RESERVATION_PARTITIONING 이 켜져 있고 PostgreSQL 을 사용하는 경우에만 동작한다.
+reservations 테이블을 exam_date 기준 RANGE 파티션 테이블로 전환하며,
+파티션 키가 기본 키에 포함되어야 하므로 기본 키는 (id, exam_date) 가 된다.
+SQLite 등 다른 데이터베이스는 기존처럼 단일 테이블을 사용한다.
+"""
+from datetime import date
+
+from django.conf import settings
+
+# 마이그레이션에서도 사용하므로 모델을 import 하지 않고 테이블 이름을 직접 지정
+TABLE = 'reservations'
+DEFAULT_PARTITION = f'{TABLE}_default'
+SEQUENCE = f'{TABLE}_id_seq'
+_LEGACY_TABLE = f'{TABLE}_unpartitioned'
+
+
+def is_enabled(connection):
+    return connection.vendor == 'postgresql' and getattr(settings, 'RESERVATION_PARTITIONING', False)
+
+
+def month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def add_months(value, months):
+    month_index = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f'{TABLE}_p{month.year:04d}_{month.month:02d}'
+
+
+def is_partitioned(cursor):
+    cursor.execute(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+        [TABLE],
+    )
+    return cursor.fetchone()[0]
+
+
+def list_partitions(cursor):
+    """
+    파티션 목록 (기본 파티션 제외)
+
+    Returns:
+        [(partition_name, month_start), ...] (월 순 정렬)
+    """
+    cursor.execute(
+        """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = %s
+        """,
+        [TABLE],
+    )
+    partitions = []
+    prefix = f'{TABLE}_p'
+    for (name,) in cursor.fetchall():
+        if not name.startswith(prefix):
+            continue
+        year, month = name[len(prefix):].split('_')
+        partitions.append((name, date(int(year), int(month), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def create_partition(cursor, month):
+    """month 가 속한 월의 파티션 생성 (이미 있으면 무시)"""
+    month = month_start(month)
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(month)}" PARTITION OF "{TABLE}" '
+        f'FOR VALUES FROM (%s) TO (%s)',
+        [month, add_months(month, 1)],
+    )
+
+
+def ensure_partitions(cursor, start_month, end_month):
+    """start_month 부터 end_month 까지 월별 파티션 생성"""
+    month = month_start(start_month)
+    created = []
+    while month <= end_month:
+        create_partition(cursor, month)
+        created.append(partition_name(month))
+        month = add_months(month, 1)
+    return created
+
+
+def detach_partitions_before(cursor, before_month, drop=False):
+    """
+    before_month 이전 월의 파티션을 분리
+
+    파티션 분리는 데이터를 옮기지 않는 메타데이터 변경이므로 데이터 양과 관계없이 O(1) 이다.
+
+    Returns:
+        분리한 파티션 이름 목록
+    """
+    detached = []
+    for name, month in list_partitions(cursor):
+        if month >= month_start(before_month):
+            break
+        cursor.execute(f'ALTER TABLE "{TABLE}" DETACH PARTITION "{name}"')
+        if drop:
+            cursor.execute(f'DROP TABLE "{name}"')
+        detached.append(name)
+    return detached
+
+
+def convert_to_partitioned(cursor, months_ahead=3):
+    """
+    기존 reservations 테이블을 월 단위 파티션 테이블로 전환
+
+    기존 테이블 이름을 바꾼 뒤 같은 구조의 파티션 테이블을 만들고 데이터를 옮긴다.
+    외래 키와 인덱스는 기존 정의 그대로 다시 생성한다.
+
+    파티션 테이블의 identity 컬럼은 PostgreSQL 17 부터 지원하므로 id 는 identity 나 serial 여부와 관계없이
+    새 시퀀스를 기본값으로 사용하도록 다시 만든다. (기존 시퀀스는 기존 테이블과 함께 삭제된다)
+    """
+    if is_partitioned(cursor):
+        return
+
+    # 기존 인덱스, 외래 키 정의 보관
+    cursor.execute(
+        """
+        SELECT indexdef FROM pg_indexes
+        WHERE tablename = %s AND indexname NOT IN (
+            SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'
+        )
+        """,
+        [TABLE, TABLE],
+    )
+    index_definitions = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+        [TABLE],
+    )
+    foreign_keys = cursor.fetchall()
+
+    cursor.execute(f'ALTER TABLE "{TABLE}" RENAME TO "{_LEGACY_TABLE}"')
+    cursor.execute(
+        f'CREATE TABLE "{TABLE}" (LIKE "{_LEGACY_TABLE}" INCLUDING DEFAULTS '
+        f'INCLUDING CONSTRAINTS INCLUDING GENERATED) PARTITION BY RANGE (exam_date)'
+    )
+    # serial 인 경우 복사된 기본값이 기존 테이블의 시퀀스를 참조하므로 제거
+    cursor.execute(f'ALTER TABLE "{TABLE}" ALTER COLUMN id DROP DEFAULT')
+    cursor.execute(f'ALTER TABLE "{TABLE}" ADD PRIMARY KEY (id, exam_date)')
+    cursor.execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT')
+
+    # 기존 데이터 범위와 앞으로 months_ahead 개월의 파티션 생성
+    cursor.execute(f'SELECT MIN(exam_date), MAX(exam_date) FROM "{_LEGACY_TABLE}"')
+    min_date, max_date = cursor.fetchone()
+    this_month = month_start(date.today())
+    start_month = month_start(min_date) if min_date else this_month
+    end_month = max(month_start(max_date) if max_date else this_month, add_months(this_month, months_ahead))
+    ensure_partitions(cursor, min(start_month, this_month), end_month)
+
+    # 생성 컬럼(time_ranges 의 time_window 등)은 값을 넣을 수 없으므로 제외하고 복사
+    cursor.execute(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_name = %s AND is_generated = 'NEVER' ORDER BY ordinal_position",
+        [_LEGACY_TABLE],
+    )
+    columns = ', '.join(f'"{row[0]}"' for row in cursor.fetchall())
+    cursor.execute(f'INSERT INTO "{TABLE}" ({columns}) SELECT {columns} FROM "{_LEGACY_TABLE}"')
+    cursor.execute(f'DROP TABLE "{_LEGACY_TABLE}"')
+
+    cursor.execute(f'CREATE SEQUENCE "{SEQUENCE}" OWNED BY "{TABLE}".id')
+    cursor.execute(f"ALTER TABLE \"{TABLE}\" ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}')")
+    cursor.execute(
+        f'SELECT setval(%s, COALESCE((SELECT MAX(id) FROM "{TABLE}"), 0) + 1, false)',
+        [SEQUENCE],
+    )
+
+    for definition in index_definitions:
+        cursor.execute(definition)
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{name}" {definition}')
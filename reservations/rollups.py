@@ -0,0 +1,314 @@
+"""
+시험 날짜별 예약 집계 관리
+
+집계는 (시험 날짜, 기업 사용자, 시간대) 단위의 ReservationRollupCounter 행에 저장하고, 날짜별 값은 조회할 때 합산한다.
+예약이 생성, 수정, 삭제될 때 변경 전 상태를 빼고 변경 후 상태를 더한 증감분만 한 번의 INSERT ... ON CONFLICT 로 반영한다.
+날짜 전체의 집계 행을 잠그지 않으므로 같은 날짜의 예약을 변경하는 요청들이 집계 때문에 서로 기다리지 않는다.
+집계는 보관된 예약을 포함하므로 보관 테이블로 이동할 때는 갱신하지 않는다.
+
+backfill / find_mismatches 는 원본 예약(운영 + 보관 테이블)으로 집계를 다시 계산한다.
+"""
+from datetime import time, timedelta
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, Sum, Max, Min
+
+from reservations.constants import OPERATION_START_TIME, OPERATION_END_TIME
+from reservations.models import Reservation, ReservationArchive, ReservationRollupCounter
+
+HOURS = list(range(OPERATION_START_TIME.hour, OPERATION_END_TIME.hour))
+
+STATE_FIELDS = ('company_customer_id', 'exam_date', 'start_time', 'end_time', 'attendees', 'status')
+
+COUNTER_KEY = ('exam_date', 'company_customer_id', 'hour')
+
+COUNTER_FIELDS = (
+    'reservation_count',
+    'confirmed_count',
+    'pending_count',
+    'confirmed_attendees',
+    'pending_attendees',
+    'hour_confirmed_attendees',
+)
+
+ROLLUP_FIELDS = (
+    'confirmed_count',
+    'pending_count',
+    'confirmed_attendees',
+    'pending_attendees',
+    'hourly_confirmed_attendees',
+    'peak_hour_attendees',
+    'company_counts',
+)
+
+
+def reservation_state(reservation):
+    """집계에 필요한 예약 필드 (변경 전 상태 보관용)"""
+    return {field: getattr(reservation, field) for field in STATE_FIELDS}
+
+
+def empty_rollup_values():
+    return {
+        'confirmed_count': 0,
+        'pending_count': 0,
+        'confirmed_attendees': 0,
+        'pending_attendees': 0,
+        'hourly_confirmed_attendees': [0] * len(HOURS),
+        'peak_hour_attendees': 0,
+        'company_counts': {},
+    }
+
+
+def _counter(counters, exam_date, company_customer_id, hour):
+    return counters.setdefault((exam_date, company_customer_id, hour), dict.fromkeys(COUNTER_FIELDS, 0))
+
+
+def _add(counters, state, sign, count=1):
+    """
+    집계 행 증감분에 예약을 더하거나(sign=1) 뺌(sign=-1)
+
+    Args:
+        counters: {(시험 날짜, 기업 사용자 ID, 시간대): {필드: 증감분}}
+        state: 예약 상태 (attendees 는 count 건의 인원 합계)
+        count: state 와 같은 예약 수
+    """
+    exam_date = state['exam_date']
+    company_customer_id = state['company_customer_id']
+    counter = _counter(counters, exam_date, company_customer_id, state['start_time'].hour)
+    counter['reservation_count'] += sign * count
+
+    if state['status'] == 'CONFIRMED':
+        counter['confirmed_count'] += sign * count
+        counter['confirmed_attendees'] += sign * state['attendees']
+        for hour in HOURS:
+            if state['start_time'] < time(hour + 1, 0) and state['end_time'] > time(hour, 0):
+                _counter(counters, exam_date, company_customer_id, hour)['hour_confirmed_attendees'] += \
+                    sign * state['attendees']
+    elif state['status'] == 'PENDING':
+        counter['pending_count'] += sign * count
+        counter['pending_attendees'] += sign * state['attendees']
+
+
+def _nonzero(counters):
+    return {key: values for key, values in counters.items() if any(values.values())}
+
+
+def _increment(counters):
+    """집계 행에 증감분을 더함 (없는 행은 생성)"""
+    rows = sorted(counters.items())  # 여러 행을 잠그는 경우 교착 상태를 피하도록 키 순으로 처리
+    table = ReservationRollupCounter._meta.db_table
+
+    if connection.features.supports_update_conflicts_with_target:
+        columns = (*COUNTER_KEY, *COUNTER_FIELDS)
+        row_sql = '(' + ', '.join(['%s'] * len(columns)) + ')'
+        params = []
+        for (exam_date, company_customer_id, hour), values in rows:
+            params += [connection.ops.adapt_datefield_value(exam_date), company_customer_id, hour]
+            params += [values[field] for field in COUNTER_FIELDS]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([row_sql] * len(rows))} "
+                f"ON CONFLICT ({', '.join(COUNTER_KEY)}) DO UPDATE SET "
+                + ', '.join(f'{field} = {table}.{field} + EXCLUDED.{field}' for field in COUNTER_FIELDS),
+                params,
+            )
+        return
+
+    for key, values in rows:
+        lookup = dict(zip(COUNTER_KEY, key))
+        updates = {field: F(field) + value for field, value in values.items()}
+        if ReservationRollupCounter.objects.filter(**lookup).update(**updates):
+            continue
+        try:
+            with transaction.atomic():
+                ReservationRollupCounter.objects.create(**lookup, **values)
+        except IntegrityError:
+            # 다른 요청이 먼저 생성한 경우
+            ReservationRollupCounter.objects.filter(**lookup).update(**updates)
+
+
+def apply_reservation_change(old_state=None, new_state=None):
+    """
+    예약 변경분을 집계에 반영 (예약을 변경한 트랜잭션 안에서 호출)
+
+    Args:
+        old_state: 변경 전 예약 상태 (생성인 경우 None)
+        new_state: 변경 후 예약 상태 (삭제인 경우 None)
+    """
+    if old_state == new_state:
+        return
+    apply_reservation_changes([(old_state, new_state)])
+
+
+def apply_reservation_changes(state_changes):
+    """
+    여러 예약의 변경분을 집계 행별로 모아 한 번에 반영
+
+    Args:
+        state_changes: [(변경 전 상태 또는 None, 변경 후 상태 또는 None), ...]
+    """
+    counters = {}
+    for old_state, new_state in state_changes:
+        if old_state == new_state:
+            continue
+        if old_state is not None:
+            _add(counters, old_state, -1)
+        if new_state is not None:
+            _add(counters, new_state, 1)
+
+    counters = _nonzero(counters)
+    if counters:
+        _increment(counters)
+
+
+def _daily_values(rows):
+    """
+    집계 행을 날짜별로 합산
+
+    Args:
+        rows: COUNTER_KEY, COUNTER_FIELDS 를 포함한 집계 행 dict 목록
+
+    Returns:
+        {exam_date: 집계 값 dict} (예약이 없는 날짜 제외)
+    """
+    hour_index = {hour: index for index, hour in enumerate(HOURS)}
+    rollups = {}
+    for row in rows:
+        values = rollups.setdefault(row['exam_date'], empty_rollup_values())
+        for field in ('confirmed_count', 'pending_count', 'confirmed_attendees', 'pending_attendees'):
+            values[field] += row[field]
+        if row['hour'] in hour_index:
+            values['hourly_confirmed_attendees'][hour_index[row['hour']]] += row['hour_confirmed_attendees']
+        # JSON 키는 문자열로 저장되므로 문자열 키 사용
+        company_id = str(row['company_customer_id'])
+        values['company_counts'][company_id] = values['company_counts'].get(company_id, 0) + row['reservation_count']
+
+    for exam_date, values in list(rollups.items()):
+        values['peak_hour_attendees'] = max(values['hourly_confirmed_attendees'], default=0)
+        values['company_counts'] = {company: count for company, count in values['company_counts'].items() if count}
+        if values == empty_rollup_values():
+            del rollups[exam_date]
+    return rollups
+
+
+def _date_range(queryset, start_date=None, end_date=None):
+    if start_date is not None:
+        queryset = queryset.filter(exam_date__gte=start_date)
+    if end_date is not None:
+        queryset = queryset.filter(exam_date__lte=end_date)
+    return queryset
+
+
+def read_rollups(start_date=None, end_date=None):
+    """
+    저장된 집계 행으로 날짜별 집계 계산
+
+    Returns:
+        {exam_date: 집계 값 dict} (예약이 없는 날짜 제외)
+    """
+    queryset = _date_range(ReservationRollupCounter.objects.all(), start_date, end_date)
+    return _daily_values(queryset.values(*COUNTER_KEY, *COUNTER_FIELDS))
+
+
+def compute_counters(start_date=None, end_date=None, sources=(Reservation, ReservationArchive)):
+    """
+    원본 예약(운영 + 보관 테이블)으로 집계 행 계산
+
+    같은 기업, 날짜, 시간, 상태의 예약을 DB 에서 묶어 (예약 수, 인원 합계) 로 가져온 뒤 더한다.
+
+    Args:
+        sources: 원본 예약 모델 (마이그레이션에서는 과거 버전 모델 사용)
+
+    Returns:
+        {(시험 날짜, 기업 사용자 ID, 시간대): {필드: 값}}
+    """
+    counters = {}
+    for model in sources:
+        rows = _date_range(model.objects.all(), start_date, end_date).values(
+            'company_customer_id', 'exam_date', 'start_time', 'end_time', 'status',
+        ).annotate(
+            count=Count('id'),
+            total=Sum('attendees'),
+        ).order_by()
+
+        for row in rows:
+            _add(counters, {**row, 'attendees': row['total']}, 1, count=row['count'])
+
+    return _nonzero(counters)
+
+
+def counter_rows(counters):
+    """compute_counters 결과를 집계 행 dict 목록으로 변환"""
+    return [{**dict(zip(COUNTER_KEY, key)), **values} for key, values in counters.items()]
+
+
+def compute_rollups(start_date=None, end_date=None):
+    """
+    원본 예약(운영 + 보관 테이블)으로 날짜별 집계 계산
+
+    Returns:
+        {exam_date: 집계 값 dict}
+    """
+    return _daily_values(counter_rows(compute_counters(start_date, end_date)))
+
+
+def find_mismatches(start_date=None, end_date=None):
+    """
+    저장된 집계와 원본 예약으로 다시 계산한 값이 다른 날짜 목록
+
+    Returns:
+        [(exam_date, 저장된 값 dict 또는 None, 계산한 값 dict), ...]
+    """
+    expected = compute_rollups(start_date, end_date)
+    stored = read_rollups(start_date, end_date)
+
+    mismatches = []
+    for exam_date in sorted(set(expected) | set(stored)):
+        expected_values = expected.get(exam_date, empty_rollup_values())
+        stored_values = stored.get(exam_date)
+        if stored_values != expected_values:
+            mismatches.append((exam_date, stored_values, expected_values))
+    return mismatches
+
+
+@transaction.atomic
+def backfill(start_date=None, end_date=None):
+    """
+    원본 예약으로 집계 행을 다시 계산해 저장
+
+    Returns:
+        예약이 있는 날짜 수
+    """
+    # 기존 행을 먼저 삭제해 진행 중인 예약 변경의 증감분이 다시 계산한 행에 반영되도록 함
+    _date_range(ReservationRollupCounter.objects.all(), start_date, end_date).delete()
+    counters = compute_counters(start_date, end_date)
+    ReservationRollupCounter.objects.bulk_create(
+        [ReservationRollupCounter(**row) for row in counter_rows(counters)],
+        batch_size=1000,
+    )
+    return len({exam_date for exam_date, _, _ in counters})
+
+
+def date_bounds(start_date=None, end_date=None):
+    """지정하지 않은 기간은 원본 예약과 집계 행의 최소, 최대 날짜로 채움 (예약이 없으면 (None, None))"""
+    if start_date is not None and end_date is not None:
+        return start_date, end_date
+
+    bounds = [
+        model.objects.aggregate(min_date=Min('exam_date'), max_date=Max('exam_date'))
+        for model in (Reservation, ReservationArchive, ReservationRollupCounter)
+    ]
+    min_dates = [bound['min_date'] for bound in bounds if bound['min_date'] is not None]
+    max_dates = [bound['max_date'] for bound in bounds if bound['max_date'] is not None]
+    if not min_dates:
+        return None, None
+    return start_date or min(min_dates), end_date or max(max_dates)
+
+
+def date_chunks(start_date, end_date, chunk_days):
+    """기간을 chunk_days 일 단위로 나눔"""
+    chunk_start = start_date
+    while chunk_start <= end_date:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_date)
+        yield chunk_start, chunk_end
+        chunk_start = chunk_end + timedelta(days=1)
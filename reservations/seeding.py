@@ -0,0 +1,192 @@
+"""
+대량 테스트 데이터 생성
+
+기업 사용자와 예약을 현실적인 분포(몰리는 날짜, 인기 시간대, 상태 비율)로 생성한다.
+같은 seed 값이면 항상 같은 데이터가 생성된다.
+"""
+import csv
+import io
+import random
+from datetime import time, timedelta
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+
+from reservations.constants import OPERATION_END_TIME, MAX_ATTENDEES_PER_TIMESLOT, RESERVATION_MIN_DAYS_BEFORE
+from reservations.models import Reservation
+from users.models import User
+
+# 시작 시간대별 가중치 (오전 10시, 오후 2시에 몰림)
+HOUR_WEIGHTS = {9: 6, 10: 14, 11: 10, 12: 4, 13: 9, 14: 14, 15: 9, 16: 5, 17: 3}
+
+# 시험 시간(시간 단위) 가중치
+DURATION_WEIGHTS = {1: 45, 2: 35, 3: 15, 4: 5}
+
+_HOURS = list(HOUR_WEIGHTS)
+_HOUR_CUM_WEIGHTS = list(accumulate(HOUR_WEIGHTS.values()))
+_DURATIONS = list(DURATION_WEIGHTS)
+_DURATION_CUM_WEIGHTS = list(accumulate(DURATION_WEIGHTS.values()))
+
+SEED_PASSWORD = 'seed-password'
+
+
+class ReservationSeeder:
+    def __init__(self, seed=0, batch_size=10000, confirmed_ratio=0.35, peak_day_ratio=0.1, stdout=None):
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.confirmed_ratio = confirmed_ratio
+        self.peak_day_ratio = peak_day_ratio
+        self.stdout = stdout
+
+        # (exam_date, hour) -> 확정 인원. 확정 예약이 수용 인원을 넘지 않도록 사용
+        self._confirmed_load = {}
+
+    def seed_companies(self, count, prefix='seed'):
+        """
+        기업 사용자 생성
+
+        비밀번호 해시는 한 번만 계산해 모든 사용자에 재사용한다.
+        같은 prefix 로 다시 실행하면 이미 있는 사용자는 건너뛰고 부족한 사용자만 생성한다.
+
+        Returns:
+            prefix 의 기업 사용자 id 목록 (count 명)
+        """
+        password = make_password(SEED_PASSWORD)
+        for offset in range(0, count, self.batch_size):
+            User.objects.bulk_create([
+                User(
+                    email=f'{prefix}_company_{i}@seed.test',
+                    password=password,
+                    name=f'{prefix}_company_{i}',
+                    role='COMPANY',
+                )
+                for i in range(offset, min(offset + self.batch_size, count))
+            ], batch_size=self.batch_size, ignore_conflicts=True)
+
+        return list(
+            User.objects.filter(email__startswith=f'{prefix}_company_', role='COMPANY')
+            .order_by('id').values_list('id', flat=True)[:count]
+        )
+
+    def seed_reservations(self, count, company_ids, days=90, start_date=None):
+        """
+        예약 생성
+
+        batch_size 단위로 삽입하며, ORM 비용을 피하기 위해 PostgreSQL 에서는 COPY,
+        SQLite 에서는 executemany 를 사용하고 그 외 데이터베이스에서는 bulk_create 를 사용한다.
+
+        Returns:
+            생성된 예약 수
+        """
+        if not company_ids:
+            return 0
+
+        start_date = start_date or timezone.now().date() + timedelta(days=RESERVATION_MIN_DAYS_BEFORE + 1)
+        exam_dates = [start_date + timedelta(days=i) for i in range(days)]
+        date_weights = self._date_weights(len(exam_dates))
+
+        created = 0
+        while created < count:
+            size = min(self.batch_size, count - created)
+            dates = self.rng.choices(exam_dates, weights=date_weights, k=size)
+            rows = [self._build_row(exam_date, company_ids) for exam_date in dates]
+            now = timezone.now()
+
+            with transaction.atomic():
+                if connection.vendor == 'postgresql':
+                    self._copy_rows(rows, now)
+                elif connection.vendor == 'sqlite':
+                    self._executemany_rows(rows, now)
+                else:
+                    Reservation.objects.bulk_create([
+                        Reservation(
+                            company_customer_id=company_id,
+                            exam_date=exam_date,
+                            start_time=start_time,
+                            end_time=end_time,
+                            attendees=attendees,
+                            status=status,
+                            created_at=now,
+                            updated_at=now,
+                        )
+                        for company_id, exam_date, start_time, end_time, attendees, status in rows
+                    ], batch_size=self.batch_size)
+
+            created += size
+            if self.stdout:
+                self.stdout.write(f'예약 {created}/{count} 생성')
+
+        return created
+
+    def _date_weights(self, days):
+        # 일부 날짜(접수 오픈일 등)에 예약이 몰리도록 가중치 부여
+        weights = []
+        for index in range(days):
+            weight = 1.0
+            if self.rng.random() < self.peak_day_ratio:
+                weight *= self.rng.uniform(5, 15)
+            if index % 7 in (5, 6):
+                weight *= 0.3
+            weights.append(weight)
+        return weights
+
+    def _build_row(self, exam_date, company_ids):
+        start_hour = self.rng.choices(_HOURS, cum_weights=_HOUR_CUM_WEIGHTS)[0]
+        duration = self.rng.choices(_DURATIONS, cum_weights=_DURATION_CUM_WEIGHTS)[0]
+        end_hour = min(start_hour + duration, OPERATION_END_TIME.hour)
+
+        # 응시 인원은 대부분 소규모이고 일부만 대규모
+        attendees = min(int(self.rng.lognormvariate(3.5, 1.2)) + 1, MAX_ATTENDEES_PER_TIMESLOT)
+
+        status = 'PENDING'
+        if self.rng.random() < self.confirmed_ratio:
+            hours = range(start_hour, end_hour)
+            if all(self._confirmed_load.get((exam_date, hour), 0) + attendees <= MAX_ATTENDEES_PER_TIMESLOT
+                   for hour in hours):
+                for hour in hours:
+                    self._confirmed_load[(exam_date, hour)] = self._confirmed_load.get((exam_date, hour), 0) + attendees
+                status = 'CONFIRMED'
+
+        return (
+            self.rng.choice(company_ids),
+            exam_date,
+            time(start_hour, 0),
+            time(end_hour, 0),
+            attendees,
+            status,
+        )
+
+    def _executemany_rows(self, rows, now):
+        table = Reservation._meta.db_table
+        timestamp = connection.ops.adapt_datetimefield_value(now)
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {table} (company_customer_id, exam_date, start_time, end_time, attendees, status, '
+                f'created_at, updated_at) '
+                f'VALUES (%s, %s, %s, %s, %s, %s, %s, %s)',
+                [
+                    (company_id, exam_date.isoformat(), start_time.isoformat(), end_time.isoformat(), attendees, status,
+                     timestamp, timestamp)
+                    for company_id, exam_date, start_time, end_time, attendees, status in rows
+                ],
+            )
+
+    def _copy_rows(self, rows, now):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        timestamp = now.isoformat()
+        for company_id, exam_date, start_time, end_time, attendees, status in rows:
+            writer.writerow([company_id, exam_date.isoformat(), start_time.isoformat(), end_time.isoformat(),
+                             attendees, status, timestamp, timestamp])
+        buffer.seek(0)
+
+        table = Reservation._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f'COPY {table} (company_customer_id, exam_date, start_time, end_time, attendees, status, '
+                f'created_at, updated_at) '
+                f'FROM STDIN WITH (FORMAT csv)',
+                buffer,
+            )
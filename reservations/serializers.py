@@ -1,11 +1,12 @@
 from datetime import timedelta
 
+from django.urls import reverse
 from django.utils import timezone
 from rest_framework import serializers
 
 from reservations.constants import OPERATION_END_TIME, OPERATION_START_TIME, RESERVATION_MIN_DAYS_BEFORE, \
-    MAX_ATTENDEES_PER_TIMESLOT
-from reservations.exceptions import ReservationPeriodException
+    MAX_ATTENDEES_PER_TIMESLOT, RESERVATION_BULK_DELETE_MAX_SIZE
+from reservations.exceptions import ReservationPeriodException, InvalidQueryParameterException
 
 
 class ReservationResponseSerializer(serializers.Serializer):
@@ -17,6 +18,33 @@ class ReservationResponseSerializer(serializers.Serializer):
     attendees = serializers.IntegerField(read_only=True)
     status = serializers.CharField(read_only=True)
 
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 요청한 필드만 응답
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def parse_fields(cls, value):
+        """
+        fields query parameter(쉼표로 구분한 필드 목록)를 응답 필드 목록으로 변환
+
+        Returns:
+            필드 이름 tuple (값이 없으면 None, 모든 필드)
+
+        Raises:
+            InvalidQueryParameterException: 응답에 없는 필드가 포함된 경우
+        """
+        if value is None:
+            return None
+
+        fields = tuple(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+        unknown = [field for field in fields if field not in cls._declared_fields]
+        if not fields or unknown:
+            raise InvalidQueryParameterException(f'fields 는 {", ".join(cls._declared_fields)} 중에서 입력해주세요.')
+        return fields
+
 
 class ReservationRequestSerializer(serializers.Serializer):
     exam_date = serializers.DateField()
@@ -24,6 +52,7 @@ class ReservationRequestSerializer(serializers.Serializer):
     end_time = serializers.TimeField()
     attendees = serializers.IntegerField()
     status = serializers.CharField(required=False)
+    hold_id = serializers.IntegerField(required=False)
 
     def validate(self, data):
         # 날짜 검증 추가
@@ -52,7 +81,92 @@ class ReservationRequestSerializer(serializers.Serializer):
         return data
 
 
+class ReservationHoldRequestSerializer(ReservationRequestSerializer):
+    status = None
+    hold_id = None
+
+
+class ReservationHoldResponseSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    exam_date = serializers.DateField(read_only=True)
+    start_time = serializers.TimeField(read_only=True)
+    end_time = serializers.TimeField(read_only=True)
+    attendees = serializers.IntegerField(read_only=True)
+    expires_at = serializers.DateTimeField(read_only=True)
+
+
 class ReservationAvailableTimeResponseSerializer(serializers.Serializer):
     start_time = serializers.TimeField(read_only=True)
     end_time = serializers.TimeField(read_only=True)
     available = serializers.IntegerField(read_only=True)
+
+
+class ReservationQueueResponseSerializer(serializers.Serializer):
+    token = serializers.CharField(read_only=True)
+    position = serializers.IntegerField(read_only=True)
+    retry_after = serializers.IntegerField(read_only=True)
+    poll_url = serializers.SerializerMethodField()
+
+    def get_poll_url(self, obj):
+        return reverse('reservation-queue', kwargs={'token': obj.token})
+
+
+class DailyReservationRollupResponseSerializer(serializers.Serializer):
+    exam_date = serializers.DateField(read_only=True)
+    confirmed_count = serializers.IntegerField(read_only=True)
+    pending_count = serializers.IntegerField(read_only=True)
+    confirmed_attendees = serializers.IntegerField(read_only=True)
+    pending_attendees = serializers.IntegerField(read_only=True)
+    hourly_confirmed_attendees = serializers.ListField(child=serializers.IntegerField(), read_only=True)
+    peak_hour_attendees = serializers.IntegerField(read_only=True)
+    company_counts = serializers.DictField(child=serializers.IntegerField(), read_only=True)
+
+
+class ReservationChangeResponseSerializer(serializers.Serializer):
+    seq = serializers.IntegerField(read_only=True)
+    reservation_id = serializers.IntegerField(read_only=True)
+    company_customer_id = serializers.IntegerField(read_only=True)
+    operation = serializers.CharField(read_only=True)
+    payload = serializers.JSONField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+
+class ReservationSyncResponseSerializer(ReservationResponseSerializer):
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+
+
+class ReservationTombstoneResponseSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True, source='reservation_id')
+    deleted_at = serializers.DateTimeField(read_only=True)
+
+
+class ReservationBulkDeleteRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=RESERVATION_BULK_DELETE_MAX_SIZE,
+    )
+    exam_date = serializers.DateField(required=False)
+    status = serializers.ChoiceField(choices=['PENDING', 'CONFIRMED'], required=False)
+
+    def validate(self, data):
+        # 예약 ID 목록 또는 시험 날짜 중 하나만 지정
+        if ('ids' in data) == ('exam_date' in data):
+            raise serializers.ValidationError('ids 또는 exam_date 중 하나를 입력해주세요.')
+        if 'ids' in data and 'status' in data:
+            raise serializers.ValidationError('status 는 exam_date 와 함께 입력해주세요.')
+        return data
+
+
+class ReservationBulkDeleteResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    outcome = serializers.CharField(read_only=True)
+
+
+class ReservationCapacityDeltaSerializer(serializers.Serializer):
+    exam_date = serializers.DateField(read_only=True)
+    start_time = serializers.TimeField(read_only=True)
+    end_time = serializers.TimeField(read_only=True)
+    released_attendees = serializers.IntegerField(read_only=True)
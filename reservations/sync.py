@@ -0,0 +1,136 @@
+"""
+기업 사용자 예약 변경분 동기화
+
+클라이언트는 마지막으로 받은 cursor 이후에 수정된 예약과 삭제(보관 포함)된 예약만 받아 로컬 사본을 갱신한다.
+- 수정된 예약: Reservation.updated_at 기준
+- 삭제된 예약: ReservationTombstone.deleted_at 기준
+
+두 목록을 (일시, 종류, id) 순서로 합쳐 limit 개씩 반환하며, cursor 는 마지막 항목의 (일시, 종류, id) 를 인코딩한 값이다.
+같은 일시의 항목이 여러 개여도 (종류, id) 로 순서가 정해지므로 페이지 경계에서 빠지거나 중복되지 않는다.
+
+updated_at 은 저장 시점에 정해지므로 늦게 커밋된 트랜잭션의 변경이 cursor 보다 이전 일시로 기록될 수 있다.
+outbox 와 같이 visible_before 이후의 변경은 제외해 이런 변경을 건너뛰지 않도록 하며, 항상 primary 에서 읽는다.
+
+삭제 기록은 RESERVATION_TOMBSTONE_RETENTION_DAYS 동안만 보관하므로 그보다 오래된 cursor 로는 동기화할 수 없다.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+from programmers_exam_reservation.utils.db_routers import use_primary
+from reservations.constants import RESERVATION_TOMBSTONE_RETENTION_DAYS
+from reservations.models import Reservation, ReservationTombstone
+from reservations.outbox import visible_before
+
+UPSERT = 0
+DELETE = 1
+
+
+def encode_cursor(changed_at, kind, object_id):
+    raw = json.dumps([changed_at.isoformat(), kind, object_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Returns:
+        (일시, 종류, id)
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        changed_at, kind, object_id = json.loads(raw)
+        changed_at = datetime.fromisoformat(changed_at)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError(f'잘못된 cursor: {cursor}')
+
+    if kind not in (UPSERT, DELETE) or not isinstance(object_id, int):
+        raise ValueError(f'잘못된 cursor: {cursor}')
+    return changed_at, kind, object_id
+
+
+def is_expired(changed_at):
+    """cursor 일시 이후의 삭제 기록이 이미 정리되었을 수 있는지 여부"""
+    return changed_at < timezone.now() - timedelta(days=RESERVATION_TOMBSTONE_RETENTION_DAYS)
+
+
+def record_tombstones(company_customer_ids):
+    """
+    삭제(보관 포함)된 예약 기록 추가 (예약을 삭제한 트랜잭션 안에서 호출)
+
+    Args:
+        company_customer_ids: {예약 ID: 기업 사용자 ID}
+    """
+    ReservationTombstone.objects.bulk_create([
+        ReservationTombstone(reservation_id=reservation_id, company_customer_id=company_customer_id)
+        for reservation_id, company_customer_id in company_customer_ids.items()
+    ])
+
+
+def _after(queryset, field, kind, cursor):
+    # (field, kind, id) > cursor 인 항목만 남김
+    if cursor is None:
+        return queryset
+    changed_at, cursor_kind, cursor_id = cursor
+    condition = Q(**{f'{field}__gt': changed_at})
+    if kind == cursor_kind:
+        condition |= Q(**{field: changed_at, 'id__gt': cursor_id})
+    elif kind > cursor_kind:
+        condition |= Q(**{field: changed_at})
+    return queryset.filter(condition)
+
+
+@use_primary()
+def read_sync_changes(user, cursor=None, limit=500):
+    """
+    cursor 이후에 수정, 삭제된 사용자의 예약
+
+    (company_customer, updated_at, id), (company_customer, deleted_at, id) 인덱스 범위를 각각 limit + 1 개만 읽는다.
+
+    Returns:
+        list[(일시, 종류, id, Reservation 또는 ReservationTombstone)]: 순서대로 최대 limit + 1 개
+    """
+    bound = visible_before()
+
+    reservations = _after(
+        Reservation.objects.select_related('company_customer').filter(
+            company_customer=user,
+            updated_at__lte=bound,
+        ),
+        'updated_at', UPSERT, cursor,
+    ).order_by('updated_at', 'id')[:limit + 1]
+
+    tombstones = _after(
+        ReservationTombstone.objects.filter(
+            company_customer=user,
+            deleted_at__lte=bound,
+        ),
+        'deleted_at', DELETE, cursor,
+    ).order_by('deleted_at', 'id')[:limit + 1]
+
+    changes = [(reservation.updated_at, UPSERT, reservation.id, reservation) for reservation in reservations]
+    changes += [(tombstone.deleted_at, DELETE, tombstone.id, tombstone) for tombstone in tombstones]
+    changes.sort(key=lambda change: change[:3])
+    return changes[:limit + 1]
+
+
+def prune_tombstones(before, batch_size=10000):
+    """
+    before 이전에 기록된 삭제 기록 중 batch_size 만큼 삭제
+
+    Returns:
+        삭제한 기록 수 (0 이면 더 이상 삭제할 기록이 없음)
+    """
+    ids = list(
+        ReservationTombstone.objects.filter(deleted_at__lt=before).order_by('id').values_list('id', flat=True)[:batch_size]
+    )
+    if not ids:
+        return 0
+    ReservationTombstone.objects.filter(id__in=ids).delete()
+    return len(ids)
@@ -1,11 +1,39 @@
-from datetime import time, timedelta
-
+import os
+import tempfile
+import threading
+import time as time_module
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.core.management import call_command, CommandError
+from django.db import connection, connections, router, transaction, IntegrityError
+from django.db.models import Q
+from django.http import HttpResponse
+from django.test import override_settings, SimpleTestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
-
-from reservations.models import Reservation
+from rest_framework.test import APITestCase, APIRequestFactory, APIClient
+
+from programmers_exam_reservation.db_backends.postgresql_pool.pool import ConnectionPool, PoolTimeout
+from programmers_exam_reservation.utils import metrics, throttling
+from programmers_exam_reservation.utils.db_routers import ReplicaRouter, ReplicaPool, replica_pool, routing_request, \
+    use_primary
+from programmers_exam_reservation.utils.middlewares import ReplicaRoutingMiddleware
+from reservations import capacity, partitions, rollups, time_ranges
+from reservations.admission import AdmissionController
+from reservations.benchmarks.loadtest import LoadTest
+from reservations.constants import RESERVATION_LIST_SORTS
+from reservations.exceptions import InvalidQueryParameterException, ReservationAttendeesException, \
+    ReservationNotFoundException, ReservationPeriodException, ReservationArchiveConflictException
+from reservations.managers import ReservationManager, available_slots_flight
+from reservations.models import Reservation, ReservationArchive, ReservationHold, ReservationRollupCounter, \
+    ReservationChange, ReservationTombstone
+from reservations.seeding import ReservationSeeder
+from reservations.sync import encode_cursor, UPSERT
 from users.models import User
 
 
@@ -824,3 +852,2194 @@ class ReservationAvailableTimeGetTestCase(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data['detail'], '과거 날짜에 대한 예약 정보는 조회할 수 없습니다.')
+
+
+@override_settings(TOKEN_BUCKET_THROTTLE={'RATES': {}})
+class AvailableTimeSingleFlightTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+
+    def test_concurrent_requests_share_one_computation(self):
+        """같은 날짜에 대한 동시 요청 500건이 날짜별로 한 번의 예약 조회만 실행"""
+        dates = [timezone.now().date() + timedelta(days=5), timezone.now().date() + timedelta(days=6)]
+        requests_per_date = 250
+        get_available_slots = ReservationManager._get_available_slots
+        captured = []
+        captured_lock = threading.Lock()
+
+        def capture_available_slots(self, exam_date):
+            # 나머지 요청이 모두 진행 중인 계산을 기다릴 때까지 계산을 시작하지 않음
+            deadline = time_module.monotonic() + 10
+            while (available_slots_flight.duplicates(('default', exam_date)) < requests_per_date - 1
+                   and time_module.monotonic() < deadline):
+                time_module.sleep(0.001)
+            # 요청을 처리하는 스레드의 연결에서 실행한 쿼리 수집
+            with CaptureQueriesContext(connection) as context:
+                time_slots = get_available_slots(self, exam_date)
+            with captured_lock:
+                captured.extend(query['sql'] for query in context.captured_queries)
+            return time_slots
+
+        barrier = threading.Barrier(len(dates) * requests_per_date)
+        responses = []
+
+        def send(date):
+            client = APIClient()
+            client.force_authenticate(user=self.company_user_1)
+            url = reverse('available-times') + f'?date={date.isoformat()}'
+            barrier.wait()
+            responses.append(client.get(url))
+
+        with mock.patch.object(ReservationManager, '_get_available_slots', capture_available_slots):
+            threads = [threading.Thread(target=send, args=(date,)) for date in dates for _ in range(requests_per_date)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        reservation_queries = [sql for sql in captured if 'FROM "reservations"' in sql]
+        self.assertEqual(len(reservation_queries), len(dates))
+        for date in dates:
+            self.assertEqual(sum(date.isoformat() in sql for sql in reservation_queries), 1)
+        self.assertEqual(len(responses), len(dates) * requests_per_date)
+        self.assertTrue(all(response.status_code == status.HTTP_200_OK for response in responses))
+        self.assertEqual(responses[0].data[0].get('available'), 50000)
+
+    @override_settings(DATABASE_REPLICAS=['replica'])
+    def test_primary_and_replica_reads_do_not_share_computation(self):
+        """primary 로 고정된 조회는 진행 중인 복제본 조회 결과를 함께 사용하지 않음"""
+        exam_date = timezone.now().date() + timedelta(days=5)
+        barrier = threading.Barrier(2, timeout=5)
+        aliases = []
+
+        def capture_available_slots(self, exam_date):
+            # 두 요청이 하나로 합쳐지면 두 번째 계산이 시작되지 않아 barrier 가 시간 초과로 실패
+            aliases.append(router.db_for_read(Reservation))
+            barrier.wait()
+            return []
+
+        def replica_read():
+            with routing_request(APIRequestFactory().get('/')):
+                ReservationManager()._get_shared_available_slots(exam_date)
+
+        def primary_read():
+            with routing_request(APIRequestFactory().get('/')), use_primary():
+                ReservationManager()._get_shared_available_slots(exam_date)
+
+        with mock.patch.object(ReservationManager, '_get_available_slots', capture_available_slots), \
+                mock.patch.object(replica_pool, 'is_healthy', return_value=True):
+            threads = [threading.Thread(target=replica_read), threading.Thread(target=primary_read)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertFalse(barrier.broken)
+        self.assertEqual(sorted(aliases), ['default', 'replica'])
+
+
+class IdempotencyKeyTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.company_user_2 = User.objects.create(
+            email='company_user_2@test.com',
+            password='testpassword',
+            name='company_user_2',
+            role='COMPANY',
+        )
+        self.valid_data = {
+            'exam_date': timezone.now().date() + timedelta(days=5),
+            'start_time': time(10, 0),
+            'end_time': time(12, 0),
+            'attendees': 100,
+        }
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_retried_post_returns_first_response(self):
+        """같은 Idempotency-Key 로 다시 보낸 예약 생성 요청은 처음 응답을 반환"""
+        self.client.force_authenticate(user=self.company_user_1)
+        url = reverse('reservations')
+
+        first = self.client.post(url, self.valid_data, format='json', HTTP_IDEMPOTENCY_KEY='key-1')
+        with mock.patch.object(ReservationManager, 'create_reservation') as create_reservation:
+            second = self.client.post(url, self.valid_data, format='json', HTTP_IDEMPOTENCY_KEY='key-1')
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second['Idempotent-Replayed'], 'true')
+        create_reservation.assert_not_called()
+        self.assertEqual(Reservation.objects.count(), 1)
+
+    def test_key_is_scoped_by_user(self):
+        """다른 사용자의 같은 Idempotency-Key 는 별도 요청으로 처리"""
+        url = reverse('reservations')
+
+        self.client.force_authenticate(user=self.company_user_1)
+        self.client.post(url, self.valid_data, format='json', HTTP_IDEMPOTENCY_KEY='key-1')
+        self.client.force_authenticate(user=self.company_user_2)
+        response = self.client.post(url, self.valid_data, format='json', HTTP_IDEMPOTENCY_KEY='key-1')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn('Idempotent-Replayed', response)
+        self.assertEqual(Reservation.objects.count(), 2)
+
+    def test_key_reused_with_different_request(self):
+        """같은 Idempotency-Key 로 다른 내용의 요청"""
+        self.client.force_authenticate(user=self.company_user_1)
+        url = reverse('reservations')
+
+        self.client.post(url, self.valid_data, format='json', HTTP_IDEMPOTENCY_KEY='key-1')
+        response = self.client.post(url, {**self.valid_data, 'attendees': 200}, format='json',
+                                    HTTP_IDEMPOTENCY_KEY='key-1')
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(Reservation.objects.count(), 1)
+
+    def test_retried_delete_returns_first_response(self):
+        """삭제 후 같은 Idempotency-Key 로 다시 보낸 삭제 요청은 404 가 아닌 처음 응답을 반환"""
+        reservation = Reservation.objects.create(company_customer=self.company_user_1, **self.valid_data)
+        self.client.force_authenticate(user=self.company_user_1)
+        url = reverse('reservation-detail', args=[reservation.id])
+
+        first = self.client.delete(url, HTTP_IDEMPOTENCY_KEY='key-1')
+        second = self.client.delete(url, HTTP_IDEMPOTENCY_KEY='key-1')
+
+        self.assertEqual(first.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(second.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(second['Idempotent-Replayed'], 'true')
+
+    def test_concurrent_duplicate_waits_for_first_request(self):
+        """처리 중인 요청과 같은 Idempotency-Key 요청은 처음 요청이 끝날 때까지 기다린 뒤 그 응답을 반환"""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def create_reservation(manager, user, exam_date, start_time, end_time, attendees, hold_id=None):
+            calls.append(user)
+            started.set()
+            release.wait(5)
+            return Reservation(id=1, company_customer=user, exam_date=exam_date, start_time=start_time,
+                               end_time=end_time, attendees=attendees, status='PENDING')
+
+        responses = {}
+
+        def send(name):
+            client = APIClient()
+            client.force_authenticate(user=self.company_user_1)
+            responses[name] = client.post(reverse('reservations'), self.valid_data, format='json',
+                                          HTTP_IDEMPOTENCY_KEY='key-1')
+
+        with mock.patch.object(ReservationManager, 'create_reservation', create_reservation):
+            first = threading.Thread(target=send, args=('first',))
+            first.start()
+            started.wait(5)
+            second = threading.Thread(target=send, args=('second',))
+            second.start()
+            time_module.sleep(0.2)
+            release.set()
+            first.join()
+            second.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(responses['first'].status_code, status.HTTP_201_CREATED)
+        self.assertEqual(responses['second'].status_code, status.HTTP_201_CREATED)
+        self.assertEqual(responses['second'].data, responses['first'].data)
+        self.assertEqual(responses['second']['Idempotent-Replayed'], 'true')
+
+    @override_settings(IDEMPOTENCY_WAIT_SECONDS=0.2)
+    def test_gives_up_when_cache_cannot_store_key(self):
+        """처리 중 표시를 저장하지도 조회하지도 못하면 간격을 두고 재시도하다 제한 시간 후 409"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        with mock.patch('programmers_exam_reservation.utils.idempotency.cache') as idempotency_cache:
+            idempotency_cache.add.return_value = False
+            idempotency_cache.get.return_value = None
+            response = self.client.post(reverse('reservations'), self.valid_data, format='json',
+                                        HTTP_IDEMPOTENCY_KEY='key-1')
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        # 0.05초 간격으로 재시도
+        self.assertLessEqual(idempotency_cache.add.call_count, 6)
+        self.assertFalse(Reservation.objects.exists())
+
+
+class ReservationHoldTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.company_user_2 = User.objects.create(
+            email='company_user_2@test.com',
+            password='testpassword',
+            name='company_user_2',
+            role='COMPANY',
+        )
+        self.exam_date = timezone.now().date() + timedelta(days=5)
+        self.hold_data = {
+            'exam_date': self.exam_date,
+            'start_time': time(10, 0),
+            'end_time': time(12, 0),
+            'attendees': 30000,
+        }
+
+    def test_create_hold(self):
+        """확보한 인원은 예약 가능 인원에서 제외"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        response = self.client.post(reverse('reservation-holds'), self.hold_data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['attendees'], 30000)
+        self.assertIsNotNone(response.data['expires_at'])
+
+        available_times = self.client.get(reverse('available-times') + f'?date={self.exam_date.isoformat()}').data
+        available = {slot['start_time']: slot['available'] for slot in available_times}
+        self.assertEqual(available['10:00:00'], 20000)
+        self.assertEqual(available['11:00:00'], 20000)
+        self.assertEqual(available['12:00:00'], 50000)
+
+    def test_create_hold_over_available_attendees(self):
+        """다른 사용자가 확보한 인원을 포함해 예약 가능 인원을 넘는 확보 시도"""
+        ReservationManager().create_hold(self.company_user_2, self.exam_date, time(11, 0), time(13, 0), 30000)
+        self.client.force_authenticate(user=self.company_user_1)
+
+        response = self.client.post(reverse('reservation-holds'), self.hold_data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ReservationHold.objects.filter(company_customer=self.company_user_1).exists())
+
+    def test_expired_hold_not_counted_and_swept(self):
+        """만료된 확보 인원은 예약 가능 인원 계산에서 제외되고 다음 확보 생성 시 정리"""
+        manager = ReservationManager()
+        expired_hold = manager.create_hold(self.company_user_2, self.exam_date, time(10, 0), time(12, 0), 50000)
+        ReservationHold.objects.filter(id=expired_hold.id).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        hold = manager.create_hold(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 30000)
+
+        self.assertEqual(list(ReservationHold.objects.values_list('id', flat=True)), [hold.id])
+
+    def test_create_reservation_with_hold(self):
+        """확보한 인원을 예약 가능 인원 계산 없이 예약으로 전환"""
+        hold = ReservationManager().create_hold(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 30000)
+        self.client.force_authenticate(user=self.company_user_1)
+
+        with mock.patch.object(ReservationManager, '_check_available_attendees') as check_available_attendees:
+            response = self.client.post(reverse('reservations'), {**self.hold_data, 'hold_id': hold.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        check_available_attendees.assert_not_called()
+        self.assertEqual(response.data['attendees'], 30000)
+        self.assertFalse(ReservationHold.objects.exists())
+
+    def test_create_reservation_with_other_users_or_mismatched_hold(self):
+        """다른 사용자의 확보 정보, 확보 내용과 다른 예약으로 전환 시도"""
+        hold = ReservationManager().create_hold(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 30000)
+        data = {
+            'exam_date': self.exam_date,
+            'start_time': time(10, 0),
+            'end_time': time(12, 0),
+            'attendees': 30000,
+            'hold_id': hold.id,
+        }
+
+        self.client.force_authenticate(user=self.company_user_2)
+        response = self.client.post(reverse('reservations'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.client.force_authenticate(user=self.company_user_1)
+        response = self.client.post(reverse('reservations'), {**data, 'end_time': time(13, 0)}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(reverse('reservations'), {**data, 'attendees': 30001}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Reservation.objects.exists())
+
+    def test_release_hold(self):
+        """확보한 인원 반환"""
+        hold = ReservationManager().create_hold(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 30000)
+
+        self.client.force_authenticate(user=self.company_user_2)
+        response = self.client.delete(reverse('reservation-hold-detail', args=[hold.id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.client.force_authenticate(user=self.company_user_1)
+        response = self.client.delete(reverse('reservation-hold-detail', args=[hold.id]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(ReservationHold.objects.exists())
+
+
+@override_settings(RESERVATION_ADMISSION={'ENABLED': True, 'MAX_IN_FLIGHT': 1, 'MAX_WAIT_SECONDS': 30})
+class ReservationAdmissionTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.company_user_2 = User.objects.create(
+            email='company_user_2@test.com',
+            password='testpassword',
+            name='company_user_2',
+            role='COMPANY',
+        )
+        self.exam_date = timezone.now().date() + timedelta(days=5)
+        self.valid_data = {
+            'exam_date': self.exam_date,
+            'start_time': time(10, 0),
+            'end_time': time(12, 0),
+            'attendees': 100,
+        }
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_create_reservation_queued_when_slots_full(self):
+        """처리 중인 요청이 가득 차면 대기열에 등록되고, 차례가 되면 처리 요청에서 예약 생성"""
+        controller = AdmissionController()
+        running = controller.enter(self.company_user_2, self.exam_date, {})
+        self.client.force_authenticate(user=self.company_user_1)
+
+        response = self.client.post(reverse('reservations'), self.valid_data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['position'], 1)
+        self.assertEqual(response['Location'], response.data['poll_url'])
+        self.assertIn('Retry-After', response)
+        self.assertFalse(Reservation.objects.exists())
+
+        # 슬롯이 반환되기 전에는 계속 대기
+        poll_response = self.client.post(response.data['poll_url'])
+        self.assertEqual(poll_response.status_code, status.HTTP_202_ACCEPTED)
+
+        controller.release(running)
+
+        # 대기열 조회는 순번만 확인하고 예약을 생성하지 않음
+        poll_response = self.client.get(response.data['poll_url'])
+        self.assertEqual(poll_response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(poll_response.data['position'], 1)
+        self.assertFalse(Reservation.objects.exists())
+
+        poll_response = self.client.post(response.data['poll_url'])
+
+        self.assertEqual(poll_response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(poll_response.data['attendees'], 100)
+        reservation = Reservation.objects.get()
+        self.assertEqual(reservation.company_customer, self.company_user_1)
+
+        # 처리된 대기열 토큰으로 다시 요청하면 생성된 예약을 반환
+        for replay in (self.client.post, self.client.get):
+            poll_response = replay(response.data['poll_url'])
+            self.assertEqual(poll_response.status_code, status.HTTP_200_OK)
+            self.assertEqual(poll_response.data['id'], reservation.id)
+        self.assertEqual(Reservation.objects.count(), 1)
+
+    def test_create_paths_return_same_errors(self):
+        """바로 처리한 예약 생성과 대기열에서 처리한 예약 생성이 같은 오류 응답을 반환"""
+        Reservation.objects.create(
+            company_customer=self.company_user_2,
+            exam_date=self.exam_date,
+            start_time=time(10, 0),
+            end_time=time(12, 0),
+            attendees=40000,
+            status='CONFIRMED',
+        )
+        self.client.force_authenticate(user=self.company_user_1)
+        controller = AdmissionController()
+
+        def create(data):
+            direct = self.client.post(reverse('reservations'), data, format='json')
+
+            running = controller.enter(self.company_user_2, self.exam_date, {})
+            queued = self.client.post(reverse('reservations'), data, format='json')
+            self.assertEqual(queued.status_code, status.HTTP_202_ACCEPTED)
+            controller.release(running)
+            claimed = self.client.post(queued.data['poll_url'])
+
+            return direct.status_code, claimed.status_code
+
+        # 예약 가능 인원 초과
+        self.assertEqual(create({**self.valid_data, 'attendees': 20000}), (400, 400))
+        with mock.patch.object(ReservationManager, 'create_reservation', side_effect=ReservationPeriodException()):
+            self.assertEqual(create(self.valid_data), (400, 400))
+        self.assertEqual(Reservation.objects.count(), 1)
+
+    def test_failed_claim_is_not_replayed(self):
+        """예약 생성에 실패한 대기 요청은 다시 요청해도 생성하지 않고 만료로 응답"""
+        controller = AdmissionController()
+        running = controller.enter(self.company_user_2, self.exam_date, {})
+        self.client.force_authenticate(user=self.company_user_1)
+        response = self.client.post(reverse('reservations'), self.valid_data, format='json')
+        controller.release(running)
+
+        with mock.patch.object(ReservationManager, 'create_reservation', side_effect=ReservationPeriodException()):
+            self.assertEqual(self.client.post(response.data['poll_url']).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            self.client.post(response.data['poll_url']).status_code, status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        self.assertFalse(Reservation.objects.exists())
+
+    def test_queue_is_fifo(self):
+        """먼저 대기한 요청이 먼저 처리"""
+        controller = AdmissionController()
+        running = controller.enter(self.company_user_2, self.exam_date, {})
+        self.client.force_authenticate(user=self.company_user_1)
+        first = self.client.post(reverse('reservations'), self.valid_data, format='json')
+        second = self.client.post(reverse('reservations'), self.valid_data, format='json')
+        self.assertEqual(second.data['position'], 2)
+
+        controller.release(running)
+
+        self.assertEqual(self.client.post(second.data['poll_url']).status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(self.client.post(first.data['poll_url']).status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.client.post(second.data['poll_url']).status_code, status.HTTP_201_CREATED)
+
+    @override_settings(RESERVATION_ADMISSION={'ENABLED': True, 'MAX_IN_FLIGHT': 1, 'MAX_WAIT_SECONDS': 30,
+                                              'LOCK_TIMEOUT': 0.01})
+    def test_shed_when_queue_lock_unavailable(self):
+        """대기열 lock 을 얻지 못하면 lock 없이 진행하지 않고 거절"""
+        controller = AdmissionController()
+        controller.enter(self.company_user_2, self.exam_date, {})
+        # lock 을 잡은 워커가 응답하지 않는 경우
+        cache.set(controller._key(self.exam_date, 'lock'), 1)
+        self.client.force_authenticate(user=self.company_user_1)
+
+        response = self.client.post(reverse('reservations'), self.valid_data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(cache.get(controller._key(self.exam_date, 'issued')), 0)
+
+    @override_settings(RESERVATION_ADMISSION={'ENABLED': True, 'MAX_IN_FLIGHT': 1, 'MAX_WAIT_SECONDS': 1,
+                                              'SERVICE_SECONDS': 5})
+    def test_create_reservation_shed_when_wait_too_long(self):
+        """예상 대기 시간이 제한을 넘으면 503 으로 거절"""
+        AdmissionController().enter(self.company_user_2, self.exam_date, {})
+        self.client.force_authenticate(user=self.company_user_1)
+
+        response = self.client.post(reverse('reservations'), self.valid_data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], '5')
+        self.assertFalse(Reservation.objects.exists())
+
+    def test_poll_queue_by_other_user(self):
+        """다른 사용자의 대기열 토큰 조회 시도"""
+        AdmissionController().enter(self.company_user_2, self.exam_date, {})
+        self.client.force_authenticate(user=self.company_user_1)
+        response = self.client.post(reverse('reservations'), self.valid_data, format='json')
+
+        self.client.force_authenticate(user=self.company_user_2)
+
+        self.assertEqual(self.client.get(response.data['poll_url']).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.post(response.data['poll_url']).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_poll_queue_with_invalid_token(self):
+        """위조된 대기열 토큰 조회 시도"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        response = self.client.get(reverse('reservation-queue', kwargs={'token': 'invalid'}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TokenBucketThrottleTestCase(APITestCase):
+    rates = {
+        'read': {'COMPANY': {'CAPACITY': 3, 'RATE': 1}},
+        'write': {'COMPANY': {'CAPACITY': 1, 'RATE': 1}},
+    }
+
+    def setUp(self):
+        cache.clear()
+        throttling._local_budgets.clear()
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.company_user_2 = User.objects.create(
+            email='company_user_2@test.com',
+            password='testpassword',
+            name='company_user_2',
+            role='COMPANY',
+        )
+        self.admin_user_1 = User.objects.create(
+            email='admin_user_1@test.com',
+            password='testpassword',
+            name='admin_user_1',
+            role='ADMIN',
+        )
+        self.url = reverse('reservations')
+
+    def tearDown(self):
+        cache.clear()
+        throttling._local_budgets.clear()
+
+    def test_requests_over_capacity_throttled(self):
+        """bucket 크기를 넘는 요청은 429 와 Retry-After 반환"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        with override_settings(TOKEN_BUCKET_THROTTLE={'RATES': self.rates, 'PREFETCH': 1}), \
+                mock.patch('programmers_exam_reservation.utils.throttling.time.time', return_value=1000.0):
+            responses = [self.client.get(self.url) for _ in range(4)]
+
+        self.assertEqual([response.status_code for response in responses[:3]], [status.HTTP_200_OK] * 3)
+        self.assertEqual(responses[3].status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        # 거부된 요청의 사용량도 남으므로 2초 뒤에 다시 허용
+        self.assertEqual(responses[3]['Retry-After'], '2')
+
+    def test_bucket_refills_over_time(self):
+        """시간이 지나면 초당 RATE 만큼 다시 요청 가능, 주기가 바뀌어도 사용량을 이어받음"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        with override_settings(TOKEN_BUCKET_THROTTLE={'RATES': self.rates, 'PREFETCH': 1}), \
+                mock.patch('programmers_exam_reservation.utils.throttling.time.time') as now:
+            now.return_value = 1001.5
+            self.assertEqual([self.client.get(self.url).status_code for _ in range(4)], [200, 200, 200, 429])
+            # 다음 주기(1002초)에 들어섰지만 1초 동안 채워진 요청 1개는 거부된 요청의 사용량으로 이어받음
+            now.return_value = 1002.5
+            response = self.client.get(self.url)
+            self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+            self.assertEqual(response['Retry-After'], '2')
+            # Retry-After 만큼 기다리면 다시 요청 가능
+            now.return_value = 1004.5
+            self.assertEqual([self.client.get(self.url).status_code for _ in range(2)], [200, 429])
+
+    def test_denied_requests_use_one_cache_round_trip(self):
+        """주기 첫 요청 이후에는 허용, 거부 모두 캐시 incr 한 번만 실행 (거부된 사용량을 되돌리지 않음)"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        with override_settings(TOKEN_BUCKET_THROTTLE={'RATES': self.rates, 'PREFETCH': 1}), \
+                mock.patch('programmers_exam_reservation.utils.throttling.time.time', return_value=1000.0):
+            self.client.get(self.url)
+            with mock.patch('programmers_exam_reservation.utils.throttling.cache') as throttle_cache:
+                throttle_cache.incr.side_effect = [3, 4, 5]
+                responses = [self.client.get(self.url) for _ in range(3)]
+
+        self.assertEqual([response.status_code for response in responses], [200, 200, 429])
+        self.assertEqual(throttle_cache.method_calls, [mock.call.incr(mock.ANY, 1)] * 3)
+
+    def test_budgets_separated_by_user_and_scope(self):
+        """사용자, 읽기/쓰기 예산은 서로 영향을 주지 않고 설정이 없는 역할은 제한하지 않음"""
+        with override_settings(TOKEN_BUCKET_THROTTLE={'RATES': self.rates, 'PREFETCH': 1}), \
+                mock.patch('programmers_exam_reservation.utils.throttling.time.time', return_value=1000.0):
+            self.client.force_authenticate(user=self.company_user_1)
+            for _ in range(3):
+                self.client.get(self.url)
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+            self.assertNotEqual(self.client.post(self.url, {}, format='json').status_code,
+                                status.HTTP_429_TOO_MANY_REQUESTS)
+            self.assertEqual(self.client.post(self.url, {}, format='json').status_code,
+                             status.HTTP_429_TOO_MANY_REQUESTS)
+
+            self.client.force_authenticate(user=self.company_user_2)
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+            self.client.force_authenticate(user=self.admin_user_1)
+            self.assertEqual([self.client.get(self.url).status_code for _ in range(5)], [200] * 5)
+
+    def test_prefetched_budget_skips_cache(self):
+        """워커 프로세스에 보관한 요청 수가 남아 있으면 캐시를 조회하지 않음"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        with override_settings(TOKEN_BUCKET_THROTTLE={'RATES': self.rates, 'PREFETCH': 3}), \
+                mock.patch('programmers_exam_reservation.utils.throttling.time.time', return_value=1000.0), \
+                mock.patch('programmers_exam_reservation.utils.throttling.cache.incr', wraps=cache.incr) as incr:
+            responses = [self.client.get(self.url) for _ in range(3)]
+
+        self.assertEqual([response.status_code for response in responses], [status.HTTP_200_OK] * 3)
+        self.assertEqual(incr.call_count, 1)  # 주기 첫 요청은 incr 실패 후 add 로 가져옴
+
+
+class ReservationHeatmapTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.admin_user_1 = User.objects.create(
+            email='admin_user_1@test.com',
+            password='testpassword',
+            name='admin_user_1',
+            role='ADMIN',
+        )
+        self.start_date = timezone.now().date() + timedelta(days=5)
+        Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.start_date,
+                                   start_time=time(10, 0), end_time=time(12, 0), attendees=100, status='CONFIRMED')
+        Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.start_date,
+                                   start_time=time(10, 0), end_time=time(12, 0), attendees=200, status='CONFIRMED')
+        Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.start_date + timedelta(days=2),
+                                   start_time=time(16, 30), end_time=time(18, 0), attendees=50, status='PENDING')
+        self.url = reverse('reservation-heatmap') + \
+            f'?start={self.start_date.isoformat()}&end={(self.start_date + timedelta(days=2)).isoformat()}'
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_get_heatmap_by_admin_user(self):
+        """어드민 사용자의 날짜 × 시간대 예약 인원 조회"""
+        self.client.force_authenticate(user=self.admin_user_1)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['hours'], list(range(9, 18)))
+        self.assertEqual([day['date'] for day in response.data['dates']],
+                         [(self.start_date + timedelta(days=offset)).isoformat() for offset in range(3)])
+        self.assertEqual(response.data['dates'][0]['confirmed'], [0, 300, 300, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(response.data['dates'][0]['pending'], [0] * 9)
+        self.assertEqual(response.data['dates'][2]['pending'], [0, 0, 0, 0, 0, 0, 0, 50, 50])
+
+    def test_get_heatmap_compact_encoding(self):
+        """compact 인코딩은 날짜 × 시간대 순서로 펼친 정수 배열 반환"""
+        self.client.force_authenticate(user=self.admin_user_1)
+
+        response = self.client.get(self.url + '&encoding=compact')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['days'], 3)
+        self.assertEqual(len(response.data['confirmed']), 3 * 9)
+        self.assertEqual(response.data['confirmed'][:9], [0, 300, 300, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(response.data['pending'][18:], [0, 0, 0, 0, 0, 0, 0, 50, 50])
+
+    def test_heatmap_single_query_cached_and_invalidated_on_write(self):
+        """한 번의 쿼리로 계산해 캐시하고, 예약이 변경되면 다시 계산"""
+        manager = ReservationManager()
+        start, end = self.start_date.isoformat(), (self.start_date + timedelta(days=2)).isoformat()
+
+        with CaptureQueriesContext(connection) as queries:
+            manager.retrieve_utilization_heatmap(start, end)
+        self.assertEqual(len(queries), 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            manager.retrieve_utilization_heatmap(start, end)
+        self.assertEqual(len(queries), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            manager.create_reservation(self.company_user_1, self.start_date, time(9, 0), time(10, 0), 10)
+
+        heatmap = manager.retrieve_utilization_heatmap(start, end)
+        self.assertEqual(heatmap['pending'][0][0], 10)
+
+    def test_get_heatmap_by_company_user(self):
+        """기업 사용자의 예약 인원 현황 조회 시도"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_get_heatmap_with_invalid_range(self):
+        """종료 날짜가 시작 날짜보다 빠르거나 조회 기간이 너무 긴 경우"""
+        self.client.force_authenticate(user=self.admin_user_1)
+        url = reverse('reservation-heatmap')
+
+        response = self.client.get(url + '?start=2026-01-10&end=2026-01-01')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(url + '?start=2026-01-01&end=2027-01-02')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class DailyReservationRollupTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.admin_user_1 = User.objects.create(
+            email='admin_user_1@test.com',
+            password='testpassword',
+            name='admin_user_1',
+            role='ADMIN',
+        )
+        self.exam_date = timezone.now().date() + timedelta(days=5)
+
+    def tearDown(self):
+        cache.clear()
+
+    def rollup(self, exam_date):
+        return rollups.read_rollups(exam_date, exam_date).get(exam_date, rollups.empty_rollup_values())
+
+    def test_manager_changes_update_rollups_incrementally(self):
+        """예약 생성, 확정, 날짜 변경, 삭제 시 변경분만큼 날짜별 집계 반영"""
+        manager = ReservationManager()
+        next_date = self.exam_date + timedelta(days=1)
+
+        reservation = manager.create_reservation(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 100)
+        rollup = self.rollup(self.exam_date)
+        self.assertEqual((rollup['pending_count'], rollup['pending_attendees']), (1, 100))
+        self.assertEqual(rollup['company_counts'], {str(self.company_user_1.id): 1})
+
+        manager.update_reservation(reservation, self.admin_user_1, status='CONFIRMED')
+        rollup = self.rollup(self.exam_date)
+        self.assertEqual((rollup['pending_count'], rollup['confirmed_count'], rollup['confirmed_attendees']),
+                         (0, 1, 100))
+        self.assertEqual(rollup['hourly_confirmed_attendees'], [0, 100, 100, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(rollup['peak_hour_attendees'], 100)
+
+        manager.update_reservation(reservation, self.admin_user_1, exam_date=next_date, attendees=300)
+        rollup = self.rollup(self.exam_date)
+        self.assertEqual((rollup['confirmed_count'], rollup['peak_hour_attendees'], rollup['company_counts']),
+                         (0, 0, {}))
+        self.assertEqual(self.rollup(next_date)['peak_hour_attendees'], 300)
+        self.assertEqual(rollups.find_mismatches(), [])
+
+        manager.delete_reservation(self.admin_user_1, reservation)
+        self.assertEqual(self.rollup(next_date)['confirmed_count'], 0)
+        self.assertEqual(rollups.find_mismatches(), [])
+
+    def test_change_updates_counters_in_one_statement(self):
+        """날짜 전체 집계 행을 잠그지 않고 한 번의 INSERT ... ON CONFLICT 로 집계 행 증감"""
+        manager = ReservationManager()
+        other_company = User.objects.create(email='company_user_2@test.com', password='testpassword',
+                                            name='company_user_2', role='COMPANY')
+
+        with CaptureQueriesContext(connection) as queries:
+            manager.create_reservation(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 100)
+        manager.create_reservation(other_company, self.exam_date, time(10, 0), time(12, 0), 200)
+
+        counter_queries = [q['sql'] for q in queries.captured_queries if 'reservation_rollup_counters' in q['sql']]
+        self.assertEqual(len(counter_queries), 1)
+        self.assertIn('ON CONFLICT', counter_queries[0])
+        # 기업 사용자마다 별도의 집계 행
+        self.assertEqual(ReservationRollupCounter.objects.filter(exam_date=self.exam_date).count(), 2)
+        self.assertEqual(self.rollup(self.exam_date)['pending_attendees'], 300)
+
+    def test_fallback_without_upsert_support(self):
+        """INSERT ... ON CONFLICT 를 지원하지 않는 데이터베이스는 행별 증감 또는 생성"""
+        with mock.patch.object(connection.features, 'supports_update_conflicts_with_target', False):
+            reservation = ReservationManager().create_reservation(self.company_user_1, self.exam_date, time(10, 0),
+                                                                  time(12, 0), 100)
+            ReservationManager().update_reservation(reservation, self.admin_user_1, status='CONFIRMED')
+
+        self.assertEqual(self.rollup(self.exam_date)['hourly_confirmed_attendees'], [0, 100, 100, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(rollups.find_mismatches(), [])
+
+    def test_stale_instances_use_current_row(self):
+        """먼저 조회한 예약 객체로 수정, 삭제해도 현재 행 기준으로 한 번만 집계, 변경 기록에 반영"""
+        manager = ReservationManager()
+        reservation = manager.create_reservation(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 100)
+        stale_1 = Reservation.objects.get(id=reservation.id)
+        stale_2 = Reservation.objects.get(id=reservation.id)
+
+        manager.update_reservation(reservation, self.admin_user_1, status='CONFIRMED')
+        manager.update_reservation(stale_1, self.admin_user_1, attendees=200)
+        self.assertEqual(rollups.find_mismatches(), [])
+        self.assertEqual(Reservation.objects.get(id=reservation.id).status, 'CONFIRMED')
+
+        manager.delete_reservation(self.admin_user_1, stale_1)
+        with self.assertRaises(ReservationNotFoundException):
+            manager.delete_reservation(self.admin_user_1, stale_2)
+
+        self.assertEqual(rollups.find_mismatches(), [])
+        self.assertEqual(ReservationChange.objects.filter(reservation_id=reservation.id, operation='DELETE').count(), 1)
+        self.assertEqual(ReservationTombstone.objects.filter(reservation_id=reservation.id).count(), 1)
+
+    def test_backfill_and_check_commands(self):
+        """집계 재계산 명령어와 일치 여부 확인 명령어"""
+        for attendees in (100, 200):
+            Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.exam_date,
+                                       start_time=time(9, 0), end_time=time(10, 0), attendees=attendees,
+                                       status='CONFIRMED')
+        ReservationArchive.objects.create(id=9999, company_customer=self.company_user_1,
+                                          exam_date=self.exam_date - timedelta(days=400), start_time=time(9, 0),
+                                          end_time=time(10, 0), attendees=10, status='PENDING')
+
+        with self.assertRaises(CommandError):
+            call_command('check_reservation_rollups', stdout=StringIO())
+
+        call_command('backfill_reservation_rollups', stdout=StringIO())
+
+        rollup = self.rollup(self.exam_date)
+        self.assertEqual((rollup['confirmed_count'], rollup['confirmed_attendees'], rollup['peak_hour_attendees']),
+                         (2, 300, 300))
+        self.assertEqual(rollup['company_counts'], {str(self.company_user_1.id): 2})
+        self.assertEqual(self.rollup(self.exam_date - timedelta(days=400))['pending_count'], 1)
+        call_command('check_reservation_rollups', stdout=StringIO())
+
+        ReservationRollupCounter.objects.filter(exam_date=self.exam_date).update(confirmed_count=5)
+        with self.assertRaises(CommandError):
+            call_command('check_reservation_rollups', stdout=StringIO())
+        call_command('check_reservation_rollups', '--fix', stdout=StringIO())
+        self.assertEqual(self.rollup(self.exam_date)['confirmed_count'], 2)
+
+    def test_get_rollups_by_admin_user(self):
+        """어드민 사용자의 날짜별 예약 집계 조회"""
+        ReservationManager().create_reservation(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 100)
+        self.client.force_authenticate(user=self.admin_user_1)
+        url = reverse('reservation-rollups') + f'?start={self.exam_date.isoformat()}'
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['exam_date'], self.exam_date.isoformat())
+        self.assertEqual(response.data[0]['pending_attendees'], 100)
+
+        self.client.force_authenticate(user=self.company_user_1)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(RESERVATION_CHANGE_VISIBILITY_SECONDS=0)
+class ReservationChangeOutboxTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.admin_user_1 = User.objects.create(
+            email='admin_user_1@test.com',
+            password='testpassword',
+            name='admin_user_1',
+            role='ADMIN',
+        )
+        self.exam_date = timezone.now().date() + timedelta(days=5)
+
+    def test_manager_changes_recorded_in_order(self):
+        """예약 생성, 수정, 삭제, 보관 시 변경 기록이 순서대로 추가"""
+        manager = ReservationManager()
+        reservation = manager.create_reservation(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 100)
+        manager.update_reservation(reservation, self.admin_user_1, status='CONFIRMED')
+        manager.update_reservation(reservation, self.admin_user_1, attendees=100)  # 변경 없음
+        reservation_id = reservation.id
+        manager.delete_reservation(self.admin_user_1, reservation)
+        past = Reservation.objects.create(company_customer=self.company_user_1, exam_date=timezone.now().date()
+                                          - timedelta(days=400), start_time=time(9, 0), end_time=time(10, 0),
+                                          attendees=10)
+        manager.archive_reservations(timezone.now().date() - timedelta(days=365))
+
+        changes = list(ReservationChange.objects.order_by('seq'))
+
+        self.assertEqual([change.operation for change in changes], ['CREATE', 'UPDATE', 'DELETE', 'ARCHIVE'])
+        self.assertEqual([change.reservation_id for change in changes], [reservation_id] * 3 + [past.id])
+        self.assertEqual(changes[0].payload, {'after': {
+            'exam_date': self.exam_date.isoformat(), 'start_time': '10:00:00', 'end_time': '12:00:00',
+            'attendees': 100, 'status': 'PENDING',
+        }})
+        self.assertEqual(changes[1].payload['before']['status'], 'PENDING')
+        self.assertEqual(changes[1].payload['after']['status'], 'CONFIRMED')
+        self.assertEqual(set(changes[2].payload), {'before'})
+        self.assertEqual(changes[0].company_customer_id, self.company_user_1.id)
+
+    def test_consumer_reads_changes_from_cursor(self):
+        """cursor 이후의 변경 기록만 batch 로 읽어 파생 데이터를 갱신"""
+        manager = ReservationManager()
+        reservations = [
+            manager.create_reservation(self.company_user_1, self.exam_date, time(9 + i, 0), time(10 + i, 0), 10)
+            for i in range(3)
+        ]
+        manager.delete_reservation(self.admin_user_1, reservations[0])
+        self.client.force_authenticate(user=self.admin_user_1)
+        url = reverse('reservation-outbox')
+
+        # 변경 기록만으로 날짜별 대기 인원 유지
+        pending_attendees = {}
+        after = None
+        pages = 0
+        while True:
+            response = self.client.get(url, {'after': after or '', 'limit': 2})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            for change in response.data['changes']:
+                for key, sign in (('before', -1), ('after', 1)):
+                    state = change['payload'].get(key)
+                    if state:
+                        pending_attendees[state['exam_date']] = pending_attendees.get(state['exam_date'], 0) \
+                            + sign * state['attendees']
+            after = response.data['next_after']
+            pages += 1
+            if not response.data['has_more']:
+                break
+
+        self.assertEqual(pages, 2)
+        self.assertEqual(pending_attendees, {self.exam_date.isoformat(): 20})
+        self.assertEqual(self.client.get(url, {'after': after}).data['changes'], [])
+
+    @override_settings(RESERVATION_CHANGE_VISIBILITY_SECONDS=60)
+    def test_recent_changes_not_visible(self):
+        """진행 중인 트랜잭션의 기록을 건너뛰지 않도록 최근 기록은 조회하지 않음"""
+        ReservationManager().create_reservation(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 100)
+
+        changes, next_after, has_more = ReservationManager().retrieve_changes()
+
+        self.assertEqual((changes, next_after, has_more), ([], 0, False))
+
+    def test_long_running_transaction_hides_later_changes(self):
+        """PostgreSQL 에서 진행 중인 쓰기 트랜잭션이 시작된 이후의 기록은 그 트랜잭션이 끝날 때까지 조회하지 않음"""
+        ReservationManager().create_reservation(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 100)
+        ReservationChange.objects.update(created_at=timezone.now() - timedelta(seconds=10))
+
+        postgresql = mock.MagicMock(vendor='postgresql')
+        fetchone = postgresql.cursor.return_value.__enter__.return_value.fetchone
+
+        # 30초 전에 시작한 쓰기 트랜잭션이 진행 중
+        fetchone.return_value = (30.0,)
+        with mock.patch('reservations.outbox.connection', postgresql):
+            self.assertEqual(ReservationManager().retrieve_changes()[0], [])
+
+        # 진행 중인 쓰기 트랜잭션 없음
+        fetchone.return_value = (None,)
+        with mock.patch('reservations.outbox.connection', postgresql):
+            self.assertEqual(len(ReservationManager().retrieve_changes()[0]), 1)
+
+    def test_get_changes_with_invalid_cursor_or_role(self):
+        """정수가 아닌 cursor, 기업 사용자의 변경 기록 조회 시도"""
+        url = reverse('reservation-outbox')
+
+        self.client.force_authenticate(user=self.admin_user_1)
+        self.assertEqual(self.client.get(url, {'after': 'abc'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=self.company_user_1)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_prune_changes_command(self):
+        """보관 기간이 지난 변경 기록 삭제"""
+        manager = ReservationManager()
+        for i in range(3):
+            manager.create_reservation(self.company_user_1, self.exam_date, time(9 + i, 0), time(10 + i, 0), 10)
+        old_seqs = list(ReservationChange.objects.order_by('seq').values_list('seq', flat=True)[:2])
+        ReservationChange.objects.filter(seq__in=old_seqs).update(created_at=timezone.now() - timedelta(days=8))
+
+        call_command('prune_reservation_changes', '--batch-size', '1', stdout=StringIO())
+
+        self.assertEqual(ReservationChange.objects.count(), 1)
+        self.assertFalse(ReservationChange.objects.filter(seq__in=old_seqs).exists())
+
+
+@override_settings(RESERVATION_CHANGE_VISIBILITY_SECONDS=0)
+class ReservationSyncTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.company_user_2 = User.objects.create(
+            email='company_user_2@test.com',
+            password='testpassword',
+            name='company_user_2',
+            role='COMPANY',
+        )
+        self.admin_user_1 = User.objects.create(
+            email='admin_user_1@test.com',
+            password='testpassword',
+            name='admin_user_1',
+            role='ADMIN',
+        )
+        self.exam_date = timezone.now().date() + timedelta(days=5)
+        self.url = reverse('reservation-changes')
+
+    def sync(self, since=None, limit=2):
+        """has_more 가 false 가 될 때까지 이어서 조회해 (변경분 목록, 마지막 cursor) 반환"""
+        changes = []
+        while True:
+            response = self.client.get(self.url, {'since': since or '', 'limit': limit})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            changes += response.data['changes']
+            since = response.data['next_cursor']
+            if not response.data['has_more']:
+                return changes, since
+
+    def test_reservation_timestamps(self):
+        """예약 생성 시 생성, 수정 일시를 기록하고 수정 시 수정 일시만 갱신"""
+        manager = ReservationManager()
+        reservation = manager.create_reservation(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 100)
+        created_at, updated_at = reservation.created_at, reservation.updated_at
+
+        manager.update_reservation(reservation, self.admin_user_1, attendees=200)
+        reservation.refresh_from_db()
+
+        self.assertEqual(reservation.created_at, created_at)
+        self.assertGreater(reservation.updated_at, updated_at)
+
+    def test_sync_upserts_and_tombstones(self):
+        """전체 동기화 후 cursor 이후에 수정, 삭제된 본인 예약만 조회"""
+        manager = ReservationManager()
+        reservations = [
+            manager.create_reservation(self.company_user_1, self.exam_date, time(9 + i, 0), time(10 + i, 0), 10)
+            for i in range(3)
+        ]
+        manager.create_reservation(self.company_user_2, self.exam_date, time(9, 0), time(10, 0), 10)
+        # 수정 일시가 같은 예약도 페이지 경계에서 빠지거나 중복되지 않음
+        Reservation.objects.filter(id__in=[r.id for r in reservations]).update(updated_at=timezone.now())
+        self.client.force_authenticate(user=self.company_user_1)
+
+        changes, cursor = self.sync()
+
+        self.assertEqual([change['type'] for change in changes], ['upsert'] * 3)
+        self.assertEqual([change['reservation']['id'] for change in changes], [r.id for r in reservations])
+
+        deleted_id = reservations[0].id
+        manager.update_reservation(reservations[1], self.company_user_1, attendees=20)
+        manager.delete_reservation(self.company_user_1, reservations[0])
+
+        changes, cursor = self.sync(cursor)
+
+        self.assertEqual(changes[0]['type'], 'upsert')
+        self.assertEqual(changes[0]['reservation']['attendees'], 20)
+        self.assertEqual(changes[1]['type'], 'delete')
+        self.assertEqual(changes[1]['id'], deleted_id)
+        self.assertEqual(len(changes), 2)
+        self.assertEqual(self.sync(cursor), ([], cursor))
+
+    def test_long_running_transaction_and_stale_delete(self):
+        """진행 중인 쓰기 트랜잭션 이후의 변경은 조회하지 않고, 이미 삭제된 예약을 다시 삭제해도 삭제 기록은 하나"""
+        manager = ReservationManager()
+        reservation = manager.create_reservation(self.company_user_1, self.exam_date, time(9, 0), time(10, 0), 10)
+        stale = Reservation.objects.get(id=reservation.id)
+        Reservation.objects.filter(id=reservation.id).update(updated_at=timezone.now() - timedelta(seconds=10))
+        self.client.force_authenticate(user=self.company_user_1)
+
+        postgresql = mock.MagicMock(vendor='postgresql')
+        # 30초 전에 시작한 쓰기 트랜잭션이 진행 중
+        postgresql.cursor.return_value.__enter__.return_value.fetchone.return_value = (30.0,)
+        with mock.patch('reservations.outbox.connection', postgresql):
+            self.assertEqual(self.sync()[0], [])
+
+        manager.delete_reservation(self.company_user_1, reservation)
+        with self.assertRaises(ReservationNotFoundException):
+            manager.delete_reservation(self.company_user_1, stale)
+
+        changes, _ = self.sync()
+        self.assertEqual([(change['type'], change['id']) for change in changes], [('delete', reservation.id)])
+
+    def test_archived_reservation_tombstone(self):
+        """보관 테이블로 이동한 예약도 삭제 기록 추가"""
+        past = Reservation.objects.create(company_customer=self.company_user_1, exam_date=timezone.now().date()
+                                          - timedelta(days=400), start_time=time(9, 0), end_time=time(10, 0),
+                                          attendees=10)
+
+        ReservationManager().archive_reservations(timezone.now().date() - timedelta(days=365))
+
+        self.assertTrue(ReservationTombstone.objects.filter(
+            reservation_id=past.id, company_customer=self.company_user_1,
+        ).exists())
+
+    def test_sync_with_invalid_or_expired_cursor(self):
+        """잘못된 cursor 는 400, 삭제 기록 보관 기간이 지난 cursor 는 410, 어드민 조회는 403"""
+        expired = encode_cursor(timezone.now() - timedelta(days=31), UPSERT, 1)
+
+        self.client.force_authenticate(user=self.company_user_1)
+        self.assertEqual(self.client.get(self.url, {'since': 'abc'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {'since': expired}).status_code, status.HTTP_410_GONE)
+
+        self.client.force_authenticate(user=self.admin_user_1)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_prune_tombstones_command(self):
+        """보관 기간이 지난 삭제 기록 삭제"""
+        manager = ReservationManager()
+        for i in range(2):
+            reservation = manager.create_reservation(self.company_user_1, self.exam_date, time(9 + i, 0),
+                                                     time(10 + i, 0), 10)
+            manager.delete_reservation(self.company_user_1, reservation)
+        old = ReservationTombstone.objects.order_by('id').first()
+        ReservationTombstone.objects.filter(id=old.id).update(deleted_at=timezone.now() - timedelta(days=31))
+
+        call_command('prune_reservation_tombstones', stdout=StringIO())
+
+        self.assertEqual(ReservationTombstone.objects.count(), 1)
+        self.assertFalse(ReservationTombstone.objects.filter(id=old.id).exists())
+
+
+class ReservationBulkDeleteTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.company_user_2 = User.objects.create(
+            email='company_user_2@test.com',
+            password='testpassword',
+            name='company_user_2',
+            role='COMPANY',
+        )
+        self.admin_user_1 = User.objects.create(
+            email='admin_user_1@test.com',
+            password='testpassword',
+            name='admin_user_1',
+            role='ADMIN',
+        )
+        self.exam_date = timezone.now().date() + timedelta(days=5)
+        manager = ReservationManager()
+        self.pending = manager.create_reservation(self.company_user_1, self.exam_date, time(9, 0), time(10, 0), 10)
+        self.confirmed = manager.create_reservation(self.company_user_1, self.exam_date, time(10, 0), time(12, 0), 100)
+        manager.update_reservation(self.confirmed, self.admin_user_1, status='CONFIRMED')
+        self.other = manager.create_reservation(self.company_user_2, self.exam_date, time(9, 0), time(10, 0), 20)
+        self.url = reverse('reservation-bulk-delete')
+
+    def test_bulk_delete_by_company_user(self):
+        """기업 사용자는 확정 전의 자신의 예약만 삭제, 예약별 결과 반환"""
+        self.client.force_authenticate(user=self.company_user_1)
+        ids = [self.pending.id, self.confirmed.id, self.other.id, 999999]
+
+        response = self.client.post(self.url, {'ids': ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(result['id'], result['outcome']) for result in response.data['results']],
+            list(zip(ids, ['deleted', 'confirmed', 'forbidden', 'not_found'])),
+        )
+        self.assertEqual(response.data['deleted_count'], 1)
+        self.assertEqual(response.data['capacity_deltas'], [])
+        self.assertEqual(
+            set(Reservation.objects.values_list('id', flat=True)),
+            {self.confirmed.id, self.other.id},
+        )
+
+    def test_bulk_delete_by_exam_date_as_admin(self):
+        """어드민은 시험 날짜의 모든 예약을 한 번의 DELETE 로 삭제하고 집계, 변경 기록, 삭제 기록 반영"""
+        self.client.force_authenticate(user=self.admin_user_1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {'exam_date': self.exam_date.isoformat()}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['deleted_count'], 3)
+        self.assertFalse(response.data['has_more'])
+        self.assertEqual(
+            [(delta['start_time'], delta['released_attendees']) for delta in response.data['capacity_deltas']],
+            [('10:00:00', 100), ('11:00:00', 100)],
+        )
+        deletes = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('DELETE FROM "reservations"')]
+        self.assertEqual(len(deletes), 1)
+
+        self.assertFalse(Reservation.objects.exists())
+        self.assertEqual(rollups.find_mismatches(), [])
+        self.assertEqual(ReservationChange.objects.filter(operation='DELETE').count(), 3)
+        self.assertEqual(ReservationTombstone.objects.count(), 3)
+
+    def test_bulk_delete_by_exam_date_as_company_user(self):
+        """기업 사용자가 조건으로 삭제하면 확정 전의 자신의 예약만 삭제"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        response = self.client.post(self.url, {'exam_date': self.exam_date.isoformat()}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [{'id': self.pending.id, 'outcome': 'deleted'}])
+        self.assertEqual(Reservation.objects.count(), 2)
+
+    def test_bulk_delete_with_invalid_request(self):
+        """ids 와 exam_date 를 모두 입력하거나 모두 입력하지 않은 경우"""
+        self.client.force_authenticate(user=self.admin_user_1)
+
+        for data in ({}, {'ids': [self.pending.id], 'exam_date': self.exam_date.isoformat()}, {'ids': []}):
+            response = self.client.post(self.url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Reservation.objects.count(), 3)
+
+
+class ReservationListFilterTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.company_user_2 = User.objects.create(
+            email='company_user_2@test.com',
+            password='testpassword',
+            name='company_user_2',
+            role='COMPANY',
+        )
+        self.admin_user_1 = User.objects.create(
+            email='admin_user_1@test.com',
+            password='testpassword',
+            name='admin_user_1',
+            role='ADMIN',
+        )
+        today = timezone.now().date()
+        self.reservations = [
+            Reservation.objects.create(company_customer=company, exam_date=today + timedelta(days=days),
+                                       start_time=time(10, 0), end_time=time(12, 0), attendees=attendees,
+                                       status=reservation_status)
+            for company, days, attendees, reservation_status in (
+                (self.company_user_1, 5, 100, 'PENDING'),
+                (self.company_user_1, 10, 300, 'CONFIRMED'),
+                (self.company_user_1, 15, 200, 'PENDING'),
+                (self.company_user_2, 10, 50, 'PENDING'),
+            )
+        ]
+        self.url = reverse('reservations')
+
+    def ids(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [reservation['id'] for reservation in response.data['results']]
+
+    def test_filter_and_sort_by_company_user(self):
+        """기업 사용자는 자신의 예약을 조건으로 조회하고 정렬"""
+        r = self.reservations
+        self.client.force_authenticate(user=self.company_user_1)
+
+        self.assertEqual(self.ids(self.client.get(self.url)), [r[2].id, r[1].id, r[0].id])
+        self.assertEqual(self.ids(self.client.get(self.url, {'sort': 'attendees'})), [r[0].id, r[2].id, r[1].id])
+        self.assertEqual(self.ids(self.client.get(self.url, {
+            'exam_date_from': (timezone.now().date() + timedelta(days=6)).isoformat(),
+            'status': 'PENDING',
+        })), [r[2].id])
+        self.assertEqual(self.ids(self.client.get(self.url, {
+            'attendees_min': 150, 'attendees_max': 300, 'sort': '-attendees',
+        })), [r[1].id, r[2].id])
+
+    def test_filter_by_company_as_admin(self):
+        """어드민만 기업 조건으로 조회"""
+        self.client.force_authenticate(user=self.admin_user_1)
+        response = self.client.get(self.url, {'company': self.company_user_2.id})
+        self.assertEqual(self.ids(response), [self.reservations[3].id])
+
+        # 시험 날짜 오름차순은 같은 날짜, 시간이면 id 오름차순
+        r = self.reservations
+        response = self.client.get(self.url, {'sort': 'exam_date'})
+        self.assertEqual(self.ids(response), [r[0].id, r[1].id, r[3].id, r[2].id])
+
+        self.client.force_authenticate(user=self.company_user_1)
+        response = self.client.get(self.url, {'company': self.company_user_2.id})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_company_by_admin(self):
+        """어드민은 기업 이름 또는 이메일에 포함된 문자열로 검색 (이름 변경도 검색 인덱스에 반영)"""
+        r = self.reservations
+        self.client.force_authenticate(user=self.admin_user_1)
+
+        self.assertEqual(self.ids(self.client.get(self.url, {'search': 'USER_2'})), [r[3].id])
+        self.assertEqual(self.ids(self.client.get(self.url, {'search': 'r_1@test'})), [r[2].id, r[1].id, r[0].id])
+        self.assertEqual(len(self.ids(self.client.get(self.url, {'search': '_'}))), 4)
+        self.assertEqual(self.ids(self.client.get(self.url, {'search': 'admin'})), [])
+
+        self.company_user_2.name = 'renamed company'
+        self.company_user_2.save()
+        self.assertEqual(self.ids(self.client.get(self.url, {'search': 'renamed'})), [r[3].id])
+        self.assertEqual(self.ids(self.client.get(self.url, {'search': 'company_user_2', 'status': 'CONFIRMED'})), [])
+
+        self.client.force_authenticate(user=self.company_user_1)
+        response = self.client.get(self.url, {'search': 'user_2'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_reject_unindexed_sort(self):
+        """인덱스가 없는 정렬 기준, 잘못된 조건은 거절"""
+        self.client.force_authenticate(user=self.admin_user_1)
+
+        for params in ({'sort': 'end_time'}, {'sort': '-status'}, {'attendees_min': 'abc'},
+                       {'exam_date_to': '2024-13-01'}, {'status': 'CANCELLED'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+        with self.assertRaises(InvalidQueryParameterException):
+            ReservationManager().retrieve_reservations_by_user(self.admin_user_1, {'sort': 'company_customer'})
+
+    def test_sorts_backed_by_indexes(self):
+        """모든 정렬 기준은 같은 순서 또는 역순의 인덱스가 있음 (어드민 전체 조회, 기업별 조회)"""
+        def reverse_order(fields):
+            return tuple(field[1:] if field.startswith('-') else f'-{field}' for field in fields)
+
+        index_fields = {tuple(index.fields) for index in Reservation._meta.indexes}
+        for sort, fields in RESERVATION_LIST_SORTS.items():
+            for prefix in ((), ('company_customer',)):
+                self.assertTrue(
+                    prefix + fields in index_fields or prefix + reverse_order(fields) in index_fields,
+                    f'{sort} {prefix}',
+                )
+
+
+class ReservationBatchFetchTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.company_user_2 = User.objects.create(
+            email='company_user_2@test.com',
+            password='testpassword',
+            name='company_user_2',
+            role='COMPANY',
+        )
+        self.admin_user_1 = User.objects.create(
+            email='admin_user_1@test.com',
+            password='testpassword',
+            name='admin_user_1',
+            role='ADMIN',
+        )
+        exam_date = timezone.now().date() + timedelta(days=5)
+        self.reservations = [
+            Reservation.objects.create(company_customer=company, exam_date=exam_date, start_time=time(10, 0),
+                                       end_time=time(12, 0), attendees=100)
+            for company in (self.company_user_1, self.company_user_1, self.company_user_2)
+        ]
+        self.url = reverse('reservation-batch')
+
+    def test_batch_fetch_by_company_user(self):
+        """기업 사용자는 자신의 예약만 한 번의 쿼리로 조회, 다른 기업 예약과 없는 예약 ID 는 구분해 반환"""
+        r = self.reservations
+        self.client.force_authenticate(user=self.company_user_1)
+        ids = f'{r[1].id},{r[2].id},999999,{r[0].id}'
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'ids': ids})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([reservation['id'] for reservation in response.data['results']], [r[1].id, r[0].id])
+        self.assertEqual(response.data['results'][0]['company_customer'], self.company_user_1.name)
+        self.assertEqual(response.data['not_found'], [999999])
+        self.assertEqual(response.data['forbidden'], [r[2].id])
+        reservation_queries = [q for q in queries.captured_queries if 'FROM "reservations"' in q['sql']]
+        self.assertEqual(len(reservation_queries), 2)
+
+    def test_batch_fetch_by_admin_user(self):
+        """어드민은 모든 예약 조회"""
+        self.client.force_authenticate(user=self.admin_user_1)
+
+        response = self.client.get(self.url, {'ids': ','.join(str(r.id) for r in self.reservations)})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual((response.data['not_found'], response.data['forbidden']), ([], []))
+
+    def test_batch_fetch_with_invalid_ids(self):
+        """ID 목록이 없거나 정수가 아니거나 최대 수를 넘는 경우"""
+        self.client.force_authenticate(user=self.admin_user_1)
+
+        for ids in ('', '1,a', ','.join(str(i) for i in range(1, 102))):
+            response = self.client.get(self.url, {'ids': ids})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, ids)
+
+
+class ReservationSparseFieldsTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.company_user_2 = User.objects.create(
+            email='company_user_2@test.com',
+            password='testpassword',
+            name='company_user_2',
+            role='COMPANY',
+        )
+        self.reservation = Reservation.objects.create(
+            company_customer=self.company_user_1,
+            exam_date=timezone.now().date() + timedelta(days=5),
+            start_time=time(10, 0),
+            end_time=time(12, 0),
+            attendees=100,
+        )
+        self.other_reservation = Reservation.objects.create(
+            company_customer=self.company_user_2,
+            exam_date=timezone.now().date() + timedelta(days=5),
+            start_time=time(10, 0),
+            end_time=time(12, 0),
+            attendees=100,
+        )
+
+    def reservation_queries(self, queries):
+        return [q['sql'] for q in queries.captured_queries
+                if 'FROM "reservations"' in q['sql'] and 'COUNT(' not in q['sql']]
+
+    def test_list_with_fields(self):
+        """요청한 필드만 응답하고, company_customer 를 요청하지 않으면 기업 사용자 테이블을 join 하지 않음"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('reservations'), {'fields': 'id,exam_date,status'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data['results'][0]), ['id', 'exam_date', 'status'])
+        sql = self.reservation_queries(queries)
+        self.assertEqual(len(sql), 1)
+        self.assertNotIn('JOIN', sql[0])
+        self.assertNotIn('"attendees"', sql[0].split('FROM')[0])
+
+    def test_detail_and_batch_with_fields(self):
+        """상세, 일괄 조회도 요청한 필드만 응답 (company_customer 요청 시 join)"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        response = self.client.get(reverse('reservation-detail', args=[self.reservation.id]),
+                                   {'fields': 'status,company_customer'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'company_customer': 'company_user_1', 'status': 'PENDING'})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('reservation-batch'), {
+                'ids': f'{self.reservation.id},{self.other_reservation.id}', 'fields': 'attendees',
+            })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [{'attendees': 100}])
+        self.assertEqual(response.data['forbidden'], [self.other_reservation.id])
+        self.assertNotIn('JOIN', self.reservation_queries(queries)[0])
+
+    def test_reject_unknown_fields(self):
+        """응답에 없는 필드 요청은 거절"""
+        self.client.force_authenticate(user=self.company_user_1)
+
+        for url in (reverse('reservations'), reverse('reservation-detail', args=[self.reservation.id])):
+            for fields in ('id,password', 'updated_at', ','):
+                response = self.client.get(url, {'fields': fields})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, (url, fields))
+
+
+@override_settings(RESERVATION_CAPACITY_TRIGGERS=True)
+class ReservationCapacityTriggerTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.admin_user_1 = User.objects.create(
+            email='admin_user_1@test.com',
+            password='testpassword',
+            name='admin_user_1',
+            role='ADMIN',
+        )
+        call_command('manage_capacity_triggers', stdout=StringIO())
+        self.exam_date = timezone.now().date() + timedelta(days=5)
+        self.confirmed = Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.exam_date,
+                                                    start_time=time(10, 0), end_time=time(12, 0), attendees=40000,
+                                                    status='CONFIRMED')
+        self.pending = Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.exam_date,
+                                                  start_time=time(11, 0), end_time=time(13, 0), attendees=20000)
+
+    def test_direct_sql_cannot_overbook(self):
+        """애플리케이션을 거치지 않은 변경도 데이터베이스에서 확정 인원 제한"""
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Reservation.objects.filter(id=self.pending.id).update(status='CONFIRMED')
+
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.exam_date,
+                                           start_time=time(9, 0), end_time=time(11, 0), attendees=10001,
+                                           status='CONFIRMED')
+
+        # 겹치지 않는 시간대, 다른 날짜, 대기 상태는 허용
+        Reservation.objects.filter(id=self.pending.id).update(start_time=time(12, 0), end_time=time(13, 0),
+                                                              status='CONFIRMED')
+        Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.exam_date,
+                                   start_time=time(10, 0), end_time=time(11, 0), attendees=20000)
+
+    def test_confirm_maps_trigger_error(self):
+        """확정 시 조회로 확인하지 않고 트리거 오류를 ReservationAttendeesException 으로 변환"""
+        manager = ReservationManager()
+
+        with mock.patch.object(ReservationManager, '_check_available_attendees') as check:
+            with self.assertRaises(ReservationAttendeesException):
+                manager.update_reservation(self.pending, self.admin_user_1, status='CONFIRMED')
+            check.assert_not_called()
+
+        self.pending.refresh_from_db()
+        self.assertEqual(self.pending.status, 'PENDING')
+
+        manager.update_reservation(self.pending, self.admin_user_1, attendees=10000)
+        manager.update_reservation(self.pending, self.admin_user_1, status='CONFIRMED')
+        self.pending.refresh_from_db()
+        self.assertEqual(self.pending.status, 'CONFIRMED')
+
+    def test_holds_count_same_with_and_without_triggers(self):
+        """만료되지 않은 확보 인원은 트리거 사용 여부와 관계없이 같은 기준으로 확정 인원 제한에 포함"""
+        pending = Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.exam_date,
+                                             start_time=time(12, 0), end_time=time(13, 0), attendees=46000)
+        hold = ReservationHold.objects.create(company_customer=self.company_user_1, exam_date=self.exam_date,
+                                              start_time=time(12, 0), end_time=time(13, 0), attendees=5000,
+                                              expires_at=timezone.now() + timedelta(minutes=5))
+        manager = ReservationManager()
+
+        def can_confirm():
+            try:
+                with transaction.atomic():
+                    manager.update_reservation(pending, self.admin_user_1, status='CONFIRMED')
+                    transaction.set_rollback(True)
+                return True
+            except ReservationAttendeesException:
+                return False
+            finally:
+                pending.refresh_from_db()
+
+        results = []
+        for installed in (True, False):
+            call_command('manage_capacity_triggers', *([] if installed else ['--uninstall']), stdout=StringIO())
+            self.assertEqual(capacity.is_active(connection), installed)
+
+            ReservationHold.objects.filter(id=hold.id).update(expires_at=timezone.now() + timedelta(minutes=5))
+            active_hold = can_confirm()
+            ReservationHold.objects.filter(id=hold.id).update(expires_at=timezone.now() - timedelta(minutes=1))
+            expired_hold = can_confirm()
+            results.append((active_hold, expired_hold))
+
+        self.assertEqual(results, [(False, True), (False, True)])
+
+    def test_uninstall_triggers(self):
+        """트리거 제거 후에는 데이터베이스에서 제한하지 않음"""
+        call_command('manage_capacity_triggers', '--uninstall', stdout=StringIO())
+
+        Reservation.objects.filter(id=self.pending.id).update(status='CONFIRMED')
+
+    def test_check_when_triggers_missing(self):
+        """설정이 켜져 있어도 트리거가 설치되어 있지 않으면 저장 전 조회로 확인"""
+        call_command('manage_capacity_triggers', '--uninstall', stdout=StringIO())
+
+        with self.assertRaises(ReservationAttendeesException):
+            ReservationManager().update_reservation(self.confirmed, self.admin_user_1, attendees=20000)
+
+        self.assertEqual(Reservation.objects.get(id=self.confirmed.id).attendees, 40000)
+
+
+class ReservationConditionalInsertTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.exam_date = timezone.now().date() + timedelta(days=5)
+        Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.exam_date,
+                                   start_time=time(10, 0), end_time=time(12, 0), attendees=40000, status='CONFIRMED')
+        ReservationHold.objects.create(company_customer=self.company_user_1, exam_date=self.exam_date,
+                                       start_time=time(11, 0), end_time=time(12, 0), attendees=5000,
+                                       expires_at=timezone.now() + timedelta(minutes=5))
+
+    def test_create_in_single_statement(self):
+        """예약 가능 인원 확인과 추가를 한 번의 INSERT 로 처리"""
+        with CaptureQueriesContext(connection) as queries:
+            reservation = ReservationManager().create_reservation(
+                self.company_user_1, self.exam_date, time(11, 0), time(13, 0), 5000,
+            )
+
+        reservation_queries = [q['sql'] for q in queries.captured_queries if '"reservations"' in q['sql']
+                               or 'reservations ' in q['sql']]
+        self.assertTrue(reservation_queries[0].lstrip().startswith('INSERT INTO reservations'))
+        self.assertFalse(any(sql.startswith('SELECT') and 'FROM "reservations"' in sql for sql in reservation_queries))
+
+        saved = Reservation.objects.get(id=reservation.id)
+        self.assertEqual((saved.start_time, saved.attendees, saved.status), (time(11, 0), 5000, 'PENDING'))
+        self.assertEqual(saved.created_at, reservation.created_at)
+        self.assertEqual(ReservationChange.objects.get(reservation_id=reservation.id).operation, 'CREATE')
+        self.assertEqual(rollups.read_rollups(self.exam_date, self.exam_date)[self.exam_date]['pending_attendees'], 5000)
+
+    def test_rejected_when_exceeding_available_attendees(self):
+        """확정 인원과 확보 인원을 합쳐 예약 가능 인원을 넘으면 추가하지 않고 예약 가능 인원을 알려줌"""
+        with self.assertRaisesMessage(ReservationAttendeesException, '현재 예약 가능 인원: 5000명'):
+            ReservationManager().create_reservation(self.company_user_1, self.exam_date, time(11, 0), time(13, 0),
+                                                    5001)
+
+        self.assertEqual(Reservation.objects.count(), 1)
+
+    def test_fallback_on_unsupported_database(self):
+        """지원하지 않는 데이터베이스는 조회 후 추가"""
+        with mock.patch('reservations.conditional_insert.is_supported', return_value=False), \
+                mock.patch('reservations.conditional_insert.insert_if_available') as insert:
+            with self.assertRaises(ReservationAttendeesException):
+                ReservationManager().create_reservation(self.company_user_1, self.exam_date, time(11, 0),
+                                                        time(13, 0), 5001)
+            reservation = ReservationManager().create_reservation(self.company_user_1, self.exam_date, time(11, 0),
+                                                                  time(13, 0), 5000)
+
+        insert.assert_not_called()
+        self.assertTrue(Reservation.objects.filter(id=reservation.id).exists())
+
+
+class ReservationTimeRangeOverlapTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.exam_date = timezone.now().date() + timedelta(days=5)
+        for start_hour, end_hour, attendees in [(9, 10, 1000), (10, 12, 2000), (11, 13, 3000), (14, 16, 4000)]:
+            Reservation.objects.create(company_customer=self.company_user_1, exam_date=self.exam_date,
+                                       start_time=time(start_hour, 0), end_time=time(end_hour, 0),
+                                       attendees=attendees, status='CONFIRMED')
+
+    def test_window_slots_match_full_day(self):
+        """시간대를 주면 겹치는 슬롯만 반환하고 가용 인원은 날짜 전체 계산과 같음"""
+        manager = ReservationManager()
+        full_day = manager._get_available_slots(self.exam_date)
+
+        window = manager._get_available_slots(self.exam_date, time(10, 30), time(12, 0))
+
+        self.assertEqual(window, [slot for slot in full_day if slot['start_time'] in (time(10, 0), time(11, 0))])
+        self.assertEqual(manager._check_available_attendees(self.exam_date, time(10, 30), time(12, 0)), 45000)
+
+    def test_fallback_overlap_filter(self):
+        """SQLite 는 시간 비교 조건으로 겹치는 예약만 조회"""
+        condition = time_ranges.overlap_filter(connection, self.exam_date, time(10, 0), time(11, 0))
+        attendees = Reservation.objects.filter(condition).values_list('attendees', flat=True)
+
+        self.assertCountEqual(attendees, [2000])
+
+    @override_settings(RESERVATION_TIME_RANGE_INDEX=True)
+    def test_postgresql_overlap_filter(self):
+        """PostgreSQL 에서 설정이 켜져 있고 컬럼이 있으면 time_window && tsrange 조건 사용"""
+        postgresql = mock.Mock(vendor='postgresql')
+        with mock.patch('reservations.time_ranges.is_installed', return_value=True):
+            condition = time_ranges.overlap_filter(postgresql, self.exam_date, time(10, 0), time(11, 0))
+
+        self.assertIn("reservations.time_window && tsrange(%s, %s, '[)')", condition.sql)
+        self.assertEqual(condition.params, [datetime.combine(self.exam_date, time(10, 0)),
+                                            datetime.combine(self.exam_date, time(11, 0))])
+
+        # 마이그레이션 이후에 설정을 켜 컬럼이 없으면 시간 비교 조건 사용
+        with mock.patch('reservations.time_ranges.is_installed', return_value=False):
+            condition = time_ranges.overlap_filter(postgresql, self.exam_date, time(10, 0), time(11, 0))
+        self.assertIsInstance(condition, Q)
+
+    @skipUnless(connection.vendor == 'postgresql', 'PostgreSQL 에서만 time_window 컬럼을 사용')
+    @override_settings(RESERVATION_TIME_RANGE_INDEX=True)
+    def test_postgresql_time_window_index(self):
+        """설치 전에는 시간 비교 조건, 설치 후에는 time_window GiST 인덱스로 같은 예약 조회"""
+        manager = ReservationManager()
+        time_ranges.uninstall(connection)
+        self.assertFalse(time_ranges.is_active(connection))
+        expected = manager._check_available_attendees(self.exam_date, time(10, 30), time(12, 0))
+
+        time_ranges.install(connection)
+        self.assertTrue(time_ranges.is_active(connection))
+        condition = time_ranges.overlap_filter(connection, self.exam_date, time(10, 0), time(11, 0))
+        attendees = Reservation.objects.filter(condition).values_list('attendees', flat=True)
+
+        self.assertCountEqual(attendees, [2000])
+        self.assertEqual(manager._check_available_attendees(self.exam_date, time(10, 30), time(12, 0)), expected)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1 FROM pg_indexes WHERE indexname = %s', [time_ranges.INDEX])
+            self.assertIsNotNone(cursor.fetchone())
+
+
+class ReservationSeederTestCase(APITestCase):
+    def test_seed_companies_is_rerunnable(self):
+        """같은 prefix 로 다시 실행하면 부족한 기업 사용자만 생성"""
+        seeder = ReservationSeeder(batch_size=2)
+        company_ids = seeder.seed_companies(3)
+
+        self.assertEqual(seeder.seed_companies(3), company_ids)
+        self.assertEqual(len(seeder.seed_companies(5)), 5)
+        self.assertEqual(User.objects.filter(email__startswith='seed_company_').count(), 5)
+
+    def test_seed_reservations(self):
+        """운영 시간 안의 예약을 생성하고 확정 인원은 시간대별 최대 인원을 넘지 않음"""
+        company_ids = ReservationSeeder().seed_companies(3)
+        start_date = timezone.now().date() + timedelta(days=10)
+
+        created = ReservationSeeder(seed=1, batch_size=100, confirmed_ratio=0.5).seed_reservations(
+            250, company_ids, days=5, start_date=start_date
+        )
+
+        self.assertEqual(created, 250)
+        rows = list(Reservation.objects.values('company_customer_id', 'exam_date', 'start_time', 'end_time',
+                                               'attendees', 'status'))
+        self.assertEqual(len(rows), 250)
+        self.assertTrue(all(row['company_customer_id'] in company_ids for row in rows))
+        self.assertTrue(all(start_date <= row['exam_date'] < start_date + timedelta(days=5) for row in rows))
+        self.assertTrue(all(time(9, 0) <= row['start_time'] < row['end_time'] <= time(18, 0) for row in rows))
+        self.assertTrue(any(row['status'] == 'CONFIRMED' for row in rows))
+
+        confirmed = {}
+        for row in rows:
+            if row['status'] != 'CONFIRMED':
+                continue
+            for hour in range(row['start_time'].hour, row['end_time'].hour):
+                key = (row['exam_date'], hour)
+                confirmed[key] = confirmed.get(key, 0) + row['attendees']
+        self.assertLessEqual(max(confirmed.values()), 50000)
+
+    def test_same_seed_generates_same_rows(self):
+        """같은 seed 값이면 같은 예약 생성"""
+        start_date = timezone.now().date() + timedelta(days=10)
+
+        def build_rows(seed):
+            seeder = ReservationSeeder(seed=seed)
+            return [seeder._build_row(start_date, [1, 2, 3]) for _ in range(50)]
+
+        self.assertEqual(build_rows(7), build_rows(7))
+        self.assertNotEqual(build_rows(7), build_rows(8))
+
+
+class ReservationArchiveTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.admin_user_1 = User.objects.create(
+            email='admin_user_1@test.com',
+            password='testpassword',
+            name='admin_user_1',
+            role='ADMIN',
+        )
+        # 보관 기간이 지난 예약
+        self.old_reservation = Reservation.objects.create(
+            company_customer=self.company_user_1,
+            exam_date=timezone.now().date() - timedelta(days=400),
+            start_time=time(10, 0),
+            end_time=time(12, 0),
+            attendees=100,
+            status='CONFIRMED'
+        )
+        self.reservation = Reservation.objects.create(
+            company_customer=self.company_user_1,
+            exam_date=timezone.now().date() + timedelta(days=5),
+            start_time=time(10, 0),
+            end_time=time(12, 0),
+            attendees=100,
+            status='PENDING'
+        )
+
+    def test_archive_reservations(self):
+        """보관 기간이 지난 예약만 보관 테이블로 이동"""
+        call_command('archive_reservations', batch_size=1, stdout=StringIO())
+
+        self.assertFalse(Reservation.objects.filter(id=self.old_reservation.id).exists())
+        self.assertTrue(Reservation.objects.filter(id=self.reservation.id).exists())
+        self.assertTrue(ReservationArchive.objects.filter(id=self.old_reservation.id).exists())
+
+    def test_archive_conflict_keeps_reservations(self):
+        """보관 테이블에 같은 ID 가 있으면 batch 를 이동하지 않고 예약을 남김"""
+        ReservationArchive.objects.create(
+            id=self.old_reservation.id,
+            company_customer=self.company_user_1,
+            exam_date=self.old_reservation.exam_date,
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+            attendees=1,
+            status='PENDING',
+        )
+
+        with self.assertRaises(ReservationArchiveConflictException):
+            ReservationManager().archive_reservations(timezone.now().date() - timedelta(days=365))
+
+        self.assertTrue(Reservation.objects.filter(id=self.old_reservation.id).exists())
+        self.assertEqual(ReservationArchive.objects.get().attendees, 1)
+
+    def test_get_archived_reservation_by_admin_user(self):
+        """어드민 유저가 보관된 예약을 ID로 조회"""
+        call_command('archive_reservations', stdout=StringIO())
+        self.client.force_authenticate(user=self.admin_user_1)
+        url = reverse('reservation-detail', args=[self.old_reservation.id])
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], self.old_reservation.id)
+        self.assertEqual(response.data['company_customer'], self.company_user_1.name)
+        self.assertEqual(response.data['status'], 'CONFIRMED')
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        self.factory = APIRequestFactory()
+        self.router = ReplicaRouter()
+        cache.clear()
+
+        # 테스트 환경에는 복제본 연결이 없으므로 항상 사용 가능하다고 가정
+        patcher = mock.patch.object(replica_pool, 'is_healthy', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def route_read(self, request, user=None):
+        """미들웨어를 거친 요청 처리 중 읽기 쿼리가 사용할 데이터베이스"""
+        routed = []
+
+        def get_response(request):
+            if user is not None:
+                request.user = user  # DRF 인증 이후 상태
+            routed.append(self.router.db_for_read(Reservation))
+            return HttpResponse(status=200)
+
+        ReplicaRoutingMiddleware(get_response)(request)
+        return routed[0]
+
+    def test_safe_method_reads_from_replica(self):
+        """GET 요청의 읽기는 복제본 사용"""
+        self.assertEqual(self.route_read(self.factory.get('/'), self.company_user_1), 'replica')
+
+    def test_write_request_reads_from_primary(self):
+        """쓰기 요청과 쓰기 직후 같은 사용자의 읽기는 primary 사용"""
+        self.assertEqual(self.route_read(self.factory.post('/'), self.company_user_1), 'default')
+        self.assertEqual(self.route_read(self.factory.get('/'), self.company_user_1), 'default')
+
+    def test_use_primary(self):
+        """use_primary 블록 안의 읽기는 primary 사용"""
+        request = self.factory.get('/')
+        with routing_request(request), use_primary():
+            self.assertEqual(self.router.db_for_read(Reservation), 'default')
+
+    def test_ejected_replica(self):
+        """제외된 복제본만 있으면 primary 사용"""
+        pool = ReplicaPool()
+        pool.eject('replica')
+        with mock.patch('programmers_exam_reservation.utils.db_routers.replica_pool', pool):
+            self.assertEqual(self.route_read(self.factory.get('/'), self.company_user_1), 'default')
+
+
+class ReservationPartitionHelperTestCase(SimpleTestCase):
+    def test_add_months(self):
+        """월 더하기는 해를 넘겨도 해당 월의 1일"""
+        self.assertEqual(partitions.add_months(date(2024, 11, 15), 1), date(2024, 12, 1))
+        self.assertEqual(partitions.add_months(date(2024, 12, 31), 1), date(2025, 1, 1))
+        self.assertEqual(partitions.add_months(date(2024, 1, 31), -1), date(2023, 12, 1))
+        self.assertEqual(partitions.add_months(date(2024, 3, 1), 14), date(2025, 5, 1))
+
+    def test_partition_name(self):
+        """파티션 이름은 연, 월을 0으로 채워 정렬 가능"""
+        self.assertEqual(partitions.partition_name(date(2024, 3, 1)), 'reservations_p2024_03')
+        self.assertEqual(partitions.partition_name(partitions.month_start(date(2025, 12, 31))), 'reservations_p2025_12')
+
+    def test_list_partitions(self):
+        """파티션 이름에서 월을 읽어 월 순으로 정렬하고 기본 파티션은 제외"""
+        cursor = mock.MagicMock()
+        cursor.fetchall.return_value = [('reservations_p2025_01',), ('reservations_default',), ('reservations_p2024_12',)]
+
+        self.assertEqual(
+            partitions.list_partitions(cursor),
+            [('reservations_p2024_12', date(2024, 12, 1)), ('reservations_p2025_01', date(2025, 1, 1))],
+        )
+
+    def test_detach_partitions_before(self):
+        """기준 월 이전의 파티션만 분리"""
+        cursor = mock.MagicMock()
+        cursor.fetchall.return_value = [('reservations_p2024_11',), ('reservations_p2024_12',), ('reservations_p2025_01',)]
+
+        detached = partitions.detach_partitions_before(cursor, date(2024, 12, 15))
+
+        self.assertEqual(detached, ['reservations_p2024_11'])
+        cursor.execute.assert_called_with('ALTER TABLE "reservations" DETACH PARTITION "reservations_p2024_11"')
+
+
+class LoadTestReportTestCase(SimpleTestCase):
+    def test_report_excludes_errors_from_latency(self):
+        """응답 시간 백분위는 성공 응답만으로 계산하고 오류율을 따로 집계"""
+        load_test = LoadTest(max_error_rate=0.1)
+        samples = [('create', 201, 0.010, 5)] * 9 + [('create', 500, 0.001, 1)] + [('list', 200, 0.020, 2)] * 10
+
+        report = load_test.report(samples, elapsed=1.0)
+
+        self.assertEqual(report['endpoints']['create']['p50_ms'], 10.0)
+        self.assertEqual(report['endpoints']['create']['p99_ms'], 10.0)
+        self.assertEqual(report['endpoints']['create']['error_rate'], 0.1)
+        self.assertEqual(report['endpoints']['create']['status_counts'], {'201': 9, '500': 1})
+        self.assertEqual(report['error_rate'], 0.05)
+        self.assertEqual(report['failed_endpoints'], [])
+
+        load_test.max_error_rate = 0.05
+        self.assertEqual(load_test.report(samples, elapsed=1.0)['failed_endpoints'], ['create'])
+
+    def test_build_requests_without_pending_reservations(self):
+        """대기 예약이 없으면 확정 요청 없이 요청 목록 생성"""
+        load_test = LoadTest(requests=50, traffic_mix={'confirm': 50, 'list': 50})
+        load_test.company_tokens = ['company']
+        load_test.admin_token = 'admin'
+
+        planned = load_test.build_requests()
+
+        self.assertEqual(len(planned), 50)
+        self.assertEqual({endpoint for endpoint, *_ in planned}, {'list'})
+
+
+@override_settings(DATABASE_REPLICAS=['replica'], TOKEN_BUCKET_THROTTLE={'RATES': {}})
+class ReplicaDatabaseRoutingTestCase(APITestCase):
+    """primary 와 다른 데이터를 가진 실제 복제본 데이터베이스로 라우팅 확인 (TEST MIRROR 없이)"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # 테스트 트랜잭션으로 감싸지 않는 별도의 메모리 데이터베이스 (테스트마다 tearDown 에서 정리)
+        connections.settings['replica'] = connections.configure_settings({
+            'default': connections.settings['default'],
+            'replica': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+        })['replica']
+        with connections['replica'].schema_editor() as editor:
+            editor.create_model(User)
+            editor.create_model(Reservation)
+
+    @classmethod
+    def tearDownClass(cls):
+        connections['replica'].close()
+        del connections['replica']
+        del connections.settings['replica']
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        User.objects.using('replica').create(
+            id=self.company_user_1.id,
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+        # 복제본에만 있는 예약으로 어느 데이터베이스에서 읽었는지 구분
+        self.replica_reservation = Reservation.objects.using('replica').create(
+            company_customer_id=self.company_user_1.id,
+            exam_date=timezone.now().date() + timedelta(days=10),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+            attendees=10,
+        )
+        self.client.force_authenticate(user=self.company_user_1)
+
+    def tearDown(self):
+        with connections['replica'].cursor() as cursor:
+            for model in (Reservation, User):
+                cursor.execute(f'DELETE FROM {model._meta.db_table}')
+        cache.clear()
+
+    def list_ids(self):
+        response = self.client.get(reverse('reservations'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [reservation['id'] for reservation in response.data['results']]
+
+    def test_read_from_replica_and_write_to_primary(self):
+        """읽기는 복제본, 쓰기와 쓰기 직후 같은 사용자의 읽기는 primary 사용"""
+        self.assertEqual(self.list_ids(), [self.replica_reservation.id])
+
+        response = self.client.post(reverse('reservations'), {
+            'exam_date': timezone.now().date() + timedelta(days=5),
+            'start_time': time(10, 0),
+            'end_time': time(12, 0),
+            'attendees': 100,
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Reservation.objects.using('default').filter(id=response.data['id']).exists())
+        self.assertFalse(
+            Reservation.objects.using('replica').exclude(id=self.replica_reservation.id).exists()
+        )
+
+        # 쓰기 직후에는 primary 에서 읽음
+        self.assertEqual(self.list_ids(), [response.data['id']])
+
+        cache.clear()
+        self.assertEqual(self.list_ids(), [self.replica_reservation.id])
+
+
+class FakeConnection:
+    def __init__(self):
+        self.usable = True
+        self.dirty = False
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    def make_pool(self, **kwargs):
+        self.connections = []
+
+        def connect():
+            connection = FakeConnection()
+            self.connections.append(connection)
+            return connection
+
+        def reset(connection):
+            if connection.closed:
+                raise RuntimeError('connection already closed')
+            connection.dirty = False
+
+        options = {'min_size': 1, 'max_size': 2, 'timeout': 0.05, 'max_idle': 300.0, **kwargs}
+        return ConnectionPool('test', connect, lambda connection: connection.usable, reset, **options)
+
+    def test_borrow_and_return(self):
+        """반납한 연결을 다시 빌려줌"""
+        pool = self.make_pool()
+
+        connection = pool.getconn()
+        self.assertEqual(pool.stats(), {'size': 1, 'in_use': 1, 'idle': 0, 'waiting': 0})
+
+        pool.putconn(connection)
+        self.assertEqual(pool.stats(), {'size': 1, 'in_use': 0, 'idle': 1, 'waiting': 0})
+
+        self.assertIs(pool.getconn(), connection)
+        self.assertEqual(len(self.connections), 1)
+
+    def test_max_size_and_timeout(self):
+        """MAX_SIZE 만큼 빌려주면 반납될 때까지 기다리고, TIMEOUT 이 지나면 PoolTimeout"""
+        pool = self.make_pool()
+        first = pool.getconn()
+        pool.getconn()
+
+        with self.assertRaises(PoolTimeout):
+            pool.getconn()
+        self.assertEqual(pool.stats()['waiting'], 0)
+
+        # 기다리는 중에 반납된 연결을 빌려줌
+        pool.timeout = 5.0
+        threading.Timer(0.05, pool.putconn, args=(first,)).start()
+        self.assertIs(pool.getconn(), first)
+        self.assertEqual(len(self.connections), 2)
+
+    def test_unusable_connection_is_discarded(self):
+        """사용할 수 없는 유휴 연결은 닫고 새 연결을 빌려줌"""
+        pool = self.make_pool()
+        connection = pool.getconn()
+        pool.putconn(connection)
+        connection.usable = False
+
+        replacement = pool.getconn()
+
+        self.assertIsNot(replacement, connection)
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.stats()['size'], 1)
+
+    def test_idle_connections_are_reaped(self):
+        """MAX_IDLE 이 지난 유휴 연결은 MIN_SIZE 까지 정리"""
+        pool = self.make_pool(max_idle=0.01)
+        first, second = pool.getconn(), pool.getconn()
+        pool.putconn(first)
+        pool.putconn(second)
+        time_module.sleep(0.02)
+
+        self.assertIs(pool.getconn(), second)
+        self.assertTrue(first.closed)
+        self.assertEqual(pool.stats(), {'size': 1, 'in_use': 1, 'idle': 0, 'waiting': 0})
+
+    def test_reset_on_return(self):
+        """반납할 때 연결을 초기화하고, 초기화에 실패한 연결은 닫음"""
+        pool = self.make_pool()
+        connection = pool.getconn()
+        connection.dirty = True
+        pool.putconn(connection)
+        self.assertFalse(connection.dirty)
+
+        connection = pool.getconn()
+        connection.closed = True
+        pool.putconn(connection)
+        self.assertEqual(pool.stats(), {'size': 0, 'in_use': 0, 'idle': 0, 'waiting': 0})
+
+
+class MetricsTestCase(APITestCase):
+    def setUp(self):
+        self.company_user_1 = User.objects.create(
+            email='company_user_1@test.com',
+            password='testpassword',
+            name='company_user_1',
+            role='COMPANY',
+        )
+
+    def test_get_metrics(self):
+        """뷰별 처리 시간과 예외 집계가 메트릭으로 노출"""
+        self.client.force_authenticate(user=self.company_user_1)
+        self.client.get(reverse('reservations'))
+        self.client.get(reverse('available-times'))
+
+        response = self.client.get(reverse('metrics'))
+        body = response.content.decode()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('http_request_duration_seconds_count{method="GET",view="ReservationListView"}', body)
+        self.assertIn('http_requests_in_flight{method="GET",view="ReservationListView"} 0.0', body)
+        self.assertIn('exception="InvalidDateException",view="AvailableTimeView"', body)
+
+    @override_settings(METRICS_ALLOWED_IPS=['10.0.0.0/8'], METRICS_TOKEN='metrics-token')
+    def test_get_metrics_requires_allowed_address_or_token(self):
+        """허용 목록 밖의 주소는 Bearer 토큰이 일치할 때만 조회 가능"""
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer wrong-token').status_code,
+            status.HTTP_403_FORBIDDEN,
+        )
+        self.assertEqual(
+            self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer metrics-token').status_code,
+            status.HTTP_200_OK,
+        )
+        self.assertEqual(self.client.get(reverse('metrics'), REMOTE_ADDR='10.1.2.3').status_code, status.HTTP_200_OK)
+
+
+class MmapMetricsTestCase(SimpleTestCase):
+    def setUp(self):
+        self.metrics_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.metrics_dir.cleanup)
+        settings_override = override_settings(METRICS_DIR=self.metrics_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(self._reset_files)
+
+        self.registry = metrics.MetricsRegistry()
+        self.counter = metrics.Counter('test_mmap_total', 'test', labelnames=('name',), registry=self.registry)
+        self.gauge = metrics.Gauge('test_mmap_in_flight', 'test', registry=self.registry)
+
+    def _reset_files(self):
+        # 다른 테스트의 METRICS_DIR 에 이 프로세스의 파일이 재사용되지 않도록 초기화
+        for mmaped in metrics._MmapValue._files.values():
+            mmaped.close()
+        metrics._MmapValue._files = {}
+        metrics._MmapValue._pid = None
+
+    def test_concurrent_increments(self):
+        """여러 스레드가 같은 파일의 서로 다른 값, 같은 값을 동시에 증가시켜도 누락 없음"""
+        def work(index):
+            for _ in range(500):
+                self.counter.labels(name=f'value_{index % 4}').inc()
+                self.counter.labels(name='shared').inc()
+
+        threads = [threading.Thread(target=work, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        body = self.registry.generate_latest()
+        self.assertIn('test_mmap_total_total{name="shared"} 4000.0', body)
+        for index in range(4):
+            self.assertIn(f'test_mmap_total_total{{name="value_{index}"}} 1000.0', body)
+
+    def test_mark_process_dead(self):
+        """종료된 워커의 gauge 파일만 제거되고 counter 값은 유지"""
+        self.counter.labels(name='done').inc()
+        self.gauge.labels().inc(3)
+        self.assertIn('test_mmap_in_flight 3.0', self.registry.generate_latest())
+
+        metrics.mark_process_dead(os.getpid())
+
+        body = self.registry.generate_latest()
+        self.assertNotIn('test_mmap_in_flight 3.0', body)
+        self.assertIn('test_mmap_total_total{name="done"} 1.0', body)
@@ -0,0 +1,101 @@
+"""
+PostgreSQL 예약 시간 범위(tsrange) 컬럼과 GiST 인덱스
+
+settings.RESERVATION_TIME_RANGE_INDEX 가 켜져 있고 PostgreSQL 을 사용하는 경우
+reservations 테이블에 시험 날짜와 시작, 종료 시간으로 계산되는 생성 컬럼 time_window(tsrange, '[)')와
+GiST 인덱스를 추가한다. 시간대가 겹치는 예약 조회는 time_window && tsrange(...) 로 인덱스에서 찾는다.
+
+모델 필드로 선언하지 않으므로 ORM 의 INSERT, UPDATE 에는 포함되지 않고 데이터베이스가 값을 계산한다.
+SQLite 등 다른 데이터베이스나 마이그레이션 이후에 설정을 켜 컬럼이 아직 없는 경우는
+(exam_date, start_time, end_time) 비교 조건으로 조회한다.
+"""
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+# 마이그레이션에서도 사용하므로 모델을 import 하지 않고 테이블 이름을 직접 지정
+TABLE = 'reservations'
+COLUMN = 'time_window'
+INDEX = f'{TABLE}_{COLUMN}_gist'
+
+
+def is_enabled(connection):
+    return connection.vendor == 'postgresql' and getattr(settings, 'RESERVATION_TIME_RANGE_INDEX', False)
+
+
+def is_installed(connection):
+    """
+    time_window 컬럼이 실제로 있는지 여부
+
+    데이터베이스 연결마다 한 번만 조회하며, install / uninstall 하면 다시 조회한다.
+    """
+    if connection.vendor != 'postgresql':
+        return False
+
+    connection.ensure_connection()
+    cached = getattr(connection, '_time_range_installed', None)
+    if cached is not None and cached[0] is connection.connection:
+        return cached[1]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_attribute WHERE attrelid = to_regclass(%s) AND attname = %s AND NOT attisdropped',
+            [TABLE, COLUMN],
+        )
+        installed = cursor.fetchone() is not None
+
+    connection._time_range_installed = (connection.connection, installed)
+    return installed
+
+
+def _forget_installed(connection):
+    # django.db.connection(ConnectionProxy)으로 호출해도 실제 연결 객체의 속성이 지워지도록 delattr 사용
+    try:
+        del connection._time_range_installed
+    except AttributeError:
+        pass
+
+
+def is_active(connection):
+    """설정이 켜져 있고 time_window 컬럼이 있어 GiST 인덱스로 조회하는지 여부"""
+    return is_enabled(connection) and is_installed(connection)
+
+
+def install(connection):
+    """생성 컬럼과 GiST 인덱스 추가 (이미 있으면 그대로 사용)"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            ALTER TABLE "{TABLE}" ADD COLUMN IF NOT EXISTS {COLUMN} tsrange
+            GENERATED ALWAYS AS (tsrange(exam_date + start_time, exam_date + end_time, '[)')) STORED
+            """
+        )
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {INDEX} ON "{TABLE}" USING gist ({COLUMN})')
+    _forget_installed(connection)
+
+
+def uninstall(connection):
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX IF EXISTS {INDEX}')
+        cursor.execute(f'ALTER TABLE "{TABLE}" DROP COLUMN IF EXISTS {COLUMN}')
+    _forget_installed(connection)
+
+
+def overlap_filter(connection, exam_date, start_time, end_time):
+    """
+    시험 날짜의 start_time ~ end_time 과 시간대가 겹치는 예약 조건
+
+    Returns:
+        Reservation 쿼리셋의 filter 에 사용할 조건
+    """
+    if is_active(connection):
+        return RawSQL(
+            f"{TABLE}.{COLUMN} && tsrange(%s, %s, '[)')",
+            [datetime.combine(exam_date, start_time), datetime.combine(exam_date, end_time)],
+            output_field=BooleanField(),
+        )
+    return Q(exam_date=exam_date, start_time__lt=end_time, end_time__gt=start_time)
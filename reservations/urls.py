@@ -1,9 +1,21 @@
 from django.urls import path
 
-from reservations.views import ReservationListView, ReservationDetailView, AvailableTimeView
+from reservations.views import ReservationListView, ReservationDetailView, AvailableTimeView, ReservationQueueView, \
+    ReservationHoldListView, ReservationHoldDetailView, ReservationHeatmapView, \
+    DailyReservationRollupView, ReservationChangeFeedView, ReservationSyncView, ReservationBulkDeleteView, \
+    ReservationBatchView
 
 urlpatterns = [
     path('', ReservationListView.as_view(), name='reservations'),
     path('<int:reservation_id>/', ReservationDetailView.as_view(), name='reservation-detail'),
+    path('batch/', ReservationBatchView.as_view(), name='reservation-batch'),
+    path('bulk-delete/', ReservationBulkDeleteView.as_view(), name='reservation-bulk-delete'),
     path('available-times/', AvailableTimeView.as_view(), name='available-times'),
+    path('heatmap/', ReservationHeatmapView.as_view(), name='reservation-heatmap'),
+    path('changes/', ReservationSyncView.as_view(), name='reservation-changes'),
+    path('outbox/', ReservationChangeFeedView.as_view(), name='reservation-outbox'),
+    path('rollups/', DailyReservationRollupView.as_view(), name='reservation-rollups'),
+    path('holds/', ReservationHoldListView.as_view(), name='reservation-holds'),
+    path('holds/<int:hold_id>/', ReservationHoldDetailView.as_view(), name='reservation-hold-detail'),
+    path('queue/<str:token>/', ReservationQueueView.as_view(), name='reservation-queue'),
 ]
\ No newline at end of file
@@ -2,19 +2,51 @@ import logging
 
 from django.db import DatabaseError
 from rest_framework import status
+from rest_framework.exceptions import APIException
 from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from programmers_exam_reservation.utils.idempotency import idempotent
+from programmers_exam_reservation.utils.metrics import record_exception
 from programmers_exam_reservation.utils.paginations import CustomPagination
 from programmers_exam_reservation.utils.permissions import HasRolePermission
+from reservations.admission import AdmissionController, QUEUED, SHED, DONE
+from reservations.analytics import encode_heatmap
 from reservations.managers import ReservationManager
 from reservations.serializers import ReservationResponseSerializer, ReservationRequestSerializer, \
-    ReservationAvailableTimeResponseSerializer
+    ReservationAvailableTimeResponseSerializer, ReservationQueueResponseSerializer, ReservationHoldRequestSerializer, \
+    ReservationHoldResponseSerializer, DailyReservationRollupResponseSerializer, ReservationChangeResponseSerializer, \
+    ReservationSyncResponseSerializer, ReservationTombstoneResponseSerializer, ReservationBulkDeleteRequestSerializer, \
+    ReservationBulkDeleteResultSerializer, ReservationCapacityDeltaSerializer
+from reservations.sync import UPSERT
 
 logger = logging.getLogger('django')
 
 
+def admission_response(admission):
+    """
+    입장 제어 결과가 대기(202) 또는 거절(503)인 경우의 응답, 바로 처리 가능하면 None
+    """
+    if admission.status == QUEUED:
+        response_serializer = ReservationQueueResponseSerializer(admission)
+        return Response(
+            data=response_serializer.data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={
+                'Location': response_serializer.data.get('poll_url'),
+                'Retry-After': str(admission.retry_after),
+            }
+        )
+    if admission.status == SHED:
+        return Response(
+            {"detail": "예약 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={'Retry-After': str(admission.retry_after)}
+        )
+    return None
+
+
 class ReservationListView(GenericAPIView):
     serializer_class = ReservationResponseSerializer
     pagination_class = CustomPagination
@@ -31,50 +63,74 @@ class ReservationListView(GenericAPIView):
         예약 조회
         - 어드민: 모든 예약 조회 가능
         - 기업 사용자: 자신의 예약 조회 가능
+          exam_date_from, exam_date_to, status, attendees_min, attendees_max, company, search(어드민) 조건과
+          인덱스가 있는 정렬 기준(sort)으로 조회
+        - fields: 응답에 포함할 필드 목록 (쉼표로 구분, 요청한 필드만 조회)
         """
+        fields = self.serializer_class.parse_fields(request.query_params.get('fields'))
         manager = ReservationManager()
 
         try:
-            reservations_qs = manager.retrieve_reservations_by_user(request.user)
+            reservations_qs = manager.retrieve_reservations_by_user(request.user, request.query_params, fields)
             # 페이지네이션 적용
             paginated_reservations_qs = self.paginate_queryset(reservations_qs)
 
-            response_serializer = self.serializer_class(paginated_reservations_qs, many=True)
+            response_serializer = self.serializer_class(paginated_reservations_qs, many=True, fields=fields)
 
             return Response(
                 data=self.paginator.get_paginated_data(response_serializer.data),
                 status=status.HTTP_200_OK
             )
+        except APIException:
+            raise
         except DatabaseError as e:
+            record_exception(self, e)
             return Response(
                 {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         except Exception as e:
+            record_exception(self, e)
             logger.error(f"예약 목록 조회 실패: {str(e)}", exc_info=True)
             return Response(
                 {"detail": "서버 처리 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @idempotent
     def post(self, request):
         """
         예약 생성
         - 기업 사용자: 예약 생성
         """
         manager = ReservationManager()
+        admission_controller = AdmissionController()
 
         try:
             request_serializer = ReservationRequestSerializer(data=request.data)
             request_serializer.is_valid(raise_exception=True)
 
-            created_reservation = manager.create_reservation(
+            # 시험 날짜별 동시 처리 수를 넘으면 대기열 등록(202) 또는 거절(503)
+            admission = admission_controller.enter(
                 request.user,
                 request_serializer.validated_data.get('exam_date'),
-                request_serializer.validated_data.get('start_time'),
-                request_serializer.validated_data.get('end_time'),
-                request_serializer.validated_data.get('attendees'),
+                request_serializer.validated_data,
             )
+            response = admission_response(admission)
+            if response is not None:
+                return response
+
+            try:
+                created_reservation = manager.create_reservation(
+                    request.user,
+                    request_serializer.validated_data.get('exam_date'),
+                    request_serializer.validated_data.get('start_time'),
+                    request_serializer.validated_data.get('end_time'),
+                    request_serializer.validated_data.get('attendees'),
+                    request_serializer.validated_data.get('hold_id'),
+                )
+            finally:
+                admission_controller.release(admission)
 
             response_serializer = self.serializer_class(created_reservation)
 
@@ -82,12 +138,16 @@ class ReservationListView(GenericAPIView):
                 data=response_serializer.data,
                 status=status.HTTP_201_CREATED
             )
+        except APIException:
+            raise
         except DatabaseError as e:
+            record_exception(self, e)
             return Response(
                 {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         except Exception as e:
+            record_exception(self, e)
             logger.error(f"예약 생성 실패: {str(e)}", exc_info=True)
             return Response(
                 {"detail": "서버 처리 중 오류가 발생했습니다."},
@@ -108,32 +168,38 @@ class ReservationDetailView(GenericAPIView):
     def get(self, request, reservation_id):
         """
         예약 정보 조회
-        - 어드민 유저: 모든 예약 접근 가능
+        - 어드민 유저: 모든 예약 접근 가능 (보관된 예약 포함)
         - 기업 유저: 자신의 예약만 접근 가능
+        - fields: 응답에 포함할 필드 목록 (쉼표로 구분, 요청한 필드만 조회)
         """
+        fields = self.serializer_class.parse_fields(request.query_params.get('fields'))
         manager = ReservationManager()
 
         try:
-            reservation_qs = manager.retrieve_reservation_by_id(request.user, reservation_id)
+            reservation_qs = manager.retrieve_reservation_by_id(request.user, reservation_id, include_archived=True,
+                                                                fields=fields)
 
-            response_serializer = self.serializer_class(reservation_qs)
+            response_serializer = self.serializer_class(reservation_qs, fields=fields)
 
             return Response(
                 data=response_serializer.data,
                 status=status.HTTP_200_OK
             )
         except DatabaseError as e:
+            record_exception(self, e)
             return Response(
                 {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         except Exception as e:
+            record_exception(self, e)
             logger.error(f"예약 상세 조회 실패: {str(e)}", exc_info=True)
             return Response(
                 {"detail": "서버 처리 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @idempotent
     def patch(self, request, reservation_id):
         """
         예약 내용 수정
@@ -165,17 +231,20 @@ class ReservationDetailView(GenericAPIView):
                 status=status.HTTP_200_OK
             )
         except DatabaseError as e:
+            record_exception(self, e)
             return Response(
                 {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         except Exception as e:
+            record_exception(self, e)
             logger.error(f"예약 수정 실패: {str(e)}", exc_info=True)
             return Response(
                 {"detail": "서버 처리 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @idempotent
     def delete(self, request, reservation_id):
         """
         예약 삭제
@@ -193,11 +262,13 @@ class ReservationDetailView(GenericAPIView):
                 status=status.HTTP_204_NO_CONTENT
             )
         except DatabaseError as e:
+            record_exception(self, e)
             return Response(
                 {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         except Exception as e:
+            record_exception(self, e)
             logger.error(f"예약 삭제 실패: {str(e)}", exc_info=True)
             return Response(
                 {"detail": "서버 처리 중 오류가 발생했습니다."},
@@ -205,6 +276,193 @@ class ReservationDetailView(GenericAPIView):
             )
 
 
+class ReservationBatchView(GenericAPIView):
+    serializer_class = ReservationResponseSerializer
+
+    def get_permissions(self):
+        return [IsAuthenticated(), HasRolePermission(['COMPANY', 'ADMIN'])]
+
+    def get(self, request):
+        """
+        예약 일괄 조회
+        - 어드민: ids(쉼표로 구분한 예약 ID 목록)의 모든 예약 조회 (보관된 예약 포함)
+        - 기업 사용자: ids 중 자신의 예약만 조회
+          조회한 예약과 없는 예약 ID(not_found), 접근 권한이 없는 예약 ID(forbidden) 반환
+        - fields: 응답에 포함할 필드 목록 (쉼표로 구분, 요청한 필드만 조회)
+        """
+        fields = self.serializer_class.parse_fields(request.query_params.get('fields'))
+        manager = ReservationManager()
+
+        try:
+            reservations, not_found, forbidden = manager.retrieve_reservations_by_ids(
+                request.user,
+                request.query_params.get('ids'),
+                fields,
+            )
+
+            response_serializer = self.serializer_class(reservations, many=True, fields=fields)
+
+            return Response(
+                data={
+                    'results': response_serializer.data,
+                    'not_found': not_found,
+                    'forbidden': forbidden,
+                },
+                status=status.HTTP_200_OK
+            )
+        except APIException:
+            raise
+        except DatabaseError as e:
+            record_exception(self, e)
+            return Response(
+                {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            record_exception(self, e)
+            logger.error(f"예약 일괄 조회 실패: {str(e)}", exc_info=True)
+            return Response(
+                {"detail": "서버 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class ReservationBulkDeleteView(GenericAPIView):
+    serializer_class = ReservationBulkDeleteResultSerializer
+
+    def get_permissions(self):
+        return [IsAuthenticated(), HasRolePermission(['COMPANY', 'ADMIN'])]
+
+    @idempotent
+    def post(self, request):
+        """
+        예약 일괄 삭제
+        - 어드민: ids 또는 exam_date(, status) 에 해당하는 모든 예약 삭제
+        - 기업 사용자: ids 또는 exam_date(, status) 에 해당하는 확정 전의 자신의 예약 삭제
+          예약별 결과(deleted, not_found, forbidden, confirmed)와 확정 예약 삭제로 늘어난 시간대별 예약 가능 인원 반환
+          exam_date 로 삭제하는 경우 최대 수를 넘는 예약이 남아 있으면 has_more 가 true
+        """
+        request_serializer = ReservationBulkDeleteRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+
+        manager = ReservationManager()
+
+        try:
+            results, capacity_deltas, has_more = manager.bulk_delete_reservations(
+                request.user,
+                ids=request_serializer.validated_data.get('ids'),
+                exam_date=request_serializer.validated_data.get('exam_date'),
+                status=request_serializer.validated_data.get('status'),
+            )
+
+            return Response(
+                data={
+                    'results': self.serializer_class(results, many=True).data,
+                    'deleted_count': sum(1 for result in results if result['outcome'] == 'deleted'),
+                    'capacity_deltas': ReservationCapacityDeltaSerializer(capacity_deltas, many=True).data,
+                    'has_more': has_more,
+                },
+                status=status.HTTP_200_OK
+            )
+        except APIException:
+            raise
+        except DatabaseError as e:
+            record_exception(self, e)
+            return Response(
+                {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            record_exception(self, e)
+            logger.error(f"예약 일괄 삭제 실패: {str(e)}", exc_info=True)
+            return Response(
+                {"detail": "서버 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class ReservationHoldListView(GenericAPIView):
+    serializer_class = ReservationHoldResponseSerializer
+
+    def get_permissions(self):
+        return [IsAuthenticated(), HasRolePermission(['COMPANY'])]
+
+    def post(self, request):
+        """
+        예약 인원 확보
+        - 기업 사용자: 예약 신청 전 일정 시간 동안 응시 인원 확보, 예약 생성 시 hold_id 로 전환
+        """
+        manager = ReservationManager()
+
+        request_serializer = ReservationHoldRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+
+        try:
+            hold = manager.create_hold(
+                request.user,
+                request_serializer.validated_data.get('exam_date'),
+                request_serializer.validated_data.get('start_time'),
+                request_serializer.validated_data.get('end_time'),
+                request_serializer.validated_data.get('attendees'),
+            )
+
+            response_serializer = self.serializer_class(hold)
+
+            return Response(
+                data=response_serializer.data,
+                status=status.HTTP_201_CREATED
+            )
+        except APIException:
+            raise
+        except DatabaseError as e:
+            record_exception(self, e)
+            return Response(
+                {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            record_exception(self, e)
+            logger.error(f"예약 인원 확보 실패: {str(e)}", exc_info=True)
+            return Response(
+                {"detail": "서버 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class ReservationHoldDetailView(GenericAPIView):
+    def get_permissions(self):
+        return [IsAuthenticated(), HasRolePermission(['COMPANY'])]
+
+    def delete(self, request, hold_id):
+        """
+        확보한 예약 인원 반환
+        - 기업 사용자: 자신이 확보한 인원 반환
+        """
+        manager = ReservationManager()
+
+        try:
+            manager.release_hold(request.user, hold_id)
+
+            return Response(
+                status=status.HTTP_204_NO_CONTENT
+            )
+        except APIException:
+            raise
+        except DatabaseError as e:
+            record_exception(self, e)
+            return Response(
+                {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            record_exception(self, e)
+            logger.error(f"예약 인원 확보 반환 실패: {str(e)}", exc_info=True)
+            return Response(
+                {"detail": "서버 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class AvailableTimeView(GenericAPIView):
     serializer_class = ReservationAvailableTimeResponseSerializer
 
@@ -228,13 +486,275 @@ class AvailableTimeView(GenericAPIView):
                 status=status.HTTP_200_OK
             )
         except DatabaseError as e:
+            record_exception(self, e)
             return Response(
                 {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         except Exception as e:
+            record_exception(self, e)
             logger.error(f"예약 가능 시간대 조회 실패: {str(e)}", exc_info=True)
             return Response(
                 {"detail": "서버 처리 중 오류가 발생했습니다."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class ReservationQueueView(GenericAPIView):
+    serializer_class = ReservationResponseSerializer
+
+    def get_permissions(self):
+        return [IsAuthenticated(), HasRolePermission(['COMPANY'])]
+
+    def get(self, request, token):
+        """
+        예약 생성 대기열 조회
+        - 기업 사용자: 대기 순번 확인 (예약을 생성하지 않음), 이미 처리된 요청이면 생성된 예약 반환
+        """
+        manager = ReservationManager()
+        admission = AdmissionController().poll(request.user, token)
+        if admission.status == DONE:
+            return self.done_response(manager, request.user, admission)
+        return admission_response(admission)
+
+    def post(self, request, token):
+        """
+        예약 생성 대기열 처리
+        - 기업 사용자: 차례가 되면 대기 등록한 예약을 생성, 아직 차례가 아니면 대기 순번 반환
+          같은 토큰으로 다시 요청하면 새로 생성하지 않고 생성된 예약 반환
+        """
+        manager = ReservationManager()
+        admission_controller = AdmissionController()
+
+        admission = admission_controller.poll(request.user, token, claim=True)
+        if admission.status == DONE:
+            return self.done_response(manager, request.user, admission)
+        response = admission_response(admission)
+        if response is not None:
+            return response
+
+        try:
+            created_reservation = manager.create_reservation(
+                request.user,
+                admission.data.get('exam_date'),
+                admission.data.get('start_time'),
+                admission.data.get('end_time'),
+                admission.data.get('attendees'),
+                admission.data.get('hold_id'),
+            )
+            admission_controller.complete(admission, request.user, created_reservation.id)
+
+            response_serializer = self.serializer_class(created_reservation)
+
+            return Response(
+                data=response_serializer.data,
+                status=status.HTTP_201_CREATED
+            )
+        except APIException:
+            raise
+        except DatabaseError as e:
+            record_exception(self, e)
+            return Response(
+                {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            record_exception(self, e)
+            logger.error(f"대기 예약 생성 실패: {str(e)}", exc_info=True)
+            return Response(
+                {"detail": "서버 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        finally:
+            admission_controller.release(admission)
+
+    def done_response(self, manager, user, admission):
+        """이미 처리된 대기 요청으로 생성한 예약"""
+        reservation = manager.retrieve_reservation_by_id(user, admission.reservation_id)
+        response_serializer = self.serializer_class(reservation)
+        return Response(
+            data=response_serializer.data,
+            status=status.HTTP_200_OK
+        )
+
+
+class ReservationHeatmapView(GenericAPIView):
+    def get_permissions(self):
+        return [IsAuthenticated(), HasRolePermission(['ADMIN'])]
+
+    def get(self, request):
+        """
+        날짜 × 시간대별 예약 인원 현황
+        - 어드민: start, end (YYYY-MM-DD, 기본값 오늘부터 90일) 기간의 확정, 대기 인원 조회
+          encoding=compact 인 경우 날짜 × 시간대 순서로 펼친 정수 배열로 반환
+        """
+        manager = ReservationManager()
+
+        try:
+            heatmap = manager.retrieve_utilization_heatmap(
+                request.query_params.get('start'),
+                request.query_params.get('end'),
+            )
+
+            return Response(
+                data=encode_heatmap(heatmap, compact=request.query_params.get('encoding') == 'compact'),
+                status=status.HTTP_200_OK
+            )
+        except APIException:
+            raise
+        except DatabaseError as e:
+            record_exception(self, e)
+            return Response(
+                {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            record_exception(self, e)
+            logger.error(f"예약 인원 현황 조회 실패: {str(e)}", exc_info=True)
+            return Response(
+                {"detail": "서버 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class DailyReservationRollupView(GenericAPIView):
+    serializer_class = DailyReservationRollupResponseSerializer
+
+    def get_permissions(self):
+        return [IsAuthenticated(), HasRolePermission(['ADMIN'])]
+
+    def get(self, request):
+        """
+        시험 날짜별 예약 집계
+        - 어드민: start, end (YYYY-MM-DD, 기본값 오늘부터 90일) 기간의 날짜별 예약 수, 인원, 최대 시간대 인원, 기업별 예약 수
+        """
+        manager = ReservationManager()
+
+        try:
+            daily_rollups = manager.retrieve_daily_rollups(
+                request.query_params.get('start'),
+                request.query_params.get('end'),
+            )
+
+            response_serializer = self.serializer_class(daily_rollups, many=True)
+
+            return Response(
+                data=response_serializer.data,
+                status=status.HTTP_200_OK
+            )
+        except APIException:
+            raise
+        except DatabaseError as e:
+            record_exception(self, e)
+            return Response(
+                {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            record_exception(self, e)
+            logger.error(f"날짜별 예약 집계 조회 실패: {str(e)}", exc_info=True)
+            return Response(
+                {"detail": "서버 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class ReservationChangeFeedView(GenericAPIView):
+    serializer_class = ReservationChangeResponseSerializer
+
+    def get_permissions(self):
+        return [IsAuthenticated(), HasRolePermission(['ADMIN'])]
+
+    def get(self, request):
+        """
+        예약 변경 기록 조회
+        - 어드민: after(마지막으로 읽은 seq) 이후의 변경 기록을 seq 순으로 최대 limit 개 조회
+          응답의 next_after 를 다음 조회의 after 로 사용
+        """
+        manager = ReservationManager()
+
+        try:
+            changes, next_after, has_more = manager.retrieve_changes(
+                request.query_params.get('after'),
+                request.query_params.get('limit'),
+            )
+
+            response_serializer = self.serializer_class(changes, many=True)
+
+            return Response(
+                data={
+                    'changes': response_serializer.data,
+                    'next_after': next_after,
+                    'has_more': has_more,
+                },
+                status=status.HTTP_200_OK
+            )
+        except APIException:
+            raise
+        except DatabaseError as e:
+            record_exception(self, e)
+            return Response(
+                {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            record_exception(self, e)
+            logger.error(f"예약 변경 기록 조회 실패: {str(e)}", exc_info=True)
+            return Response(
+                {"detail": "서버 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class ReservationSyncView(GenericAPIView):
+    serializer_class = ReservationSyncResponseSerializer
+
+    def get_permissions(self):
+        return [IsAuthenticated(), HasRolePermission(['COMPANY'])]
+
+    def get(self, request):
+        """
+        예약 변경분 동기화
+        - 기업 고객: since(이전 응답의 next_cursor) 이후에 수정, 삭제된 본인 예약을 최대 limit 개 조회
+          since 없이 조회하면 모든 예약을 처음부터 조회하며, has_more 가 false 가 될 때까지 next_cursor 로 이어서 조회
+          삭제 기록 보관 기간이 지난 cursor 는 410 응답 (since 없이 다시 동기화)
+        """
+        manager = ReservationManager()
+
+        try:
+            changes, next_cursor, has_more = manager.retrieve_sync_changes(
+                request.user,
+                request.query_params.get('since'),
+                request.query_params.get('limit'),
+            )
+
+            data = []
+            for kind, instance in changes:
+                if kind == UPSERT:
+                    data.append({'type': 'upsert', 'reservation': self.serializer_class(instance).data})
+                else:
+                    data.append({'type': 'delete', **ReservationTombstoneResponseSerializer(instance).data})
+
+            return Response(
+                data={
+                    'changes': data,
+                    'next_cursor': next_cursor,
+                    'has_more': has_more,
+                },
+                status=status.HTTP_200_OK
+            )
+        except APIException:
+            raise
+        except DatabaseError as e:
+            record_exception(self, e)
+            return Response(
+                {"detail": "데이터베이스 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            record_exception(self, e)
+            logger.error(f"예약 변경분 동기화 실패: {str(e)}", exc_info=True)
+            return Response(
+                {"detail": "서버 처리 중 오류가 발생했습니다."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,95 @@
+"""
+기업 이름, 이메일 부분 문자열 검색 인덱스
+
+- PostgreSQL: pg_trgm GIN 인덱스 (icontains 가 사용하는 UPPER(컬럼::text) 식에 생성)
+- SQLite: FTS5 trigram 토크나이저를 사용하는 users_search 테이블 (users 테이블의 트리거로 동기화)
+
+트리거로 동기화하므로 save 뿐 아니라 bulk_create, update 등으로 변경된 사용자도 검색 인덱스에 반영된다.
+trigram 은 3글자 이상이어야 인덱스를 사용할 수 있으므로 더 짧은 검색어는 LIKE 로 조회한다.
+"""
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+# 마이그레이션에서도 사용하므로 모델을 import 하지 않고 테이블 이름을 직접 지정
+TABLE = 'users'
+SEARCH_TABLE = f'{TABLE}_search'
+SEARCH_FIELDS = ('name', 'email')
+
+MIN_TRIGRAM_LENGTH = 3
+
+POSTGRESQL_INSTALL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    *[
+        f'CREATE INDEX IF NOT EXISTS {TABLE}_{field}_trgm_idx ON {TABLE} USING gin ((UPPER({field}::text)) gin_trgm_ops)'
+        for field in SEARCH_FIELDS
+    ],
+]
+
+POSTGRESQL_UNINSTALL = [f'DROP INDEX IF EXISTS {TABLE}_{field}_trgm_idx' for field in SEARCH_FIELDS]
+
+SQLITE_INSTALL = [
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+    f"name, email, content='{TABLE}', content_rowid='id', tokenize='trigram')",
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_ai AFTER INSERT ON {TABLE} BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, name, email) VALUES (new.id, new.name, new.email);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_ad AFTER DELETE ON {TABLE} BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, email) VALUES ('delete', old.id, old.name, old.email);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_au AFTER UPDATE OF name, email ON {TABLE} BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, email) VALUES ('delete', old.id, old.name, old.email);
+        INSERT INTO {SEARCH_TABLE}(rowid, name, email) VALUES (new.id, new.name, new.email);
+    END
+    """,
+    # 기존 사용자 색인
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_UNINSTALL = [
+    f'DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ai',
+    f'DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ad',
+    f'DROP TRIGGER IF EXISTS {SEARCH_TABLE}_au',
+    f'DROP TABLE IF EXISTS {SEARCH_TABLE}',
+]
+
+
+def _statements(connection, install):
+    if connection.vendor == 'postgresql':
+        return POSTGRESQL_INSTALL if install else POSTGRESQL_UNINSTALL
+    if connection.vendor == 'sqlite':
+        return SQLITE_INSTALL if install else SQLITE_UNINSTALL
+    return []
+
+
+def install(connection):
+    """데이터베이스별 검색 인덱스 생성 (지원하지 않는 데이터베이스는 LIKE 로 검색)"""
+    with connection.cursor() as cursor:
+        for statement in _statements(connection, install=True):
+            cursor.execute(statement)
+
+
+def uninstall(connection):
+    with connection.cursor() as cursor:
+        for statement in _statements(connection, install=False):
+            cursor.execute(statement)
+
+
+def search_filter(term, connection):
+    """
+    이름 또는 이메일에 term 이 포함된 사용자 조건
+
+    Returns:
+        User 쿼리셋에 사용할 Q
+    """
+    if connection.vendor == 'sqlite' and len(term) >= MIN_TRIGRAM_LENGTH:
+        # 검색어를 FTS5 구문으로 해석하지 않도록 하나의 문자열로 감쌈
+        phrase = '"' + term.replace('"', '""') + '"'
+        return Q(id__in=RawSQL(f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s', [phrase]))
+
+    # PostgreSQL 은 icontains(UPPER(컬럼::text) LIKE UPPER(%s)) 가 trigram 인덱스를 사용
+    return Q(name__icontains=term) | Q(email__icontains=term)